@@ -0,0 +1,58 @@
+"""Add near-duplicate detection columns to jobs.
+
+Revision ID: 012
+Revises: 011_background_tasks
+Create Date: 2025-01-14
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "012_near_duplicates"
+down_revision: str | None = "011_background_tasks"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add minhash_signature and duplicate_of_id, plus indexes for syncing the index.
+
+    Existing jobs get their signatures backfilled by the application.
+    """
+    op.add_column("jobs", sa.Column("minhash_signature", sa.LargeBinary(), nullable=True))
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "duplicate_of_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("jobs.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.create_index("idx_jobs_updated_at", "jobs", ["updated_at"])
+    op.create_index(
+        "idx_jobs_minhash_missing",
+        "jobs",
+        ["id"],
+        postgresql_where=sa.text("minhash_signature IS NULL AND deleted_at IS NULL"),
+    )
+    op.create_index(
+        "idx_jobs_duplicate_of_id",
+        "jobs",
+        ["duplicate_of_id"],
+        postgresql_where=sa.text("duplicate_of_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the near-duplicate columns and indexes."""
+    op.drop_index("idx_jobs_duplicate_of_id", table_name="jobs")
+    op.drop_index("idx_jobs_minhash_missing", table_name="jobs")
+    op.drop_index("idx_jobs_updated_at", table_name="jobs")
+    op.drop_column("jobs", "duplicate_of_id")
+    op.drop_column("jobs", "minhash_signature")
@@ -0,0 +1,70 @@
+"""Add trigram indexes for job title and company search.
+
+Revision ID: 013
+Revises: 012_near_duplicates
+Create Date: 2025-01-15
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_job_search_indexes"
+down_revision: str | None = "012_near_duplicates"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and index title and company for ILIKE '%term%'.
+
+    Full-text search uses idx_jobs_fts from 001; it is recreated here only
+    if missing, with the same expression list_jobs queries.
+
+    pg_trgm ships with PostgreSQL's contrib modules; a server built without
+    them fails here with instructions rather than on the first index.
+    """
+    available = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if available is None:
+        raise RuntimeError(
+            "Migration 013 needs the pg_trgm extension, which this PostgreSQL server does not provide. "
+            "Install the server's contrib modules (e.g. the postgresql-contrib package) and rerun the upgrade."
+        )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_jobs_title_trgm ON jobs
+        USING gin (title gin_trgm_ops)
+        WHERE deleted_at IS NULL;
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_jobs_company_trgm ON jobs
+        USING gin (company gin_trgm_ops)
+        WHERE deleted_at IS NULL;
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_jobs_fts ON jobs
+        USING gin(
+            to_tsvector(
+                'english',
+                COALESCE(description_raw, '') || ' ' || COALESCE(title, '') || ' ' || COALESCE(company, '')
+            )
+        )
+        WHERE deleted_at IS NULL;
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the extension and idx_jobs_fts stay)."""
+    op.execute("DROP INDEX IF EXISTS idx_jobs_company_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_jobs_title_trgm")
@@ -0,0 +1,47 @@
+"""Add keyset pagination indexes for listing jobs.
+
+Revision ID: 014
+Revises: 013_job_search_indexes
+Create Date: 2025-01-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "014_keyset_pagination"
+down_revision: str | None = "013_job_search_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+LIVE = sa.text("deleted_at IS NULL")
+
+# Sort key columns, each followed by the created_at, id tie-breakers
+KEYSET_INDEXES = {
+    "idx_jobs_keyset_updated_at": ["updated_at", "created_at", "id"],
+    "idx_jobs_keyset_created_at": ["created_at", "id"],
+    "idx_jobs_keyset_priority": ["priority", "created_at", "id"],
+    "idx_jobs_keyset_title": ["title", "created_at", "id"],
+    "idx_jobs_keyset_company": ["company", "created_at", "id"],
+    "idx_jobs_keyset_salary_asc": [sa.text("COALESCE(salary_max, salary_min)"), "created_at", "id"],
+    "idx_jobs_keyset_salary_desc": [
+        sa.text("COALESCE(salary_max, salary_min) DESC NULLS LAST"),
+        sa.text("created_at DESC"),
+        sa.text("id DESC"),
+    ],
+}
+
+
+def upgrade() -> None:
+    """Create a partial index over live jobs for each list_jobs sort."""
+    for name, columns in KEYSET_INDEXES.items():
+        op.create_index(name, "jobs", columns, postgresql_where=LIVE)
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    for name in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name="jobs")
@@ -0,0 +1,115 @@
+"""Move jobs.source_html into a compressed job_sources table.
+
+Revision ID: 015
+Revises: 014_keyset_pagination
+Create Date: 2025-01-17
+
+"""
+
+import hashlib
+import zlib
+from collections.abc import Sequence
+from uuid import UUID
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "015_job_sources"
+down_revision: str | None = "014_keyset_pagination"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BATCH_SIZE = 200
+
+
+# Copies of src.models.job_source's helpers as of this revision, so later
+# changes to the app don't change what this migration writes
+def _compress_html(html: str) -> tuple[bytes, str, int]:
+    data = html.encode("utf-8")
+    return zlib.compress(data), hashlib.sha256(data).hexdigest(), len(data)
+
+
+def _decompress_html(html_zlib: bytes) -> str:
+    return zlib.decompress(html_zlib).decode("utf-8")
+
+
+def upgrade() -> None:
+    """Create job_sources, copy every source_html into it compressed, drop the column.
+
+    The space the column held in jobs is reused by later writes; run
+    VACUUM FULL jobs to return it to the operating system.
+    """
+    op.create_table(
+        "job_sources",
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("jobs.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("original_size", sa.Integer(), nullable=False),
+        sa.Column("html_zlib", sa.LargeBinary(), nullable=False),
+    )
+    # Already compressed: store out of line without TOAST compression
+    op.execute("ALTER TABLE job_sources ALTER COLUMN html_zlib SET STORAGE EXTERNAL")
+
+    connection = op.get_bind()
+    last_id = UUID(int=0)
+    while True:
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, source_html FROM jobs "
+                "WHERE source_html IS NOT NULL AND id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        params = []
+        for job_id, html in rows:
+            html_zlib, content_hash, original_size = _compress_html(html)
+            params.append({
+                "job_id": job_id,
+                "content_hash": content_hash,
+                "original_size": original_size,
+                "html_zlib": html_zlib,
+            })
+        connection.execute(
+            sa.text(
+                "INSERT INTO job_sources (job_id, content_hash, original_size, html_zlib) "
+                "VALUES (:job_id, :content_hash, :original_size, :html_zlib)"
+            ).bindparams(sa.bindparam("html_zlib", type_=sa.LargeBinary())),
+            params,
+        )
+        last_id = rows[-1][0]
+
+    op.drop_column("jobs", "source_html")
+
+
+def downgrade() -> None:
+    """Restore jobs.source_html from job_sources and drop the table."""
+    op.add_column("jobs", sa.Column("source_html", sa.Text(), nullable=True))
+
+    connection = op.get_bind()
+    last_id = UUID(int=0)
+    while True:
+        rows = connection.execute(
+            sa.text(
+                "SELECT job_id, html_zlib FROM job_sources "
+                "WHERE job_id > :last_id ORDER BY job_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            sa.text("UPDATE jobs SET source_html = :html WHERE id = :job_id"),
+            [{"job_id": job_id, "html": _decompress_html(html_zlib)} for job_id, html_zlib in rows],
+        )
+        last_id = rows[-1][0]
+
+    op.drop_table("job_sources")
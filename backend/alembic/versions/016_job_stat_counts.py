@@ -0,0 +1,128 @@
+"""Add trigger-maintained job_stat_counts summary table for dashboard counters.
+
+Revision ID: 016
+Revises: 015_job_sources
+Create Date: 2025-01-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "016_job_stat_counts"
+down_revision: str | None = "015_job_sources"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create job_stat_counts, the triggers keeping it current, and fill it.
+
+    Counts live jobs per (status, job board, easy apply, description state).
+    The description thresholds mirror MIN_DESCRIPTION_LENGTH and
+    TARGET_DESCRIPTION_LENGTH in services/description_fetcher.py.
+    """
+    op.create_table(
+        "job_stat_counts",
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("job_board", sa.String(50), nullable=False),
+        sa.Column("is_easy_apply", sa.Boolean(), nullable=False),
+        sa.Column("description_state", sa.String(20), nullable=False),
+        sa.Column("job_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("status", "job_board", "is_easy_apply", "description_state"),
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION job_description_state(description TEXT)
+        RETURNS TEXT AS $$
+            SELECT CASE
+                WHEN description IS NULL OR description = '' THEN 'missing'
+                WHEN length(description) < 500 THEN 'incomplete'
+                WHEN length(description) < 2000 THEN 'partial'
+                ELSE 'complete'
+            END
+        $$ LANGUAGE sql IMMUTABLE;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION update_job_stat_counts()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE'
+                AND OLD.deleted_at IS NOT DISTINCT FROM NEW.deleted_at
+                AND OLD.status = NEW.status
+                AND OLD.job_board IS NOT DISTINCT FROM NEW.job_board
+                AND OLD.is_easy_apply = NEW.is_easy_apply
+                AND job_description_state(OLD.description_raw) = job_description_state(NEW.description_raw)
+            THEN
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.deleted_at IS NULL THEN
+                UPDATE job_stat_counts
+                SET job_count = job_count - 1
+                WHERE status = OLD.status::text
+                    AND job_board = COALESCE(OLD.job_board, '')
+                    AND is_easy_apply = OLD.is_easy_apply
+                    AND description_state = job_description_state(OLD.description_raw);
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.deleted_at IS NULL THEN
+                INSERT INTO job_stat_counts (status, job_board, is_easy_apply, description_state, job_count)
+                VALUES (
+                    NEW.status::text,
+                    COALESCE(NEW.job_board, ''),
+                    NEW.is_easy_apply,
+                    job_description_state(NEW.description_raw),
+                    1
+                )
+                ON CONFLICT (status, job_board, is_easy_apply, description_state)
+                DO UPDATE SET job_count = job_stat_counts.job_count + 1;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    # Updates only fire when a counted column changes
+    op.execute(
+        """
+        CREATE TRIGGER update_job_stat_counts_insert_delete
+            AFTER INSERT OR DELETE ON jobs
+            FOR EACH ROW EXECUTE FUNCTION update_job_stat_counts();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER update_job_stat_counts_update
+            AFTER UPDATE OF status, job_board, is_easy_apply, description_raw, deleted_at ON jobs
+            FOR EACH ROW EXECUTE FUNCTION update_job_stat_counts();
+        """
+    )
+
+    # Triggers exist and hold a lock on jobs, so no write is missed or double-counted
+    op.execute(
+        """
+        INSERT INTO job_stat_counts (status, job_board, is_easy_apply, description_state, job_count)
+        SELECT status::text, COALESCE(job_board, ''), is_easy_apply,
+               job_description_state(description_raw), count(*)
+        FROM jobs
+        WHERE deleted_at IS NULL
+        GROUP BY 1, 2, 3, 4;
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the triggers, functions and job_stat_counts."""
+    op.execute("DROP TRIGGER IF EXISTS update_job_stat_counts_update ON jobs")
+    op.execute("DROP TRIGGER IF EXISTS update_job_stat_counts_insert_delete ON jobs")
+    op.execute("DROP FUNCTION IF EXISTS update_job_stat_counts()")
+    op.execute("DROP FUNCTION IF EXISTS job_description_state(TEXT)")
+    op.drop_table("job_stat_counts")
@@ -0,0 +1,55 @@
+"""Add generated jobs.description_length with completeness indexes.
+
+Revision ID: 017
+Revises: 016_job_stat_counts
+Create Date: 2025-01-19
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "017_description_length"
+down_revision: str | None = "016_job_stat_counts"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add description_length, computed by Postgres on every write.
+
+    Adding a stored generated column rewrites jobs once, filling it for
+    existing rows. The partial index's 500 is MIN_DESCRIPTION_LENGTH in
+    services/description_fetcher.py.
+    """
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "description_length",
+            sa.Integer(),
+            sa.Computed("length(description_raw)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_jobs_description_length",
+        "jobs",
+        ["description_length"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "idx_jobs_description_incomplete",
+        "jobs",
+        ["created_at"],
+        postgresql_where=sa.text("deleted_at IS NULL AND description_length < 500"),
+    )
+
+
+def downgrade() -> None:
+    """Drop description_length and its indexes."""
+    op.drop_index("idx_jobs_description_incomplete", table_name="jobs")
+    op.drop_index("idx_jobs_description_length", table_name="jobs")
+    op.drop_column("jobs", "description_length")
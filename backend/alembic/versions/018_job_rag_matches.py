@@ -0,0 +1,44 @@
+"""Add job_rag_matches, the per-job store of RAG requirement matches.
+
+Revision ID: 018
+Revises: 017_description_length
+Create Date: 2025-01-20
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "018_job_rag_matches"
+down_revision: str | None = "017_description_length"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create job_rag_matches."""
+    op.create_table(
+        "job_rag_matches",
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("jobs.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("description_hash", sa.String(64), nullable=False),
+        sa.Column("corpus_version", sa.String(100), nullable=False),
+        sa.Column("requirements", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("threshold", sa.Float(), nullable=False),
+        sa.Column("limit_per_req", sa.Integer(), nullable=False),
+        sa.Column("matches", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+    )
+
+
+def downgrade() -> None:
+    """Drop job_rag_matches."""
+    op.drop_table("job_rag_matches")
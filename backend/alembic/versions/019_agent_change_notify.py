@@ -0,0 +1,45 @@
+"""Notify listeners when agents change, so API-key caches can be dropped.
+
+Revision ID: 019
+Revises: 018_job_rag_matches
+Create Date: 2025-01-21
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "019_agent_change_notify"
+down_revision: str | None = "018_job_rag_matches"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Send NOTIFY agents_changed after every statement that writes agents."""
+    # Notifications are delivered on commit, and not at all on rollback
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_agents_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('agents_changed', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER agents_changed
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON agents
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_agents_changed()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the agents change trigger."""
+    op.execute("DROP TRIGGER IF EXISTS agents_changed ON agents")
+    op.execute("DROP FUNCTION IF EXISTS notify_agents_changed()")
@@ -0,0 +1,62 @@
+"""Keep signature backfills from touching jobs.updated_at.
+
+Revision ID: 020
+Revises: 019_agent_change_notify
+Create Date: 2025-01-22
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "020_minhash_signed_at"
+down_revision: str | None = "019_agent_change_notify"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Skip the updated_at trigger for signature backfills; stamp them separately.
+
+    The duplicate index fills in missing minhash signatures of older jobs.
+    That is derived data, so it must not bump updated_at (the default sort
+    key, the keyset cursors' position and the count cache's watermark).
+    The trigger now skips updates that fill a NULL signature, and the
+    backfill records minhash_signed_at so other processes' indexes still
+    pick the signatures up.
+    """
+    op.add_column("jobs", sa.Column("minhash_signed_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        "idx_jobs_minhash_signed_at",
+        "jobs",
+        ["minhash_signed_at"],
+        postgresql_where=sa.text("minhash_signed_at IS NOT NULL"),
+    )
+    op.execute("DROP TRIGGER update_jobs_updated_at ON jobs")
+    op.execute(
+        """
+        CREATE TRIGGER update_jobs_updated_at
+            BEFORE UPDATE ON jobs
+            FOR EACH ROW
+            WHEN (NOT (OLD.minhash_signature IS NULL AND NEW.minhash_signature IS NOT NULL))
+            EXECUTE FUNCTION update_updated_at_column();
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore the unconditional updated_at trigger."""
+    op.execute("DROP TRIGGER update_jobs_updated_at ON jobs")
+    op.execute(
+        """
+        CREATE TRIGGER update_jobs_updated_at
+            BEFORE UPDATE ON jobs
+            FOR EACH ROW
+            EXECUTE FUNCTION update_updated_at_column();
+        """
+    )
+    op.drop_index("idx_jobs_minhash_signed_at", table_name="jobs")
+    op.drop_column("jobs", "minhash_signed_at")
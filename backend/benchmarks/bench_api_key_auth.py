@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark agent API-key authentication with and without the key cache.
+
+Creates a throwaway agent in the configured database, then times
+verify_api_key the way a request runs it (a fresh session per call) for
+the agent's key and for an unknown key, sequentially and with
+``--concurrency`` requests in flight, with api_key_cache_enabled off and
+on. The agent is deleted afterwards.
+
+Usage:
+    python benchmarks/bench_api_key_auth.py [--requests 2000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import secrets
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import HTTPException
+from sqlalchemy import delete
+
+from src.api.deps import verify_api_key
+from src.config import AsyncSessionLocal, engine, settings
+from src.models import Agent
+from src.services.api_key_cache import api_key_cache
+
+
+async def authenticate(api_key: str) -> float:
+    began = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        try:
+            await verify_api_key(db, api_key)
+        except HTTPException:
+            pass
+    return time.perf_counter() - began
+
+
+async def measure(api_key: str, requests: int, concurrency: int) -> tuple[list[float], float]:
+    """Per-request latencies and overall requests/second."""
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            latencies.append(await authenticate(api_key))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies, requests / (time.perf_counter() - started)
+
+
+def summarize(label: str, latencies: list[float], throughput: float) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"  {label:<28} p50 {statistics.median(ordered) * 1e6:8.0f} us  "
+        f"p99 {p99 * 1e6:8.0f} us  {throughput:9.0f} req/s"
+    )
+
+
+async def run(requests: int, concurrency: int) -> None:
+    agent_key = f"agent_bench_{secrets.token_urlsafe(16)}"
+    unknown_key = f"agent_bench_{secrets.token_urlsafe(16)}"
+    async with AsyncSessionLocal() as db:
+        db.add(Agent(name=f"bench-{secrets.token_hex(4)}", api_key=agent_key, permissions=["jobs:read"]))
+        await db.commit()
+
+    print("=" * 78)
+    print(f"API KEY AUTH: {requests} requests per run, pool size {engine.pool.size()}")
+    print("=" * 78)
+    try:
+        for enabled in (False, True):
+            settings.api_key_cache_enabled = enabled
+            api_key_cache.invalidate()
+            print(f"api_key_cache_enabled={enabled}")
+            for label, key in (("agent key", agent_key), ("unknown key", unknown_key)):
+                for parallel in (1, concurrency):
+                    latencies, throughput = await measure(key, requests, parallel)
+                    summarize(f"{label}, {parallel} in flight", latencies, throughput)
+        print(f"cache: {api_key_cache.stats()}")
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(Agent).where(Agent.api_key == agent_key))
+            await db.commit()
+        await engine.dispose()
+
+
+def main(requests: int, concurrency: int) -> None:
+    asyncio.run(run(requests, concurrency))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    main(args.requests, args.concurrency)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark read latency under ingest load, inline vs the CPU process pool.
+
+Runs an ingest load - concurrent parse + rule-based analysis of large job
+pages, the CPU-bound part of ``/jobs/ingest`` and ``/jobs/bulk`` - on the
+event loop while a reader issues small "read requests" (a few microseconds
+of work each, like serving ``GET /jobs/{id}`` from an already-open
+connection) at a fixed rate. Each ingest first waits 50 ms for a simulated
+page download. A read's latency runs from when it was due to when it
+finished, so time spent waiting for the event loop is included.
+
+- inline: CPU work runs on the event loop (cpu_pool_workers = 0)
+- pool: CPU work is sent to a process pool (cpu_pool_workers = N)
+
+Ingest throughput only improves with the pool when the machine has spare
+cores; read latency improves either way, since the event loop no longer
+runs the parses.
+
+Usage:
+    python benchmarks/bench_cpu_pool.py [--pages 40] [--concurrency 8] [--workers 4] [--body-kb 250]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_parser_backend import build_page
+from src.services.cpu_executor import CPUExecutor
+from src.services.job_analysis_service import analyze_job
+from src.services.job_scraper import parse_job_html
+
+URL = "https://boards.greenhouse.io/acme/jobs/123"
+READ_INTERVAL_S = 0.005
+FETCH_S = 0.05
+
+
+async def ingest_load(executor: CPUExecutor, page: str, pages: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def ingest_one() -> None:
+        async with semaphore:
+            await asyncio.sleep(FETCH_S)  # the page download
+            scraped = await executor.run(parse_job_html, URL, page)
+            await executor.run(
+                analyze_job,
+                description=scraped.description or "",
+                title=scraped.title,
+                company=scraped.company,
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(ingest_one() for _ in range(pages)))
+    return time.perf_counter() - started
+
+
+async def reader(stop: asyncio.Event, latencies: list[float]) -> None:
+    due = time.perf_counter()
+    while not stop.is_set():
+        due += READ_INTERVAL_S
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        sum(range(100))  # the read itself
+        latencies.append((time.perf_counter() - due) * 1000)
+        due = max(due, time.perf_counter())
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(label: str, executor: CPUExecutor, page: str, pages: int, concurrency: int) -> float:
+    # Warm up (worker start-up, imports) outside the measurement
+    await asyncio.gather(*(executor.run(parse_job_html, URL, page) for _ in range(executor.max_workers or 1)))
+
+    latencies: list[float] = []
+    stop = asyncio.Event()
+    reads = asyncio.create_task(reader(stop, latencies))
+    elapsed = await ingest_load(executor, page, pages, concurrency)
+    stop.set()
+    await reads
+    executor.shutdown()
+
+    p99 = percentile(latencies, 99)
+    print(
+        f"{label:<7} ingest {pages / elapsed:6.1f} pages/s   reads {len(latencies):5d}   "
+        f"p50 {percentile(latencies, 50):7.1f} ms   p99 {p99:7.1f} ms   "
+        f"max {max(latencies):7.1f} ms   mean {statistics.mean(latencies):6.1f} ms"
+    )
+    return p99
+
+
+async def main(pages: int, concurrency: int, workers: int, body_kb: int) -> None:
+    page = build_page(body_kb)
+
+    print("=" * 78)
+    print(
+        f"CPU POOL: {pages} pages of {len(page) // 1024} KB, ingest concurrency {concurrency}, "
+        f"{workers} workers, a read every {READ_INTERVAL_S * 1000:.0f} ms"
+    )
+    print("=" * 78)
+
+    inline_p99 = await run("inline", CPUExecutor(max_workers=0), page, pages, concurrency)
+    pool_p99 = await run("pool", CPUExecutor(max_workers=workers), page, pages, concurrency)
+    print("-" * 78)
+    print(f"p99 read latency improvement: {inline_p99 / pool_p99:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--body-kb", type=int, default=250)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.concurrency, args.workers, args.body_kb))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Microbenchmark jd_analyzer's single-pass matchers against the old per-pattern scans.
+
+The reference functions below are the implementations the single-pass
+matchers replaced (one case-insensitive ``re.findall``/``re.search`` per
+pattern). Every description in the corpus is run
+through both and the results are compared before timing.
+
+The corpus is the ``description_raw`` of every job in the database
+(``--from-db``), or a built-in set of representative descriptions.
+
+Usage:
+    python benchmarks/bench_jd_analyzer.py [--iterations 20] [--from-db]
+"""
+
+import argparse
+import asyncio
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.jd_analyzer import (
+    EXPERIENCE_PATTERNS,
+    SENIORITY_PATTERNS,
+    TECH_PATTERNS,
+    extract_seniority_level,
+    extract_technologies,
+    extract_years_experience,
+)
+from tests.jd_samples import SAMPLE_DESCRIPTIONS
+
+TECH_NAMES = {
+    "golang": "Go", "go": "Go", "node.js": "Node.js", "nodejs": "Node.js",
+    "next.js": "Next.js", "nextjs": "Next.js", "nest.js": "NestJS", "nestjs": "NestJS",
+    "typescript": "TypeScript", "javascript": "JavaScript", "python": "Python",
+    "postgresql": "PostgreSQL", "postgres": "PostgreSQL", "cosmosdb": "Cosmos DB",
+    "cosmos db": "Cosmos DB",
+}
+
+
+def reference_technologies(text: str) -> list[str]:
+    technologies = set()
+    for pattern in TECH_PATTERNS:
+        for match in re.findall(pattern, text, re.IGNORECASE):
+            technologies.add(TECH_NAMES.get(match.lower().strip(), match))
+    return sorted(technologies)
+
+
+def reference_years_experience(text: str) -> int | None:
+    for pattern in EXPERIENCE_PATTERNS:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            match = matches[0]
+            return int(match[0]) if isinstance(match, tuple) else int(match)
+    return None
+
+
+def reference_seniority_level(text: str) -> str | None:
+    for pattern, level in SENIORITY_PATTERNS:
+        if re.search(pattern, text, re.IGNORECASE):
+            return level
+    return None
+
+
+PAIRS = [
+    ("technologies", reference_technologies, extract_technologies),
+    ("experience", reference_years_experience, extract_years_experience),
+    ("seniority", reference_seniority_level, extract_seniority_level),
+]
+
+
+async def load_db_corpus() -> list[str]:
+    from sqlalchemy import select
+
+    from src.config import AsyncSessionLocal
+    from src.models import Job
+
+    async with AsyncSessionLocal() as session:
+        rows = await session.scalars(select(Job.description_raw).where(Job.description_raw.is_not(None)))
+        return [row for row in rows if row]
+
+
+def time_function(fn, corpus: list[str], iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) / len(corpus) * 1_000_000
+
+
+def main(iterations: int, from_db: bool) -> None:
+    corpus = asyncio.run(load_db_corpus()) if from_db else SAMPLE_DESCRIPTIONS
+    if not corpus:
+        raise SystemExit("no descriptions in the corpus")
+
+    print("=" * 78)
+    print(
+        f"JD ANALYZER: {len(corpus)} descriptions "
+        f"(mean {statistics.mean(map(len, corpus)):.0f} chars), {iterations} iterations"
+    )
+    print("=" * 78)
+
+    for name, reference, current in PAIRS:
+        mismatches = [text for text in corpus if reference(text) != current(text)]
+        if mismatches:
+            raise SystemExit(f"{name}: {len(mismatches)} descriptions differ from the reference")
+
+    total_reference = total_current = 0.0
+    for name, reference, current in PAIRS:
+        reference_us = time_function(reference, corpus, iterations)
+        current_us = time_function(current, corpus, iterations)
+        total_reference += reference_us
+        total_current += current_us
+        print(
+            f"{name:<13} per-pattern {reference_us:8.1f} us   single-pass {current_us:8.1f} us   "
+            f"{reference_us / current_us:4.1f}x"
+        )
+    print("-" * 78)
+    print(f"{'total':<13} per-pattern {total_reference:8.1f} us   single-pass {total_current:8.1f} us   "
+          f"{total_reference / total_current:4.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--from-db", action="store_true", help="use job descriptions from the database")
+    args = parser.parse_args()
+    main(args.iterations, args.from_db)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark rule-based analysis of a whole jobs table, one by one vs analyze_jobs_batch.
+
+Builds a table of jobs from the jd_analyzer sample descriptions (with
+varied titles, companies and locations), or loads every job with a
+description from the database (``--from-db``), and scores it with
+``analyze_job`` per job and with ``analyze_jobs_batch``. Results are
+compared before timing.
+
+Usage:
+    python benchmarks/bench_job_analysis_batch.py [--jobs 5000] [--from-db]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_jd_analyzer import SAMPLE_DESCRIPTIONS
+from src.models import Job
+from src.models.job import WorkLocationType
+from src.services.job_analysis_service import analyze_job, analyze_jobs_batch
+
+TITLES = [
+    "CTO", "VP of Engineering", "Director of Engineering", "Head of Platform",
+    "Principal Engineer", "Staff Software Engineer", "Senior Backend Engineer (Remote)",
+    "Software Architect", "Engineering Manager", "Machine Learning Engineer",
+]
+LOCATIONS = [
+    ("Remote US", WorkLocationType.REMOTE),
+    ("Remote US (CA, NY, WA)", WorkLocationType.REMOTE),
+    ("Austin, TX", WorkLocationType.HYBRID),
+    ("Seattle, WA", WorkLocationType.ON_SITE),
+]
+
+
+def build_jobs(count: int) -> list[Job]:
+    rng = random.Random(0)
+    jobs = []
+    for index in range(count):
+        location, work_location_type = rng.choice(LOCATIONS)
+        jobs.append(Job(
+            title=rng.choice(TITLES),
+            company=f"Company {index % 500}",
+            location=location,
+            work_location_type=work_location_type,
+            # Unique per job, so the batch's per-description reuse does not apply
+            description_raw="\n\n".join([*rng.sample(SAMPLE_DESCRIPTIONS, 2), f"Requisition #{index}"]),
+        ))
+    return jobs
+
+
+async def load_db_jobs() -> list[Job]:
+    from sqlalchemy import select
+
+    from src.config import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as session:
+        rows = await session.scalars(select(Job).where(Job.description_raw.is_not(None)))
+        return list(rows)
+
+
+def one_by_one(jobs: list[Job]):
+    return [
+        analyze_job(
+            description=job.description_raw or "",
+            title=job.title,
+            company=job.company,
+            location=job.location,
+            work_location_type=job.work_location_type.value if job.work_location_type else None,
+        )
+        for job in jobs
+    ]
+
+
+def timed(fn, *args) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+
+def main(count: int, from_db: bool) -> None:
+    jobs = asyncio.run(load_db_jobs()) if from_db else build_jobs(count)
+    if not jobs:
+        raise SystemExit("no jobs to analyze")
+
+    print("=" * 78)
+    print(f"BATCH ANALYSIS: {len(jobs)} jobs")
+    print("=" * 78)
+
+    sequential_s, sequential = timed(one_by_one, jobs)
+    batch_s, batch = timed(analyze_jobs_batch, jobs)
+    if batch != sequential:
+        raise SystemExit("analyze_jobs_batch results differ from analyze_job")
+
+    print(f"one by one  {sequential_s:7.2f} s   {sequential_s / len(jobs) * 1e6:8.1f} us/job")
+    print(f"batch       {batch_s:7.2f} s   {batch_s / len(jobs) * 1e6:8.1f} us/job")
+    print("-" * 78)
+    print(f"speedup: {sequential_s / batch_s:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--from-db", action="store_true", help="analyze the jobs in the database")
+    args = parser.parse_args()
+    main(args.jobs, args.from_db)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark list_jobs search: ILIKE substring scan vs indexed full-text search.
+
+Inserts synthetic jobs (descriptions from the jd_analyzer samples, varied
+titles and companies) into the configured database inside a transaction,
+runs ANALYZE, then times the WHERE clause list_jobs builds for each
+search mode over a set of terms, and prints each plan's top node. The
+transaction is rolled back, so nothing is left behind.
+
+Needs migration 013 (pg_trgm indexes) applied.
+
+Usage:
+    python benchmarks/bench_job_search.py [--jobs 100000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import ClauseElement, Executable, func, insert, select, text
+from sqlalchemy.ext.compiler import compiles
+
+from benchmarks.bench_jd_analyzer import SAMPLE_DESCRIPTIONS
+from src.config import AsyncSessionLocal
+from src.models import Job
+from src.services.job_search import search_filter
+
+TITLES = [
+    "CTO", "VP of Engineering", "Director of Engineering", "Head of Platform",
+    "Principal Engineer", "Staff Software Engineer", "Senior Backend Engineer",
+    "Software Architect", "Engineering Manager", "Machine Learning Engineer",
+]
+TERMS = ["kubernetes", "staff engineer", '"machine learning" -contract', "Company 42", "Arch"]
+INSERT_BATCH = 5000
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN " + compiler.process(element.statement, **kw)
+
+
+def build_rows(count: int) -> list[dict]:
+    rng = random.Random(0)
+    return [
+        {
+            "title": rng.choice(TITLES),
+            "company": f"Company {index % 2000}",
+            "job_board": "bench",
+            "job_board_id": f"bench-{index}",
+            "description_raw": "\n\n".join([*rng.sample(SAMPLE_DESCRIPTIONS, 2), f"Requisition #{index}"]),
+        }
+        for index in range(count)
+    ]
+
+
+async def run(count: int, repeat: int) -> None:
+    async with AsyncSessionLocal() as session:
+        rows = build_rows(count)
+        started = time.perf_counter()
+        for offset in range(0, len(rows), INSERT_BATCH):
+            await session.execute(insert(Job), rows[offset:offset + INSERT_BATCH])
+        await session.execute(text("ANALYZE jobs"))
+        total = await session.scalar(select(func.count()).select_from(Job))
+        print("=" * 78)
+        print(f"JOB SEARCH: {total} jobs ({count} inserted in {time.perf_counter() - started:.1f} s)")
+        print("=" * 78)
+
+        try:
+            for term in TERMS:
+                print(f"search={term!r}")
+                for mode in ("substring", "fulltext"):
+                    query = (
+                        select(Job.id)
+                        .where(Job.deleted_at.is_(None), search_filter(term, mode))
+                        .order_by(Job.updated_at.desc())
+                        .limit(20)
+                    )
+                    timings = []
+                    for _ in range(repeat):
+                        began = time.perf_counter()
+                        matched = len((await session.execute(query)).all())
+                        timings.append(time.perf_counter() - began)
+
+                    plan = [row[0] for row in await session.execute(Explain(query))]
+                    scans = [line.strip() for line in plan if "Scan" in line]
+                    print(
+                        f"  {mode:<10} {statistics.median(timings) * 1000:8.1f} ms  "
+                        f"{matched:3d} rows  {scans[0] if scans else plan[0]}"
+                    )
+        finally:
+            await session.rollback()
+
+
+def main(count: int, repeat: int) -> None:
+    asyncio.run(run(count, repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.jobs, args.repeat)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark JobScraper.parse with the fast and BeautifulSoup backends.
+
+Builds a synthetic job page - a JSON-LD JobPosting with an HTML description
+followed by a large body of navigation markup, like a LinkedIn or Workday
+page - and parses it repeatedly with each backend, checking the results are
+identical. The page is parsed as a Greenhouse posting and as a LinkedIn
+posting with an Easy Apply button, since LinkedIn pages also run the Easy
+Apply check.
+
+Usage:
+    python benchmarks/bench_parser_backend.py [--iterations 20] [--body-kb 250]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.job_scraper import JobScraper
+
+URLS = {
+    "greenhouse": "https://boards.greenhouse.io/acme/jobs/123",
+    "linkedin": "https://www.linkedin.com/jobs/view/123",
+}
+
+
+def build_page(body_kb: int) -> str:
+    description = (
+        "<p>" + "We build <b>reliable</b> systems &amp; tooling. " * 150 + "</p>"
+        "<ul>" + "<li>Python &amp; SQL</li>" * 40 + "</ul>"
+    )
+    posting = {
+        "@type": "JobPosting",
+        "title": "Staff Engineer",
+        "description": description,
+        "hiringOrganization": {"name": "Acme"},
+        "jobLocation": {"address": {"addressLocality": "Austin", "addressRegion": "TX"}},
+    }
+    row = "<div class='nav'><span>Menu item</span><a href='/jobs/1'>Related job</a></div>\n"
+    body = row * (body_kb * 1024 // len(row))
+    apply_button = (
+        "<div class='top-card-layout__cta-container'>"
+        "<button class='jobs-apply-button' data-job-id='123'><span>Easy Apply</span></button></div>"
+    )
+    return (
+        "<html><head><meta property='og:title' content='Staff Engineer'>"
+        f"<script type='application/ld+json'>{json.dumps(posting)}</script>"
+        f"</head><body>{apply_button}{body}</body></html>"
+    )
+
+
+def run(label: str, scraper: JobScraper, url: str, page: str, iterations: int) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        scraper.parse(url, page)
+        timings.append((time.perf_counter() - started) * 1000)
+    print(
+        f"{label:<6} mean {statistics.mean(timings):8.1f} ms   "
+        f"p50 {statistics.median(timings):8.1f} ms   max {max(timings):8.1f} ms"
+    )
+    return timings
+
+
+def main(iterations: int, body_kb: int) -> None:
+    page = build_page(body_kb)
+    fast = JobScraper(parser_backend="fast")
+    reference = JobScraper(parser_backend="bs4")
+
+    print("=" * 78)
+    print(f"PARSER BACKEND: {iterations} parses of a {len(page) // 1024} KB page")
+    print("=" * 78)
+
+    for source, url in URLS.items():
+        parsed = fast.parse(url, page)
+        if parsed != reference.parse(url, page):
+            raise SystemExit(f"{source}: fast and bs4 backends disagree")
+        if source == "linkedin" and not parsed.is_easy_apply:
+            raise SystemExit("linkedin: Easy Apply not detected")
+
+        print(source)
+        bs4_timings = run("bs4", reference, url, page, iterations)
+        fast_timings = run("fast", fast, url, page, iterations)
+        print(f"fast speedup (mean): {statistics.mean(bs4_timings) / statistics.mean(fast_timings):.1f}x")
+        print("-" * 78)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--body-kb", type=int, default=250)
+    args = parser.parse_args()
+    main(args.iterations, args.body_kb)
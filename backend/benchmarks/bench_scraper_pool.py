@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark JobScraper's pooled client against a client per fetch.
+
+Starts a local HTTP/1.1 keep-alive stub job board and fetches the same
+posting repeatedly, comparing:
+
+- fresh: a new httpx.AsyncClient per fetch (the old JobScraper default)
+- pooled: the shared JobScraper client (keep-alive, reused connections)
+
+Use --connect-delay-ms to simulate per-connection setup cost (TCP + TLS
+handshake to a remote board); the stub sleeps that long once per new
+connection. HTTP/2 is only negotiated over TLS, so against this plain-HTTP
+stub both modes speak HTTP/1.1 and the gain shown is from connection reuse
+and client construction alone.
+
+Usage:
+    python benchmarks/bench_scraper_pool.py [--fetches 200] [--concurrency 1] [--connect-delay-ms 0]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.job_scraper import JobScraper
+
+PAGE = (
+    '<html><head><script type="application/ld+json">'
+    '{"@type": "JobPosting", "title": "Staff Engineer", "hiringOrganization": {"name": "Acme"}, '
+    '"description": "' + "Build distributed systems in Python. " * 200 + '"}'
+    "</script></head><body></body></html>"
+).encode()
+
+
+def start_stub_server(connect_delay_ms: float) -> ThreadingHTTPServer:
+    """Serve PAGE on an ephemeral port with HTTP/1.1 keep-alive."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are separate writes; avoid Nagle + delayed-ACK stalls
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            super().setup()
+            if connect_delay_ms:
+                time.sleep(connect_delay_ms / 1000)
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(PAGE)))
+            self.end_headers()
+            self.wfile.write(PAGE)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def fetch_fresh(url: str) -> None:
+    async with httpx.AsyncClient(timeout=httpx.Timeout(20.0, connect=10.0)) as client:
+        response = await client.get(url, follow_redirects=True)
+        response.raise_for_status()
+
+
+async def run(label: str, fetch, url: str, fetches: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await fetch(url)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(fetches)))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<8} mean {statistics.mean(latencies):7.2f} ms   "
+        f"p50 {statistics.median(latencies):7.2f} ms   p95 {p95:7.2f} ms   "
+        f"{fetches / elapsed:8.1f} fetches/s"
+    )
+    return latencies
+
+
+async def main(fetches: int, concurrency: int, connect_delay_ms: float) -> None:
+    server = start_stub_server(connect_delay_ms)
+    url = f"http://127.0.0.1:{server.server_address[1]}/acme/jobs/1"
+    scraper = JobScraper(per_host_limit=concurrency)
+
+    print("=" * 78)
+    print(
+        f"SCRAPER CLIENT POOL: {fetches} fetches, concurrency {concurrency}, "
+        f"connect delay {connect_delay_ms} ms"
+    )
+    print("=" * 78)
+
+    # Warm up both paths (imports, SSL context caches)
+    await fetch_fresh(url)
+    await scraper.fetch_html(url)
+
+    fresh = await run("fresh", fetch_fresh, url, fetches, concurrency)
+    pooled = await run("pooled", scraper.fetch_html, url, fetches, concurrency)
+    print("-" * 78)
+    print(f"pooled speedup (mean latency): {statistics.mean(fresh) / statistics.mean(pooled):.1f}x")
+
+    await scraper.aclose()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fetches", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--connect-delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.fetches, args.concurrency, args.connect_delay_ms))
@@ -10,7 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy import select
 from src.config.database import AsyncSessionLocal
 from src.models.job import Job, RoleType
-from src.services import analyze_job
+from src.services import analyze_job, analyze_jobs_batch
 
 
 async def analyze_all_jobs():
@@ -33,14 +33,33 @@ async def analyze_all_jobs():
         ai_forward_count = 0
         errors = 0
 
-        for job in jobs:
+        # Score the whole table at once; if any job breaks the batch, fall
+        # back to one job at a time so only the broken ones are lost
+        try:
+            analyses = analyze_jobs_batch(jobs)
+        except Exception as e:
+            print(f"Batch analysis failed ({e}); analyzing jobs one at a time")
+            analyses = []
+            for job in jobs:
+                try:
+                    analyses.append(
+                        analyze_job(
+                            description=job.description_raw,
+                            title=job.title,
+                            company=job.company,
+                            location=job.location,
+                            work_location_type=job.work_location_type.value if job.work_location_type else None,
+                        )
+                    )
+                except Exception as e:
+                    print(f"✗ {job.title} @ {job.company}: ERROR - {e}")
+                    errors += 1
+                    analyses.append(None)
+
+        for job, analysis in zip(jobs, analyses):
+            if analysis is None:
+                continue
             try:
-                analysis = analyze_job(
-                    description=job.description_raw,
-                    title=job.title,
-                    company=job.company,
-                )
-
                 # Track changes
                 changes = []
 
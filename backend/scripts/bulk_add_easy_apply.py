@@ -11,8 +11,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy import select, update
 from src.config.database import AsyncSessionLocal
 from src.models.job import Job, EmploymentType, WorkLocationType
-from src.services.job_scraper import JobScraper
-from src.services import analyze_job
+from src.services.job_scraper import job_scraper
+from src.services import analyze_job, source_archive
 
 # Easy Apply job IDs from LinkedIn search (last 30 days, exec roles)
 EASY_APPLY_JOB_IDS = [
@@ -35,7 +35,7 @@ EASY_APPLY_JOB_IDS = [
 
 async def bulk_add_jobs():
     """Add jobs and mark them as Easy Apply."""
-    scraper = JobScraper()
+    scraper = job_scraper  # shared client and on-disk page cache
 
     async with AsyncSessionLocal() as session:
         added = 0
@@ -101,7 +101,7 @@ async def bulk_add_jobs():
                     job_board="linkedin",
                     job_board_id=job_id,
                     description_raw=scraped.description,
-                    source_html=scraped.raw_html,
+                    source=await source_archive.build(scraped.raw_html),
                     is_easy_apply=True,  # Force True since we found these in Easy Apply search
                     salary_min=scraped.salary_min,
                     salary_max=scraped.salary_max,
@@ -11,12 +11,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy import select, update
 from src.config.database import AsyncSessionLocal
 from src.models.job import Job
-from src.services.job_scraper import JobScraper, detect_source
+from src.services.job_scraper import detect_source, job_scraper
 
 
 async def reprocess_jobs():
     """Re-scrape all LinkedIn jobs and update Easy Apply status."""
-    scraper = JobScraper()
+    scraper = job_scraper  # shared client and on-disk page cache
 
     async with AsyncSessionLocal() as session:
         # Get all jobs with URLs
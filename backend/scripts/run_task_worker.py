@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Run a standalone background task worker.
+
+Drains the background_tasks queue alongside (or instead of) the in-process
+worker. Set TASK_WORKER_ENABLED=false on the API to run workers only here.
+
+Usage:
+    python scripts/run_task_worker.py [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import signal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api import task_handlers  # noqa: F401 - registers task handlers
+from src.config import settings
+from src.config.database import AsyncSessionLocal
+from src.services import TaskWorker, task_queue
+
+
+async def main(concurrency: int) -> None:
+    worker = TaskWorker(
+        task_queue,
+        AsyncSessionLocal,
+        concurrency=concurrency,
+        poll_interval_seconds=settings.task_poll_interval_seconds,
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"Task worker {worker.worker_id} running with concurrency {concurrency}")
+    await worker.start()
+    await stop.wait()
+    print("Stopping; in-flight tasks will be retried after their lease expires")
+    await worker.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=settings.task_worker_concurrency)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency))
@@ -6,10 +6,11 @@ from uuid import UUID
 
 from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.config import get_db, settings
+from src.config import get_db, get_session_factory, settings
 from src.models import Agent
+from src.services.api_key_cache import AgentIdentity, api_key_cache
 
 
 @dataclass(frozen=True)
@@ -25,6 +26,7 @@ class AuthContext:
 
 # Type aliases for dependencies
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+SessionFactory = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
 
 
 def _permission_allowed(granted: set[str], required: str) -> bool:
@@ -57,15 +59,8 @@ async def verify_api_key(
     if x_api_key == settings.api_key:
         return AuthContext(api_key=x_api_key, is_admin=True, permissions={"*"})
 
-    result = await db.execute(
-        select(Agent).where(
-            Agent.api_key == x_api_key,
-            Agent.is_active.is_(True),
-        )
-    )
-    agent = result.scalar_one_or_none()
-
-    if not agent:
+    agent = await _lookup_agent(db, x_api_key)
+    if agent is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API key",
@@ -74,12 +69,34 @@ async def verify_api_key(
     return AuthContext(
         api_key=x_api_key,
         is_admin=False,
-        permissions=set(agent.permissions or []),
+        permissions=set(agent.permissions),
         agent_id=agent.id,
         agent_name=agent.name,
     )
 
 
+async def _lookup_agent(db: AsyncSession, api_key: str) -> AgentIdentity | None:
+    """The active agent owning a key, from the key cache when possible."""
+    if settings.api_key_cache_enabled:
+        cached, agent = api_key_cache.get(api_key)
+        if cached:
+            return agent
+    generation = api_key_cache.generation
+
+    result = await db.execute(
+        select(Agent).where(
+            Agent.api_key == api_key,
+            Agent.is_active.is_(True),
+        )
+    )
+    row = result.scalar_one_or_none()
+    agent = AgentIdentity.from_agent(row) if row is not None else None
+
+    if settings.api_key_cache_enabled:
+        api_key_cache.put(api_key, agent, generation)
+    return agent
+
+
 def require_permissions(required: Iterable[str]):
     """Dependency factory for permission checks."""
 
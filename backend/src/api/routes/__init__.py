@@ -11,6 +11,9 @@ from .health import router as health_router
 from .discovery import router as discovery_router
 from .decline_reasons import router as decline_reasons_router
 from .job_contacts import router as job_contacts_router
+from .tasks import router as tasks_router
+from .stats import router as stats_router
+from .rag import router as rag_router
 
 api_router = APIRouter()
 
@@ -23,3 +26,6 @@ api_router.include_router(webhooks_router, prefix="/webhooks", tags=["webhooks"]
 api_router.include_router(discovery_router)
 api_router.include_router(decline_reasons_router, prefix="/decline-reasons", tags=["decline-reasons"])
 api_router.include_router(job_contacts_router, prefix="/jobs/{job_id}/contacts", tags=["job-contacts"])
+api_router.include_router(tasks_router, prefix="/tasks", tags=["tasks"])
+api_router.include_router(stats_router, prefix="/stats", tags=["stats"])
+api_router.include_router(rag_router, prefix="/rag", tags=["rag"])
@@ -1,13 +1,14 @@
 """Agent management endpoints."""
 
 import secrets
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 
 from src.api.deps import DbSession, require_permissions
 from src.models import Agent
-from src.schemas import AgentCreate, AgentResponse
+from src.schemas import AgentCreate, AgentResponse, AgentUpdate
 
 router = APIRouter()
 
@@ -46,3 +47,30 @@ async def create_agent(
     await db.flush()
     await db.refresh(agent)
     return agent
+
+
+@router.patch(
+    "/{agent_id}",
+    response_model=AgentResponse,
+    summary="Update agent",
+    description="Change an agent's permissions or deactivate it. Takes effect on the agent's next request.",
+    dependencies=[Depends(require_permissions(["agents:write"]))],
+)
+async def update_agent(
+    db: DbSession,
+    agent_id: UUID,
+    agent_in: AgentUpdate,
+) -> Agent:
+    """Update an agent."""
+    agent = await db.get(Agent, agent_id)
+    if not agent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found",
+        )
+
+    for field, value in agent_in.model_dump(exclude_unset=True, exclude_none=True).items():
+        setattr(agent, field, value)
+    await db.flush()
+    await db.refresh(agent)
+    return agent
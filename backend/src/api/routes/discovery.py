@@ -7,7 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import ApiKey, DbSession, require_permissions
-from src.models import Job, JobStatus
+from src.models import Job
 from src.schemas.discovery import (
     BulkDiscoveryRequest,
     BulkDiscoveryResponse,
@@ -15,6 +15,8 @@ from src.schemas.discovery import (
     LinkedInSearchRequest,
     LinkedInSearchResponse,
 )
+from src.services.duplicate_index import duplicate_index
+from src.services.job_stats import get_job_stats
 from src.services.linkedin_discovery import LinkedInJobDiscovery, DiscoveredJob
 
 router = APIRouter(prefix="/discovery", tags=["discovery"])
@@ -67,6 +69,7 @@ async def save_discovered_jobs(
     saved = 0
     skipped = 0
     errors: list[str] = []
+    new_jobs: list[Job] = []
 
     for job_item in request.jobs:
         try:
@@ -97,11 +100,14 @@ async def save_discovered_jobs(
                 tags=_build_tags(job_item),
             )
             db.add(job)
+            new_jobs.append(job)
             saved += 1
 
         except Exception as e:
             errors.append(f"Failed to save {job_item.title} at {job_item.company}: {str(e)}")
 
+    # Search results carry no description, so this matches on title and company
+    await duplicate_index.flag_near_duplicates(db, new_jobs)
     await db.commit()
 
     return BulkDiscoveryResponse(
@@ -139,39 +145,11 @@ async def get_discovery_stats(
     _auth: ApiKey,
 ) -> dict:
     """Get job discovery and application statistics."""
-    from sqlalchemy import func
-
-    # Total jobs by status
-    status_counts = await db.execute(
-        select(Job.status, func.count(Job.id))
-        .where(Job.deleted_at.is_(None))
-        .group_by(Job.status)
-    )
-    status_dict = {str(row[0].value): row[1] for row in status_counts.fetchall()}
-
-    # Jobs discovered from LinkedIn
-    linkedin_count = await db.execute(
-        select(func.count(Job.id))
-        .where(Job.job_board == "linkedin", Job.deleted_at.is_(None))
-    )
-    linkedin_total = linkedin_count.scalar() or 0
-
-    # Applied jobs
-    applied_count = await db.execute(
-        select(func.count(Job.id))
-        .where(
-            Job.status.in_([JobStatus.APPLIED, JobStatus.INTERVIEWING, JobStatus.OFFER]),
-            Job.deleted_at.is_(None),
-        )
-    )
-    applied_total = applied_count.scalar() or 0
-
-    # Jobs with Easy Apply
-    easy_apply_count = await db.execute(
-        select(func.count(Job.id))
-        .where(Job.is_easy_apply == True, Job.deleted_at.is_(None))
-    )
-    easy_apply_total = easy_apply_count.scalar() or 0
+    stats = await get_job_stats(db)
+    status_dict = dict(stats.by_status)
+    linkedin_total = stats.by_job_board["linkedin"]
+    applied_total = stats.applied
+    easy_apply_total = stats.easy_apply
 
     return {
         "total_jobs": sum(status_dict.values()),
@@ -1,15 +1,17 @@
 """Job CRUD endpoints."""
 
+import asyncio
 from datetime import datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import cast, func, select, case, nulls_last, String
-from sqlalchemy.orm import selectinload
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import func, or_, select, case, tuple_
+from sqlalchemy.orm import load_only, selectinload
 
-from src.api.deps import DbSession, require_permissions
-from src.models import Job, CoverLetter, JobContact, JobStatus as ModelJobStatus, RoleType as ModelRoleType, WorkLocationType as ModelWorkLocationType, EmploymentType as ModelEmploymentType
+from src.api.deps import DbSession, SessionFactory, require_permissions
+from src.models import Job, CoverLetter, JobContact, TaskKind, JobStatus as ModelJobStatus, RoleType as ModelRoleType, WorkLocationType as ModelWorkLocationType, EmploymentType as ModelEmploymentType
 from src.schemas import (
     JobCreate,
     JobIngestRequest,
@@ -29,21 +31,65 @@ from src.schemas import (
     CoverLetterResponse,
     BatchAnalyzeRequest,
     BatchAnalyzeResponse,
-    BatchAnalyzeJobResult,
+    TaskResponse,
+    DuplicateJob,
+    DuplicateCluster,
+    DuplicateClustersResponse,
+    JobSummary,
+    JobSummaryListResponse,
 )
 from src.schemas.job_note import JobNoteCreate, JobNoteEntry, NoteSource, NoteType
 from src.services import (
     job_scraper,
     JobScrapeError,
+    ScrapedJob,
     analyze_job,
     analyze_job_with_ai,
     sparkles_client,
+    rag_match_store,
     generate_typed_notes,
     description_fetcher,
+    BatchAnalyzer,
+    cpu_executor,
+    task_queue,
+    duplicate_index,
+    source_archive,
+    search_filter,
+    search_rank,
+    SearchMode,
+    CountMode,
+    count_jobs,
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    keyset_order,
 )
 
 router = APIRouter()
 
+BackgroundFlag = Annotated[
+    bool,
+    Query(description="Queue the work and return 202 with a task id instead of waiting"),
+]
+TASK_ACCEPTED_RESPONSES = {
+    status.HTTP_202_ACCEPTED: {
+        "model": TaskResponse,
+        "description": "Queued; poll /api/v1/tasks/{id} for status and result",
+    }
+}
+
+
+async def enqueue_task_response(db: DbSession, kind: TaskKind, payload: dict) -> JSONResponse:
+    """Queue background work and build the 202 response pointing at the task."""
+    task = await task_queue.enqueue(db, kind, payload)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=TaskResponse.model_validate(task).model_dump(mode="json"),
+        headers={"Location": f"/api/v1/tasks/{task.id}"},
+    )
+
 
 def build_job_response(job: Job, contacts: list | None = None) -> JobResponse:
     """Build JobResponse without triggering lazy loads.
@@ -86,6 +132,7 @@ def build_job_response(job: Job, contacts: list | None = None) -> JobResponse:
         user_decline_reasons=job.user_decline_reasons,
         company_decline_reasons=job.company_decline_reasons,
         decline_notes=job.decline_notes,
+        duplicate_of_id=job.duplicate_of_id,
         contacts=contact_list,
         contact_count=len(contact_list),
     )
@@ -95,14 +142,22 @@ def build_job_response(job: Job, contacts: list | None = None) -> JobResponse:
     "",
     response_model=JobListResponse,
     summary="List jobs",
-    description="List all jobs with optional filters and pagination.",
+    description=(
+        "List all jobs with optional filters and pagination.\n\n"
+        "`view=summary` (or `fields=title,company,...`) returns lightweight "
+        "JobSummary items instead, loading only those columns: no description, "
+        "notes or contacts, just `contact_count`."
+    ),
     dependencies=[Depends(require_permissions(["jobs:read"]))],
 )
 async def list_jobs(
     db: DbSession,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
-    status: Annotated[str | None, Query(description="Comma-separated list of statuses to filter by")] = None,
+    status_filter: Annotated[
+        str | None,
+        Query(alias="status", description="Comma-separated list of statuses to filter by"),
+    ] = None,
     company: str | None = None,
     target_role: RoleType | None = None,
     work_location_type: WorkLocationType | None = None,
@@ -115,18 +170,60 @@ async def list_jobs(
     min_salary: Annotated[int | None, Query(ge=0, description="Minimum salary filter")] = None,
     max_salary: Annotated[int | None, Query(ge=0, description="Maximum salary filter")] = None,
     search: str | None = None,
-    sort_by: Annotated[str | None, Query(description="Sort field: updated_at, created_at, priority, salary")] = "updated_at",
+    search_mode: Annotated[
+        SearchMode | None,
+        Query(description="fulltext (indexed word search, the default) or substring (ILIKE scan)"),
+    ] = None,
+    sort_by: Annotated[
+        str | None,
+        Query(description="Sort field: updated_at, created_at, priority, salary, relevance (fulltext search)"),
+    ] = "updated_at",
     sort_order: Annotated[str | None, Query(description="Sort order: asc or desc")] = "desc",
     max_age_days: Annotated[int | None, Query(ge=1, description="Maximum posting age in days")] = None,
-) -> JobListResponse:
-    """List all jobs with optional filters and pagination."""
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor from the previous page; replaces page for keyset pagination"),
+    ] = None,
+    count: Annotated[
+        CountMode | None,
+        Query(description="How to compute total: exact, estimated (planner estimate) or cached"),
+    ] = None,
+    view: Annotated[
+        Literal["full", "summary"],
+        Query(description="summary returns JobSummary items: no description, notes or contacts"),
+    ] = "full",
+    fields: Annotated[
+        str | None,
+        Query(description="Comma-separated JobSummary fields to return (implies view=summary)"),
+    ] = None,
+) -> JobListResponse | Response:
+    """List all jobs with optional filters and pagination.
+
+    Pass the response's next_cursor back as cursor (with the same filters
+    and sort) to page by keyset: deep pages cost the same as the first,
+    and concurrent updates don't make jobs skip or repeat.
+    """
+    from src.config import settings
+
+    summary_fields = list(JobSummary.model_fields)
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(summary_fields))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}. Valid fields: {', '.join(summary_fields)}",
+            )
+        summary_fields = ["id", *(name for name in summary_fields if name in requested and name != "id")]
+        view = "summary"
+
     # Base query - exclude deleted
     query = select(Job).where(Job.deleted_at.is_(None))
 
     # Apply filters
-    if status:
+    if status_filter:
         # Support comma-separated list of statuses
-        status_list = [s.strip() for s in status.split(",") if s.strip()]
+        status_list = [s.strip() for s in status_filter.split(",") if s.strip()]
         if status_list:
             status_enums = [ModelJobStatus(s) for s in status_list if s in [e.value for e in ModelJobStatus]]
             if status_enums:
@@ -159,23 +256,18 @@ async def list_jobs(
         query = query.where(
             (Job.salary_min <= max_salary) | ((Job.salary_min.is_(None)) & (Job.salary_max <= max_salary))
         )
+    search_mode = search_mode or settings.job_search_mode
     if search:
         # Search on title, company, description, and job ID
-        search_filter = (
-            Job.title.ilike(f"%{search}%")
-            | Job.company.ilike(f"%{search}%")
-            | Job.description_raw.ilike(f"%{search}%")
-            | cast(Job.id, String).ilike(f"%{search}%")
-        )
-        query = query.where(search_filter)
+        query = query.where(search_filter(search, search_mode))
     if max_age_days is not None:
-        # Filter by posting age - include jobs with NULL posted_at (they pass the filter)
-        cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
+        # Filter by posting age - include jobs with NULL posted_at (they pass the filter).
+        # Whole minutes, so cached totals can be reused between polls
+        cutoff_date = datetime.utcnow().replace(second=0, microsecond=0) - timedelta(days=max_age_days)
         query = query.where((Job.posted_at.is_(None)) | (Job.posted_at >= cutoff_date))
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
+    total, total_estimated = await count_jobs(db, query, count or settings.job_list_count_mode)
 
     # Determine sort column
     # For salary, use COALESCE to pick best available value, with nulls always last
@@ -189,42 +281,101 @@ async def list_jobs(
         "title": Job.title,
         "company": Job.company,
     }
-    sort_column = sort_column_map.get(sort_by or "updated_at", Job.updated_at)
-
-    # Apply sort order, with nulls last for salary
-    if sort_order == "asc":
-        if sort_by == "salary":
-            order_clause = nulls_last(sort_column.asc())
-        else:
-            order_clause = sort_column.asc()
+    if search and search_mode == "fulltext":
+        sort_column_map["relevance"] = search_rank(search)
+    if sort_by not in sort_column_map:
+        sort_by = "updated_at"
+    sort_column = sort_column_map[sort_by]
+    sort_order = "asc" if sort_order == "asc" else "desc"
+    descending = sort_order == "desc"
+
+    # Order by the sort key, then created_at and id so every job has a fixed
+    # position (nulls last for salary)
+    query = query.order_by(*keyset_order(sort_column, sort_by, descending))
+    if cursor:
+        try:
+            position = decode_cursor(cursor, sort_by, sort_order)
+        except InvalidCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc),
+            )
+        query = query.where(keyset_filter(sort_column, position, descending))
     else:
-        if sort_by == "salary":
-            order_clause = nulls_last(sort_column.desc())
-        else:
-            order_clause = sort_column.desc()
-
-    # Apply pagination and ordering
-    query = (
-        query.order_by(order_clause, Job.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .options(selectinload(Job.contacts))
-    )
+        query = query.offset((page - 1) * page_size)
+
+    # Select the sort key too, to build the next page's cursor
+    query = query.add_columns(sort_column.label("sort_key")).limit(page_size)
+    if view == "summary":
+        # Only the requested columns (created_at and id for the cursor);
+        # contacts are counted in the query instead of loaded
+        columns = {"id", "created_at", *summary_fields} - {"contact_count"}
+        query = query.options(load_only(*(getattr(Job, name) for name in columns)))
+        if "contact_count" in summary_fields:
+            query = query.add_columns(
+                select(func.count(JobContact.id))
+                .where(JobContact.job_id == Job.id)
+                .correlate(Job)
+                .scalar_subquery()
+                .label("contact_count")
+            )
+    else:
+        query = query.options(selectinload(Job.contacts))
 
-    result = await db.execute(query)
-    jobs = list(result.scalars().all())
+    rows = (await db.execute(query)).all()
+    jobs = [row[0] for row in rows]
 
     total_pages = (total + page_size - 1) // page_size
 
+    next_cursor = None
+    if len(rows) == page_size:
+        # The summary view may add a contact_count column after sort_key
+        last_row = rows[-1]
+        last_job = last_row[0]
+        next_cursor = encode_cursor(
+            Cursor(
+                sort_by=sort_by,
+                sort_order=sort_order,
+                value=last_row.sort_key,
+                created_at=last_job.created_at,
+                id=last_job.id,
+            )
+        )
+
+    if view == "summary":
+        summaries = [
+            JobSummary.model_validate({
+                name: row.contact_count if name == "contact_count" else getattr(row[0], name)
+                for name in summary_fields
+            })
+            for row in rows
+        ]
+        summary_response = JobSummaryListResponse(
+            items=summaries,
+            total=total,
+            total_estimated=total_estimated,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        )
+        # Serialize once, leaving out fields that weren't requested
+        return Response(
+            content=summary_response.model_dump_json(exclude_unset=True),
+            media_type="application/json",
+        )
+
     # Build response with contacts (already loaded via selectinload)
     items = [build_job_response(job, contacts=list(job.contacts)) for job in jobs]
 
     return JobListResponse(
         items=items,
         total=total,
+        total_estimated=total_estimated,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -325,7 +476,7 @@ async def ingest_job(
         job_board=request.source or scraped.source,
         job_board_id=scraped.source_id,
         description_raw=scraped.description,
-        source_html=scraped.raw_html,
+        source=await source_archive.build(scraped.raw_html),
         is_easy_apply=scraped.is_easy_apply,
         salary_min=scraped.salary_min,
         salary_max=scraped.salary_max,
@@ -339,7 +490,8 @@ async def ingest_job(
     # Run job analysis to set priority, is_ai_forward, and target_role
     if scraped.description:
         try:
-            analysis = analyze_job(
+            analysis = await cpu_executor.run(
+                analyze_job,
                 description=scraped.description,
                 title=scraped.title,
                 company=scraped.company,
@@ -351,6 +503,8 @@ async def ingest_job(
         except Exception:
             pass  # Don't fail ingestion if analysis fails
 
+    await duplicate_index.flag_near_duplicates(db, [job])
+
     db.add(job)
     await db.flush()
     await db.refresh(job)
@@ -365,39 +519,78 @@ async def ingest_job(
     status_code=status.HTTP_201_CREATED,
     summary="Bulk ingest jobs from URLs",
     description="Create multiple jobs by scraping their URLs.",
+    responses=TASK_ACCEPTED_RESPONSES,
     dependencies=[Depends(require_permissions(["jobs:ingest"]))],
 )
 async def bulk_ingest_jobs(
     db: DbSession,
     request: JobBulkIngestRequest,
+    background: BackgroundFlag = False,
 ) -> JobBulkIngestResponse:
-    """Bulk ingest jobs from a list of URLs."""
+    """Bulk ingest jobs from a list of URLs.
+
+    Runs as a pipeline: concurrent fetch + parse (bounded per host), one
+    duplicate-check query for the whole batch, then a single multi-row INSERT.
+    """
+    if background:
+        return await enqueue_task_response(db, TaskKind.BULK_INGEST, request.model_dump(mode="json"))
+
+    from src.config import settings
+
     created: list[Job] = []
     failed: list[dict[str, str]] = []
 
-    for job_request in request.jobs:
-        url = str(job_request.url)
-        try:
-            scraped = await job_scraper.scrape(url, job_request.source)
-        except JobScrapeError as exc:
-            failed.append({"url": url, "error": str(exc)})
-            continue
+    urls = [str(job_request.url) for job_request in request.jobs]
+    scraped_results = await job_scraper.scrape_many(
+        [(url, job_request.source) for url, job_request in zip(urls, request.jobs)],
+        max_concurrency=settings.scrape_max_concurrency,
+    )
 
-        if scraped.source_id:
-            query = select(Job).where(
-                Job.job_board == scraped.source,
-                Job.job_board_id == scraped.source_id,
-                Job.deleted_at.is_(None),
-            )
-        else:
-            query = select(Job).where(
-                Job.url == url,
+    # One query finds every existing job matching a scraped board id or URL
+    board_keys = {
+        (scraped.source, scraped.source_id)
+        for scraped in scraped_results
+        if isinstance(scraped, ScrapedJob) and scraped.source_id
+    }
+    url_keys = {
+        url
+        for url, scraped in zip(urls, scraped_results)
+        if isinstance(scraped, ScrapedJob) and not scraped.source_id
+    }
+    seen_board_keys: set[tuple[str | None, str | None]] = set()
+    seen_urls: set[str | None] = set()
+    if board_keys or url_keys:
+        conditions = []
+        if board_keys:
+            conditions.append(tuple_(Job.job_board, Job.job_board_id).in_(list(board_keys)))
+        if url_keys:
+            conditions.append(Job.url.in_(list(url_keys)))
+        existing_rows = await db.execute(
+            select(Job.job_board, Job.job_board_id, Job.url).where(
                 Job.deleted_at.is_(None),
+                or_(*conditions),
             )
-        existing = (await db.execute(query)).scalar_one_or_none()
-        if existing:
+        )
+        for job_board, job_board_id, existing_url in existing_rows:
+            seen_board_keys.add((job_board, job_board_id))
+            seen_urls.add(existing_url)
+
+    for url, job_request, scraped in zip(urls, request.jobs, scraped_results):
+        if isinstance(scraped, JobScrapeError):
+            failed.append({"url": url, "error": str(scraped)})
+            continue
+
+        # Duplicates against the database and earlier URLs in this batch
+        if scraped.source_id:
+            key = (scraped.source, scraped.source_id)
+            if key in seen_board_keys:
+                failed.append({"url": url, "error": "Job already exists"})
+                continue
+            seen_board_keys.add(key)
+        elif url in seen_urls:
             failed.append({"url": url, "error": "Job already exists"})
             continue
+        seen_urls.add(url)
 
         # Parse posted_at date if available
         posted_at = None
@@ -431,7 +624,7 @@ async def bulk_ingest_jobs(
             job_board=job_request.source or scraped.source,
             job_board_id=scraped.source_id,
             description_raw=scraped.description,
-            source_html=scraped.raw_html,
+            source=await source_archive.build(scraped.raw_html),
             is_easy_apply=scraped.is_easy_apply,
             salary_min=scraped.salary_min,
             salary_max=scraped.salary_max,
@@ -442,25 +635,37 @@ async def bulk_ingest_jobs(
             notes=[{"text": job_request.notes, "timestamp": datetime.utcnow().isoformat() + "Z", "source": "user"}] if job_request.notes else None,
         )
 
-        # Run job analysis to set priority, is_ai_forward, and target_role
-        if scraped.description:
-            try:
-                analysis = analyze_job(
-                    description=scraped.description,
-                    title=scraped.title,
-                    company=scraped.company,
-                )
-                job.priority = analysis.suggested_priority
-                job.is_ai_forward = analysis.is_ai_forward
-                if analysis.suggested_role:
-                    job.target_role = analysis.suggested_role
-            except Exception:
-                pass  # Don't fail ingestion if analysis fails
-
-        db.add(job)
-        await db.flush()
         created.append(job)
 
+    # Run job analysis to set priority, is_ai_forward, and target_role; the
+    # batch is analyzed in parallel in the CPU pool
+    analyzed = [job for job in created if job.description_raw]
+    analyses = await asyncio.gather(
+        *(
+            cpu_executor.run(
+                analyze_job,
+                description=job.description_raw,
+                title=job.title,
+                company=job.company,
+            )
+            for job in analyzed
+        ),
+        return_exceptions=True,
+    )
+    for job, analysis in zip(analyzed, analyses):
+        if isinstance(analysis, BaseException):
+            continue  # Don't fail ingestion if analysis fails
+        job.priority = analysis.suggested_priority
+        job.is_ai_forward = analysis.is_ai_forward
+        if analysis.suggested_role:
+            job.target_role = analysis.suggested_role
+
+    await duplicate_index.flag_near_duplicates(db, created)
+
+    # add_all + flush emits a single multi-row INSERT for the batch
+    db.add_all(created)
+    await db.flush()
+
     return JobBulkIngestResponse(
         created=[build_job_response(job, contacts=[]) for job in created],
         failed=failed,
@@ -558,6 +763,53 @@ async def list_incomplete_descriptions(
     ]
 
 
+@router.get(
+    "/duplicates",
+    response_model=DuplicateClustersResponse,
+    summary="List near-duplicate job clusters",
+    description=(
+        "Group jobs whose postings are near-duplicates: the same role cross-posted "
+        "to several boards or re-listed, at the same company.\n\n"
+        "Similarity is the estimated Jaccard similarity of the title and "
+        "description word shingles, ignoring boilerplate such as EEO statements."
+    ),
+    dependencies=[Depends(require_permissions(["jobs:read"]))],
+)
+async def list_duplicate_clusters(
+    db: DbSession,
+    min_similarity: Annotated[
+        float | None,
+        Query(ge=0.5, le=1.0, description="Override the configured similarity threshold"),
+    ] = None,
+) -> DuplicateClustersResponse:
+    """List clusters of near-duplicate jobs."""
+    await duplicate_index.sync(db, force=True)
+    clusters = duplicate_index.clusters(min_similarity)
+
+    job_ids = [job_id for cluster in clusters for job_id in cluster]
+    jobs: dict[UUID, Job] = {}
+    if job_ids:
+        result = await db.scalars(
+            select(Job).where(Job.id.in_(job_ids), Job.deleted_at.is_(None))
+        )
+        jobs = {job.id: job for job in result}
+
+    items = []
+    for cluster in clusters:
+        members = sorted(
+            (jobs[job_id] for job_id in cluster if job_id in jobs),
+            key=lambda job: job.created_at,
+        )
+        if len(members) > 1:
+            items.append(DuplicateCluster(jobs=[DuplicateJob.model_validate(job) for job in members]))
+
+    return DuplicateClustersResponse(
+        clusters=items,
+        total_clusters=len(items),
+        total_jobs=sum(len(cluster.jobs) for cluster in items),
+    )
+
+
 @router.post(
     "",
     response_model=JobResponse,
@@ -586,9 +838,11 @@ async def create_job(
         priority=job_in.priority,
         notes=job_in.notes,
         tags=job_in.tags,
+        is_easy_apply=job_in.is_easy_apply,
         job_board=job_in.job_board,
         job_board_id=job_in.job_board_id,
     )
+    await duplicate_index.flag_near_duplicates(db, [job])
     db.add(job)
     await db.flush()
     await db.refresh(job)
@@ -623,6 +877,7 @@ async def create_job(
         user_decline_reasons=job.user_decline_reasons,
         company_decline_reasons=job.company_decline_reasons,
         decline_notes=job.decline_notes,
+        duplicate_of_id=job.duplicate_of_id,
         contacts=[],
         contact_count=0,
     )
@@ -701,6 +956,9 @@ async def update_job(
                 value = ModelWorkLocationType(value.value)
         setattr(job, field, value)
 
+    if update_data.keys() & {"title", "company", "description_raw"}:
+        await duplicate_index.refresh(db, job)
+
     await db.flush()
     await db.refresh(job, ["contacts"])
 
@@ -776,6 +1034,7 @@ async def update_job_status(
         "- **suggested_role**: Recommended target role (CTO, VP, Director, etc.)\n"
         "- **technologies_matched/missing**: Tech requirements vs resume skills\n"
     ),
+    responses=TASK_ACCEPTED_RESPONSES,
     dependencies=[Depends(require_permissions(["jobs:read"]))],
 )
 async def analyze_job_fit(
@@ -785,6 +1044,7 @@ async def analyze_job_fit(
     use_ai: Annotated[bool, Query(description="Use AI (Claude) for semantic analysis")] = True,
     use_rag: Annotated[bool, Query(description="Use RAG from Sparkles for coaching insights")] = True,
     auto_cover_letter: Annotated[bool, Query(description="Auto-generate cover letter for suggested role")] = False,
+    background: BackgroundFlag = False,
 ) -> JobAnalysisResponse:
     """Analyze a job for fit and AI-forward status."""
     query = select(Job).where(Job.id == job_id, Job.deleted_at.is_(None))
@@ -797,6 +1057,19 @@ async def analyze_job_fit(
             detail=f"Job with id {job_id} not found",
         )
 
+    if background:
+        return await enqueue_task_response(
+            db,
+            TaskKind.ANALYZE_JOB,
+            {
+                "job_id": str(job_id),
+                "apply_suggestions": apply_suggestions,
+                "use_ai": use_ai,
+                "use_rag": use_rag,
+                "auto_cover_letter": auto_cover_letter,
+            },
+        )
+
     if not job.description_raw:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -804,7 +1077,8 @@ async def analyze_job_fit(
         )
 
     # Run analysis - use AI by default
-    analysis, ai_result = analyze_job_with_ai(job, use_ai=use_ai)
+    analysis, ai_result = await analyze_job_with_ai(job, use_ai=use_ai)
+    requirement_matches = None
 
     # Optionally apply suggestions to the job
     if apply_suggestions:
@@ -833,26 +1107,14 @@ async def analyze_job_fit(
         if ai_result:
             # Try to get RAG context for enhanced coaching
             coaching_insights = None
-            requirement_matches = None
 
             if use_rag and sparkles_client.is_configured:
                 try:
-                    # Extract requirements from job for RAG matching
-                    from src.services.jd_analyzer import detect_and_parse_jd
-                    jd_result = detect_and_parse_jd(job.description_raw)
-                    requirements = (
-                        jd_result.requirements.must_have[:10] +
-                        jd_result.requirements.nice_to_have[:5]
-                    )
-
-                    if requirements:
-                        # Get JD requirement matches from RAG
-                        requirement_matches = await sparkles_client.match_jd_requirements(
-                            requirements=requirements,
-                            threshold=0.40,
-                            limit_per_req=3,
-                        )
+                    # Get JD requirement matches from RAG (stored per job, shared
+                    # with cover letter generation)
+                    requirement_matches = await rag_match_store.matches_for_job(db, job) or None
 
+                    if requirement_matches:
                         # Convert to RAGEvidence for coaching
                         from src.schemas.ai_analysis_coach import CoachingInsights, RAGEvidence
                         evidence_list = []
@@ -899,6 +1161,10 @@ async def analyze_job_fit(
         from sqlalchemy import func as sqlfunc, update
 
         try:
+            # Reuse the analysis's requirement matches rather than searching again
+            if requirement_matches is None and sparkles_client.is_configured:
+                requirement_matches = await rag_match_store.matches_for_job(db, job)
+
             # Generate cover letter for suggested role
             generation_result = await cover_letter_service.generate(
                 job=job,
@@ -906,6 +1172,7 @@ async def analyze_job_fit(
                 custom_instructions=None,
                 tone="professional",
                 use_rag=True,
+                requirement_matches=requirement_matches,
             )
 
             # Get current version number
@@ -1100,12 +1367,14 @@ async def list_job_notes(
     status_code=status.HTTP_201_CREATED,
     summary="Generate cover letter",
     description="Generate a new cover letter for a job.",
+    responses=TASK_ACCEPTED_RESPONSES,
     dependencies=[Depends(require_permissions(["cover_letters:write"]))],
 )
 async def generate_cover_letter(
     db: DbSession,
     job_id: UUID,
     request: CoverLetterCreate,
+    background: BackgroundFlag = False,
 ) -> CoverLetter:
     """Generate a cover letter for a job."""
     from src.models import CoverLetter as CoverLetterModel
@@ -1122,6 +1391,26 @@ async def generate_cover_letter(
             detail=f"Job with id {job_id} not found",
         )
 
+    if background:
+        return await enqueue_task_response(
+            db,
+            TaskKind.GENERATE_COVER_LETTER,
+            {"job_id": str(job_id), "request": request.model_dump(mode="json")},
+        )
+
+    # The job's stored requirement matches, if analysis already retrieved them
+    requirement_matches = None
+    if sparkles_client.is_configured:
+        try:
+            requirement_matches = await rag_match_store.matches_for_job(db, job)
+        except Exception as e:
+            import structlog
+            structlog.get_logger(__name__).warning(
+                "rag_context_failed",
+                job_id=str(job.id),
+                error=str(e),
+            )
+
     # Generate cover letter
     try:
         generation_result = await cover_letter_service.generate(
@@ -1130,6 +1419,7 @@ async def generate_cover_letter(
             custom_instructions=request.custom_instructions,
             tone=request.tone,
             use_rag=True,
+            requirement_matches=requirement_matches,
         )
     except ValueError as e:
         raise HTTPException(
@@ -1205,225 +1495,81 @@ async def list_job_cover_letters(
         "- Jobs without `ai_analysis_summary` note type\n"
         "- Jobs with description > min_description_length\n"
         "- Non-deleted jobs\n\n"
-        "Rate limited with configurable delay between jobs."
+        "Up to `concurrency` analyses run in parallel; job starts are rate limited "
+        "by a token bucket refilling one token every `delay_seconds`. Each job is "
+        "committed independently, and the response reports per-job latency and "
+        "overall throughput."
     ),
+    responses=TASK_ACCEPTED_RESPONSES,
     dependencies=[Depends(require_permissions(["jobs:read"]))],
 )
 async def batch_analyze_jobs(
     db: DbSession,
+    session_factory: SessionFactory,
     request: BatchAnalyzeRequest,
+    background: BackgroundFlag = False,
 ) -> BatchAnalyzeResponse:
     """Batch analyze jobs without existing analysis."""
-    import asyncio
+    if background:
+        return await enqueue_task_response(db, TaskKind.BATCH_ANALYZE, request.model_dump(mode="json"))
+
     import structlog
-    from src.models import CoverLetter as CoverLetterModel
-    from src.services import cover_letter_service
-    from sqlalchemy import func as sqlfunc, update
+    from src.config import settings
 
     logger = structlog.get_logger(__name__)
 
-    # Find jobs without ai_analysis_summary notes and with sufficient description
     # A job has analysis if its notes JSONB contains note_type='ai_analysis_summary'
-    query = (
-        select(Job)
-        .where(
-            Job.deleted_at.is_(None),
-            func.length(Job.description_raw) >= request.min_description_length,
-        )
-        .order_by(Job.created_at.desc())
+    eligible = (
+        Job.deleted_at.is_(None),
+        Job.description_length >= request.min_description_length,
+        or_(
+            Job.notes.is_(None),
+            ~Job.notes.contains([{"note_type": "ai_analysis_summary"}]),
+        ),
     )
-    result = await db.execute(query)
-    all_jobs = list(result.scalars().all())
-
-    # Filter out jobs that already have ai_analysis_summary
-    eligible_jobs = []
-    for job in all_jobs:
-        has_analysis = False
-        if job.notes:
-            for note in job.notes:
-                if isinstance(note, dict) and note.get("note_type") == "ai_analysis_summary":
-                    has_analysis = True
-                    break
-        if not has_analysis:
-            eligible_jobs.append(job)
-
-    # Limit to requested amount
-    jobs_to_process = eligible_jobs[: request.limit]
+    total_eligible = await db.scalar(select(func.count()).select_from(Job).where(*eligible)) or 0
+    result = await db.execute(
+        select(Job).where(*eligible).order_by(Job.created_at.desc()).limit(request.limit)
+    )
+    jobs_to_process = list(result.scalars().all())
+
+    concurrency = request.concurrency or settings.batch_analyze_concurrency
 
     logger.info(
         "batch_analyze_start",
-        total_eligible=len(eligible_jobs),
+        total_eligible=total_eligible,
         processing=len(jobs_to_process),
+        concurrency=concurrency,
         auto_cover_letter=request.auto_cover_letter,
     )
 
-    results: list[BatchAnalyzeJobResult] = []
-    successful = 0
-    failed = 0
-    cover_letters_generated = 0
-
-    for i, job in enumerate(jobs_to_process):
-        try:
-            # Run analysis
-            analysis, ai_result = analyze_job_with_ai(job, use_ai=True)
-
-            # Apply suggestions
-            job.priority = analysis.suggested_priority
-            job.is_ai_forward = analysis.is_ai_forward
-            job.is_location_compatible = analysis.is_location_compatible
-            if analysis.suggested_role:
-                job.target_role = ModelRoleType(analysis.suggested_role.value)
-
-            # Auto-reject if location incompatible
-            if not analysis.is_location_compatible:
-                job.status = ModelJobStatus.ARCHIVED
-                existing_reasons = job.user_decline_reasons or []
-                if "location" not in existing_reasons:
-                    job.user_decline_reasons = existing_reasons + ["location"]
-                if analysis.location_notes:
-                    existing_notes = job.decline_notes or ""
-                    if existing_notes:
-                        job.decline_notes = f"{existing_notes}\n{analysis.location_notes}"
-                    else:
-                        job.decline_notes = analysis.location_notes
-
-            # Generate typed notes
-            if ai_result:
-                coaching_insights = None
-                requirement_matches = None
-
-                if sparkles_client.is_configured:
-                    try:
-                        from src.services.jd_analyzer import detect_and_parse_jd
-                        jd_result = detect_and_parse_jd(job.description_raw)
-                        requirements = (
-                            jd_result.requirements.must_have[:10] +
-                            jd_result.requirements.nice_to_have[:5]
-                        )
-                        if requirements:
-                            requirement_matches = await sparkles_client.match_jd_requirements(
-                                requirements=requirements,
-                                threshold=0.40,
-                                limit_per_req=3,
-                            )
-                            from src.schemas.ai_analysis_coach import CoachingInsights
-                            evidence_list = []
-                            for match in requirement_matches:
-                                for top_match in match.top_matches[:1]:
-                                    evidence_list.append(top_match)
-                            coaching_insights = CoachingInsights(
-                                talking_points=[],
-                                strengths_to_highlight=[],
-                                gaps_to_address=[],
-                                study_recommendations=[],
-                                watch_outs=[],
-                                evidence_from_resume=evidence_list,
-                            )
-                    except Exception as e:
-                        logger.warning("batch_rag_failed", job_id=str(job.id), error=str(e))
-
-                typed_notes = generate_typed_notes(
-                    ai_result=ai_result,
-                    coaching=coaching_insights,
-                    requirement_matches=requirement_matches,
-                )
-                existing_notes = job.notes or []
-                new_notes_dicts = [note.model_dump(mode="json") for note in typed_notes]
-                job.notes = existing_notes + new_notes_dicts
-
-            await db.flush()
-
-            # Auto-generate cover letter if requested
-            cover_letter_id = None
-            if request.auto_cover_letter and analysis.suggested_role:
-                try:
-                    generation_result = await cover_letter_service.generate(
-                        job=job,
-                        target_role=ModelRoleType(analysis.suggested_role.value),
-                        custom_instructions=None,
-                        tone="professional",
-                        use_rag=True,
-                    )
-
-                    version_query = select(sqlfunc.coalesce(sqlfunc.max(CoverLetterModel.version), 0)).where(
-                        CoverLetterModel.job_id == job.id,
-                        CoverLetterModel.deleted_at.is_(None),
-                    )
-                    current_version = await db.scalar(version_query) or 0
-
-                    await db.execute(
-                        update(CoverLetterModel)
-                        .where(CoverLetterModel.job_id == job.id, CoverLetterModel.is_current == True)
-                        .values(is_current=False)
-                    )
-
-                    cover_letter = CoverLetterModel(
-                        job_id=job.id,
-                        content=generation_result["content"],
-                        target_role=generation_result["target_role"],
-                        generation_prompt=generation_result["generation_prompt"],
-                        model_used=generation_result["model_used"],
-                        version=current_version + 1,
-                        is_current=True,
-                        rag_evidence=generation_result.get("rag_evidence"),
-                        rag_context_used=generation_result.get("rag_context_used", False),
-                    )
-                    db.add(cover_letter)
-                    await db.flush()
-                    await db.refresh(cover_letter)
-                    cover_letter_id = cover_letter.id
-                    cover_letters_generated += 1
-                except Exception as e:
-                    logger.warning("batch_cover_letter_failed", job_id=str(job.id), error=str(e))
-
-            results.append(BatchAnalyzeJobResult(
-                job_id=job.id,
-                title=job.title,
-                company=job.company,
-                success=True,
-                priority=analysis.suggested_priority,
-                suggested_role=RoleType(analysis.suggested_role.value) if analysis.suggested_role else None,
-                cover_letter_id=cover_letter_id,
-            ))
-            successful += 1
-
-            logger.info(
-                "batch_job_analyzed",
-                job_id=str(job.id),
-                title=job.title,
-                priority=analysis.suggested_priority,
-                progress=f"{i + 1}/{len(jobs_to_process)}",
-            )
-
-        except Exception as e:
-            results.append(BatchAnalyzeJobResult(
-                job_id=job.id,
-                title=job.title,
-                company=job.company,
-                success=False,
-                error=str(e),
-            ))
-            failed += 1
-            logger.error("batch_job_failed", job_id=str(job.id), error=str(e))
-
-        # Rate limit delay
-        if i < len(jobs_to_process) - 1:
-            await asyncio.sleep(request.delay_seconds)
+    analyzer = BatchAnalyzer(
+        session_factory=session_factory,
+        concurrency=concurrency,
+        rate_per_second=1 / request.delay_seconds,
+        auto_cover_letter=request.auto_cover_letter,
+    )
+    summary = await analyzer.run(jobs_to_process)
 
     logger.info(
         "batch_analyze_complete",
-        total_eligible=len(eligible_jobs),
+        total_eligible=total_eligible,
         processed=len(jobs_to_process),
-        successful=successful,
-        failed=failed,
-        cover_letters_generated=cover_letters_generated,
+        successful=summary.successful,
+        failed=summary.failed,
+        cover_letters_generated=summary.cover_letters_generated,
+        duration_seconds=summary.duration_seconds,
+        throughput_per_minute=summary.throughput_per_minute,
     )
 
     return BatchAnalyzeResponse(
-        total_eligible=len(eligible_jobs),
+        total_eligible=total_eligible,
         processed=len(jobs_to_process),
-        successful=successful,
-        failed=failed,
-        cover_letters_generated=cover_letters_generated,
-        results=results,
+        successful=summary.successful,
+        failed=summary.failed,
+        cover_letters_generated=summary.cover_letters_generated,
+        concurrency=concurrency,
+        duration_seconds=summary.duration_seconds,
+        throughput_per_minute=summary.throughput_per_minute,
+        results=summary.results,
     )
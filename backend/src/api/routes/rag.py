@@ -0,0 +1,65 @@
+"""Resume RAG index endpoints."""
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.api.deps import require_permissions
+from src.config import settings
+from src.schemas import ResumeIndexStatusResponse
+from src.services import sparkles_client
+
+router = APIRouter()
+
+
+def _index_status() -> ResumeIndexStatusResponse:
+    index = sparkles_client.resume_index
+    if index is None:
+        return ResumeIndexStatusResponse(retrieval_mode=settings.rag_retrieval_mode, ready=False)
+    return ResumeIndexStatusResponse(retrieval_mode=settings.rag_retrieval_mode, **index.status())
+
+
+@router.get(
+    "/index",
+    response_model=ResumeIndexStatusResponse,
+    summary="Get resume index status",
+    description="Version, size and sync time of the local resume vector index.",
+    dependencies=[Depends(require_permissions(["rag:read"]))],
+)
+async def get_resume_index() -> ResumeIndexStatusResponse:
+    """Get the local resume index status."""
+    return _index_status()
+
+
+@router.post(
+    "/index/refresh",
+    response_model=ResumeIndexStatusResponse,
+    summary="Refresh resume index",
+    description=(
+        "Re-sync the local resume vector index from the Sparkles Supabase "
+        "chunks. Run after the resume corpus changes; other workers pick "
+        "the new version up on their next query."
+    ),
+    dependencies=[Depends(require_permissions(["rag:write"]))],
+)
+async def refresh_resume_index() -> ResumeIndexStatusResponse:
+    """Copy the resume chunks and vectors from Supabase into the local index."""
+    if sparkles_client.resume_index is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Local resume index is disabled (RAG_RETRIEVAL_MODE=supabase)",
+        )
+    if not sparkles_client.is_configured:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Sparkles is not configured",
+        )
+    try:
+        await sparkles_client.sync_resume_index()
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Could not read resume chunks from Supabase: {e}",
+        ) from e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    return _index_status()
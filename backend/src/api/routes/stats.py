@@ -0,0 +1,35 @@
+"""Dashboard statistics endpoints."""
+
+from fastapi import APIRouter, Depends
+
+from src.api.deps import DbSession, require_permissions
+from src.schemas import DashboardStatsResponse, DescriptionStats
+from src.services import get_job_stats
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=DashboardStatsResponse,
+    summary="Get dashboard statistics",
+    description=(
+        "Counts of live jobs by status, job board, Easy Apply and description "
+        "completeness, read from a summary table kept current by database "
+        "triggers on every job write."
+    ),
+    dependencies=[Depends(require_permissions(["jobs:read"]))],
+)
+async def get_dashboard_stats(db: DbSession) -> DashboardStatsResponse:
+    """Get every dashboard counter in one read."""
+    stats = await get_job_stats(db)
+    return DashboardStatsResponse(
+        total_jobs=stats.total,
+        by_status=dict(stats.by_status),
+        by_job_board={board or "unknown": count for board, count in stats.by_job_board.items()},
+        easy_apply_jobs=stats.easy_apply,
+        applied_jobs=stats.applied,
+        descriptions=DescriptionStats(
+            **{state: stats.by_description_state[state] for state in DescriptionStats.model_fields}
+        ),
+    )
@@ -0,0 +1,88 @@
+"""Background task status endpoints."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+
+from src.api.deps import DbSession, require_permissions
+from src.models import BackgroundTask, TaskKind, TaskStatus
+from src.schemas import TaskResponse, TaskResultResponse
+from src.services import task_queue
+
+router = APIRouter()
+
+
+async def _get_task_or_404(db: DbSession, task_id: UUID) -> BackgroundTask:
+    task = await task_queue.get(db, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task with id {task_id} not found",
+        )
+    return task
+
+
+@router.get(
+    "",
+    response_model=list[TaskResponse],
+    summary="List tasks",
+    description="List recent background tasks, newest first.",
+    dependencies=[Depends(require_permissions(["jobs:read"]))],
+)
+async def list_tasks(
+    db: DbSession,
+    task_status: Annotated[TaskStatus | None, Query(alias="status")] = None,
+    kind: TaskKind | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> list[BackgroundTask]:
+    """List background tasks."""
+    query = select(BackgroundTask)
+    if task_status:
+        query = query.where(BackgroundTask.status == task_status.value)
+    if kind:
+        query = query.where(BackgroundTask.kind == kind.value)
+    query = query.order_by(BackgroundTask.created_at.desc()).limit(limit)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+@router.get(
+    "/{task_id}",
+    response_model=TaskResponse,
+    summary="Get task status",
+    description="Poll the status, attempt count and last error of a background task.",
+    dependencies=[Depends(require_permissions(["jobs:read"]))],
+)
+async def get_task(
+    db: DbSession,
+    task_id: UUID,
+) -> BackgroundTask:
+    """Get a background task's status."""
+    return await _get_task_or_404(db, task_id)
+
+
+@router.get(
+    "/{task_id}/result",
+    response_model=TaskResultResponse,
+    summary="Get task result",
+    description=(
+        "Get the result of a finished task. The result has the same shape as the "
+        "synchronous endpoint's response. Returns 409 while the task is still "
+        "queued or running."
+    ),
+    dependencies=[Depends(require_permissions(["jobs:read"]))],
+)
+async def get_task_result(
+    db: DbSession,
+    task_id: UUID,
+) -> BackgroundTask:
+    """Get a finished background task's result."""
+    task = await _get_task_or_404(db, task_id)
+    if task.status not in (TaskStatus.SUCCEEDED.value, TaskStatus.FAILED.value):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Task is still {task.status}",
+        )
+    return task
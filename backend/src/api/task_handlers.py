@@ -0,0 +1,93 @@
+"""Background task handlers.
+
+Each handler replays the synchronous endpoint inside the worker's session,
+so queued and inline requests share one code path and one result shape.
+Importing this module registers the handlers on ``task_queue``.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+
+from src.api.routes.jobs import (
+    analyze_job_fit,
+    batch_analyze_jobs,
+    bulk_ingest_jobs,
+    generate_cover_letter,
+)
+from src.models import TaskKind
+from src.schemas import (
+    BatchAnalyzeRequest,
+    CoverLetterCreate,
+    CoverLetterResponse,
+    JobBulkIngestRequest,
+)
+from src.services import TaskContext, TaskPermanentError, task_queue
+
+
+@contextmanager
+def _client_errors_are_permanent() -> Iterator[None]:
+    """Don't retry requests the endpoint rejected (404, 400, ...)."""
+    try:
+        yield
+    except HTTPException as exc:
+        if exc.status_code < 500:
+            raise TaskPermanentError(str(exc.detail)) from exc
+        raise
+
+
+@task_queue.register(TaskKind.ANALYZE_JOB)
+async def run_analyze_job(ctx: TaskContext) -> dict[str, Any]:
+    """Run POST /jobs/{id}/analyze."""
+    with _client_errors_are_permanent():
+        response = await analyze_job_fit(
+            db=ctx.session,
+            job_id=UUID(ctx.payload["job_id"]),
+            apply_suggestions=ctx.payload.get("apply_suggestions", False),
+            use_ai=ctx.payload.get("use_ai", True),
+            use_rag=ctx.payload.get("use_rag", True),
+            auto_cover_letter=ctx.payload.get("auto_cover_letter", False),
+            background=False,
+        )
+    return response.model_dump(mode="json")
+
+
+@task_queue.register(TaskKind.GENERATE_COVER_LETTER)
+async def run_generate_cover_letter(ctx: TaskContext) -> dict[str, Any]:
+    """Run POST /jobs/{id}/cover-letter."""
+    with _client_errors_are_permanent():
+        cover_letter = await generate_cover_letter(
+            db=ctx.session,
+            job_id=UUID(ctx.payload["job_id"]),
+            request=CoverLetterCreate.model_validate(ctx.payload["request"]),
+            background=False,
+        )
+    return CoverLetterResponse.model_validate(cover_letter).model_dump(mode="json")
+
+
+@task_queue.register(TaskKind.BULK_INGEST)
+async def run_bulk_ingest(ctx: TaskContext) -> dict[str, Any]:
+    """Run POST /jobs/bulk."""
+    with _client_errors_are_permanent():
+        response = await bulk_ingest_jobs(
+            db=ctx.session,
+            request=JobBulkIngestRequest.model_validate(ctx.payload),
+            background=False,
+        )
+    return response.model_dump(mode="json")
+
+
+@task_queue.register(TaskKind.BATCH_ANALYZE)
+async def run_batch_analyze(ctx: TaskContext) -> dict[str, Any]:
+    """Run POST /jobs/analyze-all."""
+    with _client_errors_are_permanent():
+        response = await batch_analyze_jobs(
+            db=ctx.session,
+            session_factory=ctx.session_factory,
+            request=BatchAnalyzeRequest.model_validate(ctx.payload),
+            background=False,
+        )
+    return response.model_dump(mode="json")
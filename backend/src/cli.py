@@ -10,7 +10,7 @@ from sqlalchemy import select, update, func
 from src.automation.linkedin_apply import LinkedInApply
 from src.config.database import AsyncSessionLocal
 from src.models import Job, JobStatus, RoleType, CoverLetter
-from src.services import job_scraper, cover_letter_service
+from src.services import job_scraper, cover_letter_service, source_archive
 
 app = typer.Typer()
 console = Console()
@@ -65,7 +65,7 @@ def add_job(url: str, role: str | None = None, source: str | None = None, notes:
                 job_board=source or scraped.source,
                 job_board_id=scraped.source_id,
                 description_raw=scraped.description,
-                source_html=scraped.raw_html,
+                source=await source_archive.build(scraped.raw_html),
                 target_role=target_role,
                 notes=notes,
             )
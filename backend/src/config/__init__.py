@@ -1,4 +1,4 @@
 from .settings import settings
-from .database import get_db, engine, AsyncSessionLocal
+from .database import get_db, get_session_factory, engine, AsyncSessionLocal
 
-__all__ = ["settings", "get_db", "engine", "AsyncSessionLocal"]
+__all__ = ["settings", "get_db", "get_session_factory", "engine", "AsyncSessionLocal"]
@@ -20,9 +20,18 @@ class Settings(BaseSettings):
 
     # API Authentication
     api_key: str = "change-me-in-production"
+    # Agent key lookups are cached per process; any agents write clears the
+    # cache in every worker (LISTEN/NOTIFY), the TTLs bound staleness otherwise
+    api_key_cache_enabled: bool = True
+    api_key_cache_ttl_seconds: float = 60.0
+    api_key_negative_cache_ttl_seconds: float = 10.0
+    api_key_cache_max_size: int = 1024
 
     # Anthropic API
     anthropic_api_key: str = ""
+    anthropic_timeout_seconds: float = 90.0
+    anthropic_max_connections: int = 10
+    anthropic_max_retries: int = 2
 
     # OpenAI API (for embeddings in RAG)
     openai_api_key: str = ""
@@ -35,6 +44,66 @@ class Settings(BaseSettings):
     rag_similarity_threshold: float = 0.5
     rag_max_results: int = 8
     rag_timeout_seconds: int = 5
+    # Upper bound for the adaptive number of requirement searches in flight
+    rag_max_concurrency: int = 16
+    # Stored per-job requirement matches are reused for at most this long
+    rag_match_ttl_seconds: int = 7 * 24 * 60 * 60
+    # "local" searches an in-process copy of the resume chunks (synced from
+    # Supabase on first use), falling back to the Supabase RPC without one
+    rag_retrieval_mode: Literal["local", "supabase"] = "local"
+    rag_index_dir: str = "data/resume_index"
+    sparkles_chunks_table: str = "resume_chunks"
+
+    # Embeddings (OpenAI), cached on disk per model
+    embedding_model: str = "text-embedding-3-small"
+    embedding_batch_size: int = 256
+    embedding_cache_enabled: bool = True
+    embedding_cache_dir: str = "data/embedding_cache"
+    embedding_cache_dtype: Literal["float16", "float32"] = "float16"
+
+    # Scraping
+    scrape_max_concurrency: int = 10
+    scrape_per_host_concurrency: int = 2
+    scrape_max_connections: int = 20
+    scrape_keepalive_seconds: float = 30.0
+    scrape_cache_enabled: bool = True
+    scrape_cache_dir: str = "data/scrape_cache"
+    scrape_cache_ttl_seconds: int = 7 * 24 * 60 * 60
+    scrape_cache_max_mb: int = 256
+    scrape_parser_backend: Literal["fast", "bs4"] = "fast"
+
+    # CPU-bound work (parsing, rule-based analysis); 0 runs it inline
+    cpu_pool_workers: int = 2
+
+    # AI analysis result cache
+    analysis_cache_max_size: int = 500
+    analysis_cache_persist: bool = True
+    analysis_cache_path: str = "data/analysis_cache.sqlite3"
+    analysis_cache_key_mode: Literal["job", "content"] = "content"
+
+    # Near-duplicate job detection
+    duplicate_detection_enabled: bool = True
+    duplicate_similarity_threshold: float = 0.8
+    duplicate_index_sync_seconds: float = 5.0
+
+    # Job list search: "fulltext" uses the FTS and trigram indexes,
+    # "substring" the original ILIKE scan
+    job_search_mode: Literal["fulltext", "substring"] = "fulltext"
+    # Job list totals: "exact" counts every call, "estimated" uses the
+    # planner's row estimate, "cached" reuses counts until jobs change
+    job_list_count_mode: Literal["exact", "estimated", "cached"] = "cached"
+    job_count_cache_ttl_seconds: float = 60.0
+
+    # Batch analysis
+    batch_analyze_concurrency: int = 4
+
+    # Background task queue
+    task_worker_enabled: bool = True
+    task_worker_concurrency: int = 2
+    task_poll_interval_seconds: float = 1.0
+    task_visibility_timeout_seconds: int = 300
+    task_max_attempts: int = 3
+    task_retry_backoff_seconds: float = 10.0
 
     # LinkedIn Credentials (for browser automation)
     linkedin_email: str = ""
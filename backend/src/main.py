@@ -1,25 +1,65 @@
 """FastAPI application entry point."""
 
 import time
+from contextlib import asynccontextmanager
+
 import uvicorn
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.routes import api_router
-from src.config import settings
+from src.api import task_handlers  # noqa: F401 - registers task handlers
+from src.config import AsyncSessionLocal, settings
 from src.config.logging import setup_logging
 from src.middleware import add_request_id_middleware, init_rate_limiting, register_error_handlers
+from src.services import (
+    TaskWorker,
+    agent_change_listener,
+    ai_analysis_service,
+    ai_analysis_service_enhanced,
+    cover_letter_service,
+    cpu_executor,
+    job_scraper,
+    task_queue,
+)
 
 setup_logging()
 logger = structlog.get_logger("api")
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Run the in-process task worker; release pooled connections and worker processes on shutdown."""
+    worker = None
+    if settings.task_worker_enabled:
+        worker = TaskWorker(
+            task_queue,
+            AsyncSessionLocal,
+            concurrency=settings.task_worker_concurrency,
+            poll_interval_seconds=settings.task_poll_interval_seconds,
+        )
+        await worker.start()
+    if settings.api_key_cache_enabled:
+        await agent_change_listener.start()
+    yield
+    if worker is not None:
+        await worker.stop()
+    await agent_change_listener.stop()
+    await ai_analysis_service.aclose()
+    await ai_analysis_service_enhanced.aclose()
+    await cover_letter_service.aclose()
+    await job_scraper.aclose()
+    cpu_executor.shutdown()
+
+
 app = FastAPI(
     title="Meridian Job Tracker",
     description="Job tracking and application automation API",
     version="0.1.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    lifespan=lifespan,
 )
 
 add_request_id_middleware(app)
@@ -7,6 +7,10 @@ from .application_attempt import ApplicationAttempt
 from .agent import Agent
 from .webhook import Webhook
 from .job_contact import JobContact
+from .job_source import JobSource
+from .job_stat import JobStatCount
+from .job_rag_match import JobRAGMatch
+from .background_task import BackgroundTask, TaskKind, TaskStatus
 from .decline_reason import (
     UserDeclineReason,
     CompanyDeclineReason,
@@ -27,6 +31,12 @@ __all__ = [
     "Agent",
     "Webhook",
     "JobContact",
+    "JobSource",
+    "JobStatCount",
+    "JobRAGMatch",
+    "BackgroundTask",
+    "TaskKind",
+    "TaskStatus",
     "UserDeclineReason",
     "CompanyDeclineReason",
     "USER_DECLINE_CATEGORIES",
@@ -2,17 +2,22 @@
 
 import enum
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
 from sqlalchemy import (
     CheckConstraint,
+    Computed,
     DateTime,
     Enum,
+    ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -24,6 +29,7 @@ if TYPE_CHECKING:
     from .cover_letter import CoverLetter
     from .email import Email
     from .job_contact import JobContact
+    from .job_source import JobSource
 
 
 class JobStatus(str, enum.Enum):
@@ -90,6 +96,68 @@ class Job(Base):
     __table_args__ = (
         UniqueConstraint("job_board", "job_board_id", name="uq_job_board_id"),
         CheckConstraint("priority >= 0 AND priority <= 100", name="check_priority_range"),
+        # Near-duplicate index: incremental sync and signature backfill
+        Index("idx_jobs_updated_at", "updated_at"),
+        Index(
+            "idx_jobs_minhash_missing",
+            "id",
+            postgresql_where=text("minhash_signature IS NULL AND deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_jobs_minhash_signed_at",
+            "minhash_signed_at",
+            postgresql_where=text("minhash_signed_at IS NOT NULL"),
+        ),
+        Index(
+            "idx_jobs_duplicate_of_id",
+            "duplicate_of_id",
+            postgresql_where=text("duplicate_of_id IS NOT NULL"),
+        ),
+        # Keyset pagination of list_jobs, one per sort key with its tie-breakers.
+        # B-trees scan either way, except salary: NULLS LAST in both
+        # directions needs an index per direction
+        Index("idx_jobs_keyset_updated_at", "updated_at", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_jobs_keyset_created_at", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_jobs_keyset_priority", "priority", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_jobs_keyset_title", "title", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_jobs_keyset_company", "company", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index(
+            "idx_jobs_keyset_salary_asc",
+            text("COALESCE(salary_max, salary_min)"),
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_jobs_keyset_salary_desc",
+            text("COALESCE(salary_max, salary_min) DESC NULLS LAST"),
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Substring search on title/company (ILIKE '%term%'); needs pg_trgm
+        Index(
+            "idx_jobs_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_jobs_company_trgm",
+            "company",
+            postgresql_using="gin",
+            postgresql_ops={"company": "gin_trgm_ops"},
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Description completeness: any length threshold, and the default
+        # "incomplete" list (MIN_DESCRIPTION_LENGTH in description_fetcher)
+        Index("idx_jobs_description_length", "description_length", postgresql_where=text("deleted_at IS NULL")),
+        Index(
+            "idx_jobs_description_incomplete",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL AND description_length < 500"),
+        ),
     )
 
     # Primary key
@@ -125,7 +193,12 @@ class Job(Base):
 
     # Job description
     description_raw: Mapped[str | None] = mapped_column(Text)
-    source_html: Mapped[str | None] = mapped_column(Text)
+    # Generated by Postgres on every write, so filters on completeness don't
+    # read (and decompress) the description itself
+    description_length: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed("length(description_raw)", persisted=True),
+    )
 
     # Compensation (all optional)
     salary_min: Mapped[int | None] = mapped_column(Integer)
@@ -183,6 +256,16 @@ class Job(Base):
     company_decline_reasons: Mapped[list[str] | None] = mapped_column(ARRAY(String(50)))
     decline_notes: Mapped[str | None] = mapped_column(Text)
 
+    # Near-duplicate detection: MinHash signature of title + description, and
+    # the earlier job this one was found to repeat (e.g. cross-posted)
+    minhash_signature: Mapped[bytes | None] = mapped_column(LargeBinary, deferred=True)
+    # When a backfill filled in the signature; such writes leave updated_at alone
+    minhash_signed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), deferred=True)
+    duplicate_of_id: Mapped[UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("jobs.id", ondelete="SET NULL"),
+    )
+
     # Soft delete
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
@@ -206,6 +289,14 @@ class Job(Base):
         back_populates="job",
         cascade="all, delete-orphan",
     )
+    # Archived source page; read it through source_archive, never by lazy load
+    source: Mapped[Optional["JobSource"]] = relationship(
+        "JobSource",
+        back_populates="job",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="raise",
+    )
 
     def __repr__(self) -> str:
         return f"<Job {self.title} at {self.company}>"
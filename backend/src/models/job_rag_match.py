@@ -0,0 +1,43 @@
+"""Stored RAG requirement matches of a job."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.database import Base
+
+
+class JobRAGMatch(Base):
+    """The JD requirement matches last retrieved for a job.
+
+    One row per job, written through services/rag_match_store.py. A row is
+    reused while the job's description (``description_hash``), the
+    requirements matched and the resume corpus (``corpus_version``) are
+    unchanged; ``matches`` holds serialized JDMatchResult objects.
+    """
+
+    __tablename__ = "job_rag_matches"
+
+    job_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    description_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    corpus_version: Mapped[str] = mapped_column(String(100), nullable=False)
+    requirements: Mapped[list[str]] = mapped_column(JSONB, nullable=False)
+    threshold: Mapped[float] = mapped_column(Float, nullable=False)
+    limit_per_req: Mapped[int] = mapped_column(Integer, nullable=False)
+    matches: Mapped[list[dict]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<JobRAGMatch {self.job_id} ({len(self.matches)} matches, {self.corpus_version})>"
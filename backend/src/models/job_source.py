@@ -0,0 +1,72 @@
+"""Archived source page of a job, kept out of the jobs table."""
+
+import hashlib
+import zlib
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary, String
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.config.database import Base
+
+if TYPE_CHECKING:
+    from .job import Job
+
+
+def compress_html(html: str) -> tuple[bytes, str, int]:
+    """Compress a page for storage.
+
+    Returns:
+        (zlib-compressed UTF-8 bytes, SHA-256 hex digest, uncompressed size)
+    """
+    data = html.encode("utf-8")
+    return zlib.compress(data), hashlib.sha256(data).hexdigest(), len(data)
+
+
+def decompress_html(html_zlib: bytes) -> str:
+    """Inverse of compress_html."""
+    return zlib.decompress(html_zlib).decode("utf-8")
+
+
+class JobSource(Base):
+    """The raw HTML a job was scraped from, zlib-compressed.
+
+    Only reprocessing reads it, so it lives in its own table where it
+    doesn't widen scans, vacuums or row loads of jobs. The column is stored
+    EXTERNAL (out of line, not recompressed by TOAST).
+    """
+
+    __tablename__ = "job_sources"
+
+    job_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        nullable=False,
+    )
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    original_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    html_zlib: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    job: Mapped["Job"] = relationship("Job", back_populates="source")
+
+    @classmethod
+    def from_html(cls, html: str) -> "JobSource":
+        """Build a source row from a page (compresses on the calling thread)."""
+        html_zlib, content_hash, original_size = compress_html(html)
+        return cls(html_zlib=html_zlib, content_hash=content_hash, original_size=original_size)
+
+    @property
+    def html(self) -> str:
+        """The decompressed page."""
+        return decompress_html(self.html_zlib)
+
+    def __repr__(self) -> str:
+        return f"<JobSource {self.job_id} ({self.original_size} bytes)>"
@@ -0,0 +1,30 @@
+"""Dashboard counter model, maintained by database triggers."""
+
+from sqlalchemy import BigInteger, Boolean, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.database import Base
+
+
+class JobStatCount(Base):
+    """Live jobs per (status, job board, easy apply, description state).
+
+    Rows are written only by the update_job_stat_counts trigger on jobs
+    (migration 016); the application reads them. ``job_board`` is '' for
+    jobs without a board, and ``description_state`` is one of missing,
+    incomplete, partial or complete.
+    """
+
+    __tablename__ = "job_stat_counts"
+
+    status: Mapped[str] = mapped_column(String(50), primary_key=True)
+    job_board: Mapped[str] = mapped_column(String(50), primary_key=True)
+    is_easy_apply: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    description_state: Mapped[str] = mapped_column(String(20), primary_key=True)
+    job_count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<JobStatCount {self.status}/{self.job_board or '-'}/"
+            f"{self.is_easy_apply}/{self.description_state}: {self.job_count}>"
+        )
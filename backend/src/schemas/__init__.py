@@ -20,6 +20,11 @@ from .job import (
     BatchAnalyzeRequest,
     BatchAnalyzeResponse,
     BatchAnalyzeJobResult,
+    DuplicateJob,
+    DuplicateCluster,
+    DuplicateClustersResponse,
+    JobSummary,
+    JobSummaryListResponse,
 )
 from .cover_letter import (
     CoverLetterCreate,
@@ -30,7 +35,7 @@ from .email import (
     EmailCreate,
     EmailResponse,
 )
-from .agent import AgentCreate, AgentResponse
+from .agent import AgentCreate, AgentResponse, AgentUpdate
 from .webhook import WebhookCreate, WebhookResponse
 from .discovery import (
     LinkedInSearchRequest,
@@ -51,6 +56,9 @@ from .job_contact import (
     JobContactResponse,
     ContactType,
 )
+from .background_task import TaskResponse, TaskResultResponse
+from .stats import DashboardStatsResponse, DescriptionStats
+from .rag import ResumeIndexStatusResponse
 
 __all__ = [
     # Job schemas
@@ -73,6 +81,11 @@ __all__ = [
     "BatchAnalyzeRequest",
     "BatchAnalyzeResponse",
     "BatchAnalyzeJobResult",
+    "DuplicateJob",
+    "DuplicateCluster",
+    "DuplicateClustersResponse",
+    "JobSummary",
+    "JobSummaryListResponse",
     # Cover letter schemas
     "CoverLetterCreate",
     "CoverLetterResponse",
@@ -83,6 +96,7 @@ __all__ = [
     # Agent schemas
     "AgentCreate",
     "AgentResponse",
+    "AgentUpdate",
     # Webhook schemas
     "WebhookCreate",
     "WebhookResponse",
@@ -102,4 +116,12 @@ __all__ = [
     "JobContactUpdate",
     "JobContactResponse",
     "ContactType",
+    # Background task schemas
+    "TaskResponse",
+    "TaskResultResponse",
+    # Stats schemas
+    "DashboardStatsResponse",
+    "DescriptionStats",
+    # RAG schemas
+    "ResumeIndexStatusResponse",
 ]
@@ -13,6 +13,13 @@ class AgentCreate(BaseModel):
     permissions: list[str] = Field(default_factory=list)
 
 
+class AgentUpdate(BaseModel):
+    """Schema for updating an agent (all fields optional)."""
+
+    permissions: list[str] | None = None
+    is_active: bool | None = None
+
+
 class AgentResponse(BaseModel):
     """Schema for agent response (includes API key on creation)."""
 
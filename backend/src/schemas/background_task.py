@@ -0,0 +1,37 @@
+"""Pydantic schemas for background task API."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TaskResponse(BaseModel):
+    """Status of a queued background task."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    kind: str
+    status: str
+    attempts: int
+    max_attempts: int
+    error: str | None = None
+    run_after: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class TaskResultResponse(BaseModel):
+    """Outcome of a finished background task."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    kind: str
+    status: str
+    result: dict[str, Any] | None = None
+    error: str | None = None
@@ -172,6 +172,7 @@ class JobResponse(JobBase):
     user_decline_reasons: list[str] | None = None
     company_decline_reasons: list[str] | None = None
     decline_notes: str | None = None
+    duplicate_of_id: UUID | None = None
     contacts: list[JobContactResponse] = []
     contact_count: int = 0
 
@@ -203,14 +204,94 @@ class JobBulkStatusResponse(BaseModel):
     missing: list[UUID]
 
 
+class DuplicateJob(BaseModel):
+    """Schema for a job in a near-duplicate cluster."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    title: str
+    company: str
+    url: str | None = None
+    job_board: str | None = None
+    status: JobStatus
+    created_at: datetime
+    duplicate_of_id: UUID | None = None
+
+
+class DuplicateCluster(BaseModel):
+    """Schema for a group of jobs that are near-duplicates of each other."""
+
+    jobs: list[DuplicateJob]
+
+
+class DuplicateClustersResponse(BaseModel):
+    """Schema for near-duplicate clusters response."""
+
+    clusters: list[DuplicateCluster]
+    total_clusters: int
+    total_jobs: int
+
+
 class JobListResponse(BaseModel):
     """Schema for paginated job list response."""
 
     items: list[JobResponse]
     total: int
+    total_estimated: bool = False  # total is the planner's estimate (count=estimated)
+    page: int
+    page_size: int
+    total_pages: int
+    next_cursor: str | None = None  # Pass as cursor to fetch the next page
+
+
+class JobSummary(BaseModel):
+    """Schema for a job in a summary list view.
+
+    Leaves out the description, notes and contacts. With ``fields``, only
+    the requested fields (and id) are set and serialized.
+    """
+
+    id: UUID
+    title: str | None = None
+    company: str | None = None
+    location: str | None = None
+    work_location_type: WorkLocationType | None = None
+    url: str | None = None
+    job_board: str | None = None
+    salary_min: int | None = None
+    salary_max: int | None = None
+    salary_currency: str | None = None
+    employment_type: EmploymentType | None = None
+    status: JobStatus | None = None
+    status_changed_at: datetime | None = None
+    target_role: RoleType | None = None
+    priority: int | None = None
+    tags: list[str] | None = None
+    posted_at: datetime | None = None
+    applied_at: datetime | None = None
+    is_easy_apply: bool | None = None
+    is_favorite: bool | None = None
+    is_perfect_fit: bool | None = None
+    is_ai_forward: bool | None = None
+    is_location_compatible: bool | None = None
+    duplicate_of_id: UUID | None = None
+    description_length: int | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    contact_count: int | None = None
+
+
+class JobSummaryListResponse(BaseModel):
+    """Schema for paginated job list response in summary view."""
+
+    items: list[JobSummary]
+    total: int
+    total_estimated: bool = False
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
 
 
 class RoleScoreResponse(BaseModel):
@@ -257,7 +338,16 @@ class BatchAnalyzeRequest(BaseModel):
         default=1.0,
         ge=0.1,
         le=10.0,
-        description="Delay between jobs for rate limiting",
+        description=(
+            "Rate limit: on average one job starts every delay_seconds "
+            "(token bucket, bursts up to `concurrency`)"
+        ),
+    )
+    concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        le=10,
+        description="Maximum analyses in flight (defaults to BATCH_ANALYZE_CONCURRENCY)",
     )
     auto_cover_letter: bool = Field(
         default=False,
@@ -276,6 +366,9 @@ class BatchAnalyzeJobResult(BaseModel):
     suggested_role: RoleType | None = None
     cover_letter_id: UUID | None = None
     error: str | None = None
+    latency_ms: float | None = Field(
+        default=None, description="Time from job start to commit, in milliseconds"
+    )
 
 
 class BatchAnalyzeResponse(BaseModel):
@@ -288,6 +381,11 @@ class BatchAnalyzeResponse(BaseModel):
     cover_letters_generated: int = Field(
         default=0, description="Number of cover letters generated"
     )
+    concurrency: int = Field(default=1, description="Maximum analyses in flight")
+    duration_seconds: float = Field(default=0.0, description="Wall-clock time of the batch")
+    throughput_per_minute: float = Field(
+        default=0.0, description="Processed jobs per minute over the batch"
+    )
     results: list[BatchAnalyzeJobResult] = Field(
         default_factory=list, description="Results for each job"
     )
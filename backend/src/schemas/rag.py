@@ -0,0 +1,17 @@
+"""Pydantic schemas for the local resume RAG index."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ResumeIndexStatusResponse(BaseModel):
+    """State of the in-process resume vector index."""
+
+    retrieval_mode: str  # "local" or "supabase"
+    ready: bool
+    version: str | None = None  # Fingerprint of the indexed chunks and model
+    model: str | None = None
+    chunks: int = 0
+    dimensions: int | None = None
+    synced_at: datetime | None = None
@@ -0,0 +1,23 @@
+"""Pydantic schemas for dashboard statistics."""
+
+from pydantic import BaseModel
+
+
+class DescriptionStats(BaseModel):
+    """Live jobs by description completeness."""
+
+    missing: int
+    incomplete: int  # Shorter than the minimum length
+    partial: int  # At least the minimum, shorter than the target length
+    complete: int  # At least the target length
+
+
+class DashboardStatsResponse(BaseModel):
+    """Every dashboard counter, from the job_stat_counts summary table."""
+
+    total_jobs: int
+    by_status: dict[str, int]
+    by_job_board: dict[str, int]
+    easy_apply_jobs: int
+    applied_jobs: int
+    descriptions: DescriptionStats
@@ -1,10 +1,17 @@
 """Business logic services."""
 
 from .resume_service import resume_service, ResumeService
+from .cpu_executor import cpu_executor, CPUExecutor
 from .jd_analyzer import detect_and_parse_jd, JDAnalysisResult, ExtractedRequirements
 from .cover_letter_service import cover_letter_service, CoverLetterService
 from .job_scraper import job_scraper, JobScraper, ScrapedJob, JobScrapeError
-from .job_analysis_service import analyze_job, analyze_job_with_ai, JobAnalysisResult as JobFitAnalysis
+from .html_cache import HTMLCache
+from .job_analysis_service import (
+    analyze_job,
+    analyze_job_with_ai,
+    analyze_jobs_batch,
+    JobAnalysisResult as JobFitAnalysis,
+)
 from .ai_analysis_service import (
     ai_analysis_service,
     AIAnalysisService,
@@ -13,12 +20,40 @@ from .ai_analysis_service import (
     generate_typed_notes,
 )
 from .analysis_cache import analysis_cache, AnalysisCache
+from .duplicate_index import duplicate_index, DuplicateIndex, NearDuplicate
+from .job_search import search_filter, search_rank, SearchMode
+from .job_counts import job_count_cache, JobCountCache, CountMode, count_jobs
+from .job_pagination import (
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    keyset_order,
+)
+from .source_archive import source_archive, SourceArchive
+from .job_stats import get_job_stats, JobStats
+from .embedding_cache import EmbeddingCache
+from .adaptive_limit import AIMDLimit
+from .resume_index import ResumeVectorIndex, ResumeChunk
 from .sparkles_client import sparkles_client, SparklesClient
+from .rag_match_store import rag_match_store, RAGMatchStore
 from .description_fetcher import description_fetcher, DescriptionFetcherService
+from .batch_analysis import BatchAnalyzer, BatchRunSummary, TokenBucket
+from .api_key_cache import (
+    api_key_cache,
+    agent_change_listener,
+    APIKeyCache,
+    AgentChangeListener,
+    AgentIdentity,
+)
+from .task_queue import task_queue, TaskQueue, TaskWorker, TaskContext, TaskPermanentError
 
 __all__ = [
     "resume_service",
     "ResumeService",
+    "cpu_executor",
+    "CPUExecutor",
     "detect_and_parse_jd",
     "JDAnalysisResult",
     "ExtractedRequirements",
@@ -28,8 +63,10 @@ __all__ = [
     "JobScraper",
     "ScrapedJob",
     "JobScrapeError",
+    "HTMLCache",
     "analyze_job",
     "analyze_job_with_ai",
+    "analyze_jobs_batch",
     "JobFitAnalysis",
     "ai_analysis_service",
     "AIAnalysisService",
@@ -38,8 +75,47 @@ __all__ = [
     "generate_typed_notes",
     "analysis_cache",
     "AnalysisCache",
+    "duplicate_index",
+    "DuplicateIndex",
+    "NearDuplicate",
+    "search_filter",
+    "search_rank",
+    "SearchMode",
+    "job_count_cache",
+    "JobCountCache",
+    "CountMode",
+    "count_jobs",
+    "Cursor",
+    "InvalidCursorError",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_filter",
+    "keyset_order",
+    "source_archive",
+    "SourceArchive",
+    "get_job_stats",
+    "JobStats",
+    "EmbeddingCache",
+    "AIMDLimit",
+    "ResumeVectorIndex",
+    "ResumeChunk",
     "sparkles_client",
     "SparklesClient",
+    "rag_match_store",
+    "RAGMatchStore",
     "description_fetcher",
     "DescriptionFetcherService",
+    "BatchAnalyzer",
+    "BatchRunSummary",
+    "TokenBucket",
+    "api_key_cache",
+    "agent_change_listener",
+    "APIKeyCache",
+    "AgentChangeListener",
+    "AgentIdentity",
+    "task_queue",
+    "TaskQueue",
+    "TaskWorker",
+    "TaskContext",
+    "TaskPermanentError",
 ]
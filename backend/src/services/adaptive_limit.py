@@ -0,0 +1,122 @@
+"""Adaptive (AIMD) concurrency limit.
+
+Callers hold a slot while a request is in flight; at most ``limit`` slots
+are held at once and a waiter starts the moment a slot frees up. The
+limit follows the backend the way TCP congestion control follows a link:
+
+- every request that succeeds in normal time adds ``1 / limit``, so the
+  limit grows by about one per round of requests (additive increase);
+- a request that fails, is cancelled, or takes more than
+  ``latency_tolerance`` times the baseline latency multiplies the limit by
+  ``backoff`` (multiplicative decrease). Requests that were already in
+  flight when the limit was cut don't cut it again, so one slow spell
+  halves it once rather than collapsing it to the minimum.
+
+The baseline is the fastest recent latency; it drifts up slowly so a
+backend that gets permanently slower is not treated as overloaded forever.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+# Weight of each new latency in the upward drift of the baseline
+BASELINE_DRIFT = 0.05
+
+
+class AIMDLimit:
+    """Concurrency limit with additive increase and multiplicative decrease."""
+
+    def __init__(
+        self,
+        initial: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_floor: float = 0.01,
+    ):
+        """Create a limit.
+
+        Args:
+            initial: Starting limit
+            min_limit: Lowest the limit goes
+            max_limit: Highest the limit goes
+            backoff: Factor applied to the limit on overload
+            latency_tolerance: Latency, as a multiple of the baseline, that counts as overload
+            latency_floor: Latency in seconds below which a request never counts as overload
+        """
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.latency_floor = latency_floor
+        self.baseline_latency: float | None = None
+        self.in_flight = 0
+        self._decreased_at = 0.0
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def _slots(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    def _get_condition(self) -> asyncio.Condition:
+        # A condition belongs to one event loop; start over in a new one
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for one request, recording its latency and outcome."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self._slots)
+            self.in_flight += 1
+
+        started_at = time.monotonic()
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        finally:
+            self.record(started_at, time.monotonic() - started_at, succeeded)
+            self.in_flight -= 1
+            async with condition:
+                condition.notify(self._slots - self.in_flight)
+
+    def record(self, started_at: float, latency: float, succeeded: bool) -> None:
+        """Adjust the limit for one finished request."""
+        overloaded = not succeeded or (
+            self.baseline_latency is not None
+            and latency > max(self.baseline_latency * self.latency_tolerance, self.latency_floor)
+        )
+        if succeeded:
+            if self.baseline_latency is None or latency < self.baseline_latency:
+                self.baseline_latency = latency
+            else:
+                self.baseline_latency += (latency - self.baseline_latency) * BASELINE_DRIFT
+
+        if not overloaded:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        elif started_at >= self._decreased_at:
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+            self._decreased_at = time.monotonic()
+
+    def stats(self) -> dict:
+        """Get limiter state."""
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "baseline_latency_ms": (
+                round(self.baseline_latency * 1000, 2) if self.baseline_latency is not None else None
+            ),
+        }
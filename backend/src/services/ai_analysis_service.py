@@ -1,11 +1,14 @@
 """AI-powered job analysis service using Claude."""
 
+import asyncio
+import hashlib
 import json
 import re
 from datetime import datetime, timezone
 
+import httpx
 import structlog
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 from src.config import settings
 from src.models import Job
@@ -34,6 +37,9 @@ from src.schemas.job_note import JobNoteEntry, NoteSource, NoteType
 
 logger = structlog.get_logger(__name__)
 
+# Claude model used for job analysis
+ANALYSIS_MODEL = "claude-sonnet-4-20250514"
+
 # System prompt with candidate profile
 SYSTEM_PROMPT = """You are a job analysis assistant for Tom Hundley, an experienced technology executive seeking AI-focused roles.
 
@@ -149,17 +155,55 @@ Location rules:
 - Hybrid/onsite requiring relocation = check if reasonable"""
 
 
+def prompt_version(model: str = ANALYSIS_MODEL) -> str:
+    """Identify the analysis prompt and model; changes whenever either does.
+
+    Cached analyses are keyed by this, so editing SYSTEM_PROMPT, the user
+    prompt template or the model retires analyses made with the old ones.
+    """
+    template = _build_user_prompt(Job())
+    return hashlib.sha256("\x1f".join([model, SYSTEM_PROMPT, template]).encode()).hexdigest()[:12]
+
+
 class AIAnalysisService:
     """Service for AI-powered job analysis using Claude."""
 
     def __init__(self):
         self.client = Anthropic(api_key=settings.anthropic_api_key) if settings.anthropic_api_key else None
-        self.model = "claude-sonnet-4-20250514"
+        self.model = ANALYSIS_MODEL
+        self.timeout = settings.anthropic_timeout_seconds
+        self._async_client: AsyncAnthropic | None = None
+
+    @property
+    def async_client(self) -> AsyncAnthropic | None:
+        """Lazy-initialize the async Claude client with its own connection pool."""
+        if self._async_client is None and settings.anthropic_api_key:
+            self._async_client = AsyncAnthropic(
+                api_key=settings.anthropic_api_key,
+                max_retries=settings.anthropic_max_retries,
+                timeout=httpx.Timeout(self.timeout, connect=10.0),
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=settings.anthropic_max_connections,
+                        max_keepalive_connections=settings.anthropic_max_connections,
+                    ),
+                ),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client and release its pooled connections."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
 
     def analyze(self, job: Job) -> AIJobAnalysisResult:
         """
         Analyze a job using Claude AI.
 
+        This call blocks the calling thread; async request handlers should
+        use analyze_async instead.
+
         Args:
             job: The job to analyze
 
@@ -210,6 +254,84 @@ class AIAnalysisService:
             )
             raise
 
+    async def analyze_async(
+        self,
+        job: Job,
+        timeout: float | None = None,
+    ) -> AIJobAnalysisResult:
+        """
+        Analyze a job using Claude without blocking the event loop.
+
+        The request runs on the pooled async client and is bounded by an
+        overall deadline (retries included). Cancelling the awaiting task
+        aborts the in-flight HTTP request.
+
+        Args:
+            job: The job to analyze
+            timeout: Deadline in seconds (default from settings)
+
+        Returns:
+            AIJobAnalysisResult with comprehensive analysis
+
+        Raises:
+            ValueError: If Anthropic API key not configured
+            TimeoutError: If the call exceeds the deadline
+            Exception: If API call fails
+        """
+        client = self.async_client
+        if not client:
+            raise ValueError("Anthropic API key not configured")
+
+        logger.info(
+            "ai_analysis_start",
+            job_id=str(job.id),
+            company=job.company,
+            title=job.title,
+        )
+
+        user_prompt = _build_user_prompt(job)
+
+        try:
+            response = await asyncio.wait_for(
+                client.messages.create(
+                    model=self.model,
+                    max_tokens=4000,
+                    system=SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": user_prompt}],
+                ),
+                timeout=timeout or self.timeout,
+            )
+
+            content = response.content[0].text
+            result = self._parse_response(content, job)
+
+            logger.info(
+                "ai_analysis_success",
+                job_id=str(job.id),
+                priority=result.overall_assessment.priority_score,
+                recommendation=result.overall_assessment.recommendation.value,
+            )
+
+            return result
+
+        except asyncio.CancelledError:
+            logger.info("ai_analysis_cancelled", job_id=str(job.id))
+            raise
+        except TimeoutError:
+            logger.error(
+                "ai_analysis_timeout",
+                job_id=str(job.id),
+                timeout_seconds=timeout or self.timeout,
+            )
+            raise
+        except Exception as e:
+            logger.error(
+                "ai_analysis_error",
+                job_id=str(job.id),
+                error=str(e),
+            )
+            raise
+
     def _parse_response(self, content: str, job: Job) -> AIJobAnalysisResult:
         """Parse Claude's JSON response into AIJobAnalysisResult."""
         # Try to extract JSON from response (handle potential markdown wrapping)
@@ -387,6 +509,7 @@ class AIAnalysisServiceEnhanced(AIAnalysisService):
         self,
         job: Job,
         rag_context: str = "",
+        timeout: float | None = None,
     ) -> tuple[AIJobAnalysisResult, CoachingInsights, list[JDMatchResult]]:
         """
         Enhanced analysis with RAG context and coaching insights.
@@ -394,11 +517,13 @@ class AIAnalysisServiceEnhanced(AIAnalysisService):
         Args:
             job: The job to analyze
             rag_context: Pre-built RAG context from SparklesClient
+            timeout: Deadline in seconds (default from settings)
 
         Returns:
             Tuple of (AIJobAnalysisResult, CoachingInsights, JDMatchResults)
         """
-        if not self.client:
+        client = self.async_client
+        if not client:
             raise ValueError("Anthropic API key not configured")
 
         logger.info(
@@ -415,11 +540,14 @@ class AIAnalysisServiceEnhanced(AIAnalysisService):
             user_prompt += COACHING_PROMPT_SECTION.format(rag_context=rag_context)
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=6000,  # Increased for coaching insights
-                system=SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": user_prompt}],
+            response = await asyncio.wait_for(
+                client.messages.create(
+                    model=self.model,
+                    max_tokens=6000,  # Increased for coaching insights
+                    system=SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": user_prompt}],
+                ),
+                timeout=timeout or self.timeout,
             )
 
             content = response.content[0].text
@@ -435,6 +563,9 @@ class AIAnalysisServiceEnhanced(AIAnalysisService):
 
             return result, coaching, []
 
+        except asyncio.CancelledError:
+            logger.info("enhanced_ai_analysis_cancelled", job_id=str(job.id))
+            raise
         except Exception as e:
             logger.error(
                 "enhanced_ai_analysis_error",
@@ -1,20 +1,101 @@
-"""Caching layer for AI job analysis results."""
-
+"""Caching layer for AI job analysis results.
+
+Results are kept in an in-memory LRU in front of an optional SQLite store.
+The store is a single file that every worker process on the host opens, so
+an analysis made by one uvicorn worker (or before a restart) is a cache hit
+for the others instead of another Claude call.
+
+Entries are keyed either per job (job ID + description hash) or, in
+``content`` mode, by a fingerprint of the posting itself, so the same
+posting re-listed under a new ID or cross-posted to another board reuses
+one analysis. Both key kinds include the prompt/model version, so
+changing the prompt retires old entries.
+
+The async service awaits ``get_for_job_async``/``set_for_job_async``, which
+run the store's SQLite I/O in a worker thread; the in-memory tier is
+guarded by a lock for that reason.
+
+Invalidation deletes from the store and bumps a generation counter kept
+in it. Every memory hit compares that counter with the one the memory
+tier was filled under and, if another process has invalidated anything
+since, drops the whole memory tier; the entries still valid are promoted
+again from the store on their next hit.
+"""
+
+import asyncio
 import hashlib
+import re
+import sqlite3
+import threading
 import time
+import unicodedata
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import Dict
+from pathlib import Path
+from typing import Literal
 
 import structlog
 
+from src.config import settings
+from src.models import Job
 from src.schemas.ai_analysis import AIJobAnalysisResult
+from src.services.ai_analysis_service import prompt_version
 
 logger = structlog.get_logger(__name__)
 
 # Cache TTL in seconds (24 hours)
 CACHE_TTL = 24 * 60 * 60
 
+CacheKeyMode = Literal["job", "content"]
+
+# Lines that differ between listings of the same posting without changing it
+_BOILERPLATE_LINES = re.compile(
+    r"^(?:"
+    r".*\bequal (?:opportunity|employment)\b.*"
+    r"|eeo\b.*"
+    r"|apply (?:now|here|today)\b.*"
+    r"|(?:job|req|requisition|posting) ?(?:id|#|number)\b.*"
+    r"|(?:date )?posted\b.*\bago\b.*"
+    r"|share (?:this )?job\b.*"
+    r"|\d+\+? applicants?\b.*"
+    r")$"
+)
+_BULLET = re.compile(r"^[-•*·]+\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str | None) -> str:
+    """Normalize text for fingerprinting: case, Unicode forms and whitespace."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text or "").casefold()).strip()
+
+
+def normalize_description(description: str | None) -> str:
+    """Normalize a job description, dropping boilerplate lines and bullet styles."""
+    lines = []
+    for line in (description or "").splitlines():
+        line = _BULLET.sub("", normalize_text(line))
+        if line and not _BOILERPLATE_LINES.match(line):
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def posting_fingerprint(job: Job) -> str:
+    """Fingerprint of everything about a job that the analysis prompt includes.
+
+    Besides the description, the prompt shows the title, company, location
+    and work/employment type, so the same description posted for a
+    different location gets its own analysis.
+    """
+    parts = [
+        normalize_text(job.title),
+        normalize_text(job.company),
+        normalize_text(job.location),
+        job.work_location_type.value if job.work_location_type else "",
+        job.employment_type.value if job.employment_type else "",
+        normalize_description(job.description_raw),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:32]
+
 
 @dataclass
 class CacheEntry:
@@ -29,18 +110,177 @@ class CacheEntry:
         return time.time() - self.created_at > CACHE_TTL
 
 
+class SQLiteAnalysisStore:
+    """Persistent, process-shared tier of the analysis cache.
+
+    Results are keyed like the in-memory cache. A second table links job IDs
+    to the keys they used, which is the index invalidation goes through (a
+    content key can be shared by several jobs), and a one-row table holds
+    the generation counter invalidations bump. The database runs in WAL
+    mode so concurrent readers in other processes don't block writers.
+    """
+
+    # Expired rows are purged once every this many writes
+    PURGE_EVERY = 100
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection to the store, opened (and the schema created) lazily."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_results ("
+                "key TEXT PRIMARY KEY, description_hash TEXT NOT NULL, "
+                "created_at REAL NOT NULL, result TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_analysis_results_created_at ON analysis_results (created_at)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_result_jobs ("
+                "job_id TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (job_id, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_analysis_result_jobs_key ON analysis_result_jobs (key)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache_generation ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), value INTEGER NOT NULL)"
+            )
+            conn.execute("INSERT OR IGNORE INTO analysis_cache_generation (id, value) VALUES (0, 0)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Load an entry, or None if the store doesn't have it."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT result, created_at, description_hash FROM analysis_results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            result = AIJobAnalysisResult.model_validate_json(row[0])
+        except ValueError:
+            # Written by an incompatible version of the schema
+            self.delete(key)
+            return None
+        return CacheEntry(result=result, created_at=row[1], description_hash=row[2])
+
+    def put(self, key: str, job_id: str, entry: CacheEntry) -> None:
+        """Insert or replace an entry, linking it to the job that stored it."""
+        with self._lock, self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.execute(
+                "INSERT OR REPLACE INTO analysis_results (key, description_hash, created_at, result) "
+                "VALUES (?, ?, ?, ?)",
+                (key, entry.description_hash, entry.created_at, entry.result.model_dump_json()),
+            )
+            self.conn.execute("INSERT OR IGNORE INTO analysis_result_jobs (job_id, key) VALUES (?, ?)", (job_id, key))
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                self.conn.execute("DELETE FROM analysis_results WHERE created_at < ?", (time.time() - CACHE_TTL,))
+                self.conn.execute(
+                    "DELETE FROM analysis_result_jobs WHERE key NOT IN (SELECT key FROM analysis_results)"
+                )
+
+    def link(self, key: str, job_id: str) -> None:
+        """Record that a job uses an entry stored by another job."""
+        with self._lock:
+            self.conn.execute("INSERT OR IGNORE INTO analysis_result_jobs (job_id, key) VALUES (?, ?)", (job_id, key))
+
+    def delete(self, key: str) -> None:
+        """Delete one entry."""
+        with self._lock, self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.execute("DELETE FROM analysis_results WHERE key = ?", (key,))
+            self.conn.execute("DELETE FROM analysis_result_jobs WHERE key = ?", (key,))
+
+    def delete_job(self, job_id: str) -> int:
+        """Delete every entry a job uses and return how many there were."""
+        with self._lock, self.conn:
+            self.conn.execute("BEGIN")
+            keys = [
+                (key,)
+                for (key,) in self.conn.execute("SELECT key FROM analysis_result_jobs WHERE job_id = ?", (job_id,))
+            ]
+            self.conn.executemany("DELETE FROM analysis_results WHERE key = ?", keys)
+            self.conn.executemany("DELETE FROM analysis_result_jobs WHERE key = ?", keys)
+            if keys:
+                self._bump_generation()
+            return len(keys)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock, self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.execute("DELETE FROM analysis_results")
+            self.conn.execute("DELETE FROM analysis_result_jobs")
+            self._bump_generation()
+
+    def _bump_generation(self) -> None:
+        self.conn.execute("UPDATE analysis_cache_generation SET value = value + 1")
+
+    def generation(self) -> int:
+        """Counter bumped by every invalidation made through the store, in any process."""
+        with self._lock:
+            return self.conn.execute("SELECT value FROM analysis_cache_generation").fetchone()[0]
+
+    def count(self) -> int:
+        """Number of stored entries (expired ones included)."""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM analysis_results").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection; it is reopened on next use."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 class AnalysisCache:
-    """In-memory LRU cache for AI analysis results."""
+    """In-memory LRU cache for AI analysis results, optionally backed by a shared store."""
 
-    def __init__(self, max_size: int = 500):
-        self._cache: Dict[str, CacheEntry] = {}
+    def __init__(
+        self,
+        max_size: int = 500,
+        store: SQLiteAnalysisStore | None = None,
+        key_mode: CacheKeyMode = "job",
+        version: str = "",
+    ):
+        # Least recently used first
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._max_size = max_size
-        self._access_order: list[str] = []
+        self._store = store
+        self.key_mode = key_mode
+        self.version = version
+        # Secondary index for invalidation: job ID <-> keys of in-memory entries
+        self._job_keys: dict[str, set[str]] = {}
+        self._key_jobs: dict[str, set[str]] = {}
+        # Held around both tiers, since the async methods run in worker threads
+        self._lock = threading.RLock()
+        # Store generation the in-memory tier is current with (None until read)
+        self._generation: int | None = None
 
     def _compute_key(self, job_id: str, description: str | None) -> str:
         """Compute cache key from job ID and description hash."""
         desc_hash = self._hash_description(description)
-        return f"{job_id}:{desc_hash}"
+        key = f"{job_id}:{desc_hash}"
+        return f"{key}:{self.version}" if self.version else key
+
+    def _compute_job_key(self, job: Job) -> str:
+        """Compute the cache key of a job in the configured key mode."""
+        if self.key_mode == "content":
+            return f"content:{posting_fingerprint(job)}:{self.version}"
+        return self._compute_key(str(job.id), job.description_raw)
 
     def _hash_description(self, description: str | None) -> str:
         """Hash the job description for cache key."""
@@ -48,19 +288,65 @@ class AnalysisCache:
             return "empty"
         return hashlib.sha256(description.encode()).hexdigest()[:16]
 
-    def get(self, job_id: str, description: str | None) -> AIJobAnalysisResult | None:
-        """
-        Get cached analysis result if valid.
-
-        Args:
-            job_id: The job's UUID as string
-            description: The job's description text
-
-        Returns:
-            Cached AIJobAnalysisResult or None if not found/expired
-        """
-        key = self._compute_key(job_id, description)
+    def _remember(self, job_id: str, key: str, entry: CacheEntry) -> None:
+        """Add an entry to the in-memory tier, evicting the least recently used."""
+        if self._store is not None and self._generation is None:
+            self._generation = self._store.generation()
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            while self._cache and len(self._cache) >= self._max_size:
+                oldest_key = next(iter(self._cache))
+                self._forget(oldest_key)
+                logger.debug("cache_evict", key=oldest_key)
+        self._cache[key] = entry
+        self._link(job_id, key)
+
+    def _link(self, job_id: str, key: str) -> bool:
+        """Index an in-memory entry under a job; returns whether the link is new."""
+        keys = self._job_keys.setdefault(job_id, set())
+        if key in keys:
+            return False
+        keys.add(key)
+        self._key_jobs.setdefault(key, set()).add(job_id)
+        return True
+
+    def _forget(self, key: str) -> None:
+        """Remove an entry from the in-memory tier."""
+        del self._cache[key]
+        for job_id in self._key_jobs.pop(key, ()):
+            keys = self._job_keys[job_id]
+            keys.discard(key)
+            if not keys:
+                del self._job_keys[job_id]
+
+    def _get(self, job_id: str, key: str) -> AIJobAnalysisResult | None:
+        with self._lock:
+            return self._get_locked(job_id, key)
+
+    def _drop_memory(self) -> None:
+        self._cache.clear()
+        self._job_keys.clear()
+        self._key_jobs.clear()
+
+    def _check_generation(self) -> None:
+        """Drop the in-memory tier if any process has invalidated entries since it was filled."""
+        generation = self._store.generation()  # type: ignore[union-attr]
+        if generation != self._generation:
+            if self._generation is not None:
+                logger.debug("cache_generation_changed", count=len(self._cache))
+                self._drop_memory()
+            self._generation = generation
+
+    def _get_locked(self, job_id: str, key: str) -> AIJobAnalysisResult | None:
+        if key in self._cache and self._store is not None:
+            self._check_generation()
         entry = self._cache.get(key)
+        tier = "memory"
+
+        if entry is None and self._store is not None:
+            entry = self._store.get(key)
+            tier = "store"
 
         if entry is None:
             logger.debug("cache_miss", job_id=job_id, reason="not_found")
@@ -68,19 +354,50 @@ class AnalysisCache:
 
         if entry.is_expired():
             logger.debug("cache_miss", job_id=job_id, reason="expired")
-            del self._cache[key]
-            if key in self._access_order:
-                self._access_order.remove(key)
+            if key in self._cache:
+                self._forget(key)
+            if self._store is not None:
+                self._store.delete(key)
             return None
 
-        # Move to end of access order (most recently used)
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
-
-        logger.debug("cache_hit", job_id=job_id)
+        # Mark as most recently used (or promote from the store). A job
+        # reusing another job's entry is linked to it for invalidation.
+        if tier == "memory":
+            self._cache.move_to_end(key)
+            if self._link(job_id, key) and self._store is not None:
+                self._store.link(key, job_id)
+        else:
+            self._remember(job_id, key, entry)
+            self._store.link(key, job_id)  # type: ignore[union-attr]
+
+        logger.debug("cache_hit", job_id=job_id, tier=tier)
         return entry.result
 
+    def _set(self, job_id: str, key: str, description: str | None, result: AIJobAnalysisResult) -> None:
+        entry = CacheEntry(
+            result=result,
+            description_hash=self._hash_description(description),
+        )
+        with self._lock:
+            self._remember(job_id, key, entry)
+            if self._store is not None:
+                self._store.put(key, job_id, entry)
+
+        logger.debug("cache_set", job_id=job_id, cache_size=len(self._cache))
+
+    def get(self, job_id: str, description: str | None) -> AIJobAnalysisResult | None:
+        """
+        Get cached analysis result if valid.
+
+        Args:
+            job_id: The job's UUID as string
+            description: The job's description text
+
+        Returns:
+            Cached AIJobAnalysisResult or None if not found/expired
+        """
+        return self._get(job_id, self._compute_key(job_id, description))
+
     def set(
         self,
         job_id: str,
@@ -95,56 +412,97 @@ class AnalysisCache:
             description: The job's description text
             result: The analysis result to cache
         """
-        key = self._compute_key(job_id, description)
+        self._set(job_id, self._compute_key(job_id, description), description, result)
 
-        # Evict oldest entries if cache is full
-        while len(self._cache) >= self._max_size and self._access_order:
-            oldest_key = self._access_order.pop(0)
-            if oldest_key in self._cache:
-                del self._cache[oldest_key]
-                logger.debug("cache_evict", key=oldest_key)
+    def get_for_job(self, job: Job) -> AIJobAnalysisResult | None:
+        """
+        Get the cached analysis of a job, keyed according to key_mode.
 
-        self._cache[key] = CacheEntry(
-            result=result,
-            description_hash=self._hash_description(description),
-        )
-        self._access_order.append(key)
+        In ``content`` mode this returns an analysis cached for any job
+        with the same posting.
 
-        logger.debug("cache_set", job_id=job_id, cache_size=len(self._cache))
+        Args:
+            job: The job to look up
+
+        Returns:
+            Cached AIJobAnalysisResult or None if not found/expired
+        """
+        return self._get(str(job.id), self._compute_job_key(job))
+
+    def set_for_job(self, job: Job, result: AIJobAnalysisResult) -> None:
+        """
+        Cache the analysis of a job, keyed according to key_mode.
+
+        Args:
+            job: The analyzed job
+            result: The analysis result to cache
+        """
+        self._set(str(job.id), self._compute_job_key(job), job.description_raw, result)
+
+    async def get_for_job_async(self, job: Job) -> AIJobAnalysisResult | None:
+        """get_for_job without blocking the event loop on the store."""
+        # The key is computed here, since job attributes may not be loadable off the loop
+        return await asyncio.to_thread(self._get, str(job.id), self._compute_job_key(job))
+
+    async def set_for_job_async(self, job: Job, result: AIJobAnalysisResult) -> None:
+        """set_for_job without blocking the event loop on the store."""
+        await asyncio.to_thread(self._set, str(job.id), self._compute_job_key(job), job.description_raw, result)
 
     def invalidate(self, job_id: str) -> None:
         """
         Invalidate all cache entries for a job.
 
+        In ``content`` mode this also drops the analysis for other jobs
+        sharing the posting, so they pick up the fresh one.
+
         Args:
             job_id: The job's UUID as string
         """
-        keys_to_remove = [k for k in self._cache if k.startswith(f"{job_id}:")]
-        for key in keys_to_remove:
-            del self._cache[key]
-            if key in self._access_order:
-                self._access_order.remove(key)
-
-        if keys_to_remove:
-            logger.debug("cache_invalidate", job_id=job_id, count=len(keys_to_remove))
+        with self._lock:
+            keys_to_remove = list(self._job_keys.get(job_id, ()))
+            for key in keys_to_remove:
+                self._forget(key)
+            count = len(keys_to_remove)
+            if self._store is not None:
+                generation = self._generation
+                count = max(count, self._store.delete_job(job_id))
+                # Our own bump needs no flush; one made in between by another process does
+                if generation is not None and self._store.generation() == generation + 1:
+                    self._generation = generation + 1
+
+        if count:
+            logger.debug("cache_invalidate", job_id=job_id, count=count)
 
     def clear(self) -> None:
         """Clear the entire cache."""
-        count = len(self._cache)
-        self._cache.clear()
-        self._access_order.clear()
+        with self._lock:
+            count = len(self._cache)
+            self._drop_memory()
+            if self._store is not None:
+                self._store.clear()
+                self._generation = self._store.generation()
         logger.info("cache_clear", count=count)
 
     def stats(self) -> dict:
         """Get cache statistics."""
-        expired_count = sum(1 for entry in self._cache.values() if entry.is_expired())
+        with self._lock:
+            expired_count = sum(1 for entry in self._cache.values() if entry.is_expired())
+            size = len(self._cache)
         return {
-            "size": len(self._cache),
+            "size": size,
             "max_size": self._max_size,
             "expired_count": expired_count,
             "ttl_seconds": CACHE_TTL,
+            "store_size": self._store.count() if self._store is not None else None,
+            "key_mode": self.key_mode,
+            "version": self.version,
         }
 
 
 # Singleton instance
-analysis_cache = AnalysisCache()
+analysis_cache = AnalysisCache(
+    max_size=settings.analysis_cache_max_size,
+    store=SQLiteAnalysisStore(settings.analysis_cache_path) if settings.analysis_cache_persist else None,
+    key_mode=settings.analysis_cache_key_mode,
+    version=prompt_version(),
+)
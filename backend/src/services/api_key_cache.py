@@ -0,0 +1,213 @@
+"""In-process cache of agent API-key lookups.
+
+verify_api_key would otherwise query ``agents`` on every request made with
+an agent key, taking a pooled connection before the handler starts. The
+cache maps the SHA-256 of a key to the agent it belongs to for
+``ttl_seconds``, and remembers unknown or inactive keys for
+``negative_ttl_seconds`` so repeated bad keys don't reach the database
+either.
+
+Any change to ``agents`` drops every entry:
+
+- in this process, as soon as a session flushes or commits an Agent
+  write (the commit drops them again, so a lookup racing the write can't
+  leave the old row cached);
+- in other processes, through ``NOTIFY agents_changed``, sent by a
+  statement trigger on ``agents`` (migration 019) when the writing
+  transaction commits, and heard by AgentChangeListener. The listener
+  also drops everything on (re)connecting, since notifications sent while
+  it was disconnected are lost; until it is back, the TTL bounds how
+  stale an entry can get.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.models import Agent
+
+logger = structlog.get_logger(__name__)
+
+AGENTS_CHANNEL = "agents_changed"
+RECONNECT_MAX_SECONDS = 60.0
+
+_WRITES_KEY = "api_key_cache_writes"
+
+
+@dataclass(frozen=True)
+class AgentIdentity:
+    """The parts of an active agent that authentication needs."""
+
+    id: UUID
+    name: str
+    permissions: frozenset[str]
+
+    @classmethod
+    def from_agent(cls, agent: Agent) -> "AgentIdentity":
+        return cls(id=agent.id, name=agent.name, permissions=frozenset(agent.permissions or []))
+
+
+def hash_api_key(api_key: str) -> str:
+    """Cache key of an API key (the key itself is never stored)."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class APIKeyCache:
+    """TTL-bounded LRU of API-key hash -> agent, or None for a rejected key."""
+
+    def __init__(self, ttl_seconds: float, negative_ttl_seconds: float, max_size: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[AgentIdentity | None, float]] = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Incremented by every invalidation; pass the value read before a lookup to put()."""
+        return self._generation
+
+    def get(self, api_key: str) -> tuple[bool, AgentIdentity | None]:
+        """
+        Look up a key.
+
+        Returns:
+            (whether the key was cached, its agent or None if it was rejected)
+        """
+        key = hash_api_key(api_key)
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[0]
+
+    def put(self, api_key: str, agent: AgentIdentity | None, generation: int) -> None:
+        """Cache a lookup, unless agents changed since it started (``generation``)."""
+        if generation != self._generation:
+            return
+        ttl = self.ttl_seconds if agent is not None else self.negative_ttl_seconds
+        key = hash_api_key(api_key)
+        self._entries[key] = (agent, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry and discard lookups still in flight."""
+        self._generation += 1
+        self._entries.clear()
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+class AgentChangeListener:
+    """Invalidate an APIKeyCache on ``NOTIFY agents_changed`` from any process."""
+
+    def __init__(self, cache: APIKeyCache, database_url: str, channel: str = AGENTS_CHANNEL):
+        self.cache = cache
+        self.channel = channel
+        # asyncpg takes a plain postgresql:// DSN
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.connected = False
+        self._task: asyncio.Task | None = None
+
+    def _on_notify(self, _connection: Any, _pid: int, _channel: str, _payload: str) -> None:
+        self.cache.invalidate()
+
+    async def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _connection: closed.set())
+                await connection.add_listener(self.channel, self._on_notify)
+                self.connected = True
+                # Changes made while we weren't listening were never heard
+                self.cache.invalidate()
+                logger.info("agent_change_listener_connected", channel=self.channel)
+                delay = 1.0
+                await closed.wait()
+                logger.warning("agent_change_listener_disconnected", channel=self.channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("agent_change_listener_error", error=str(e), retry_in_seconds=delay)
+            finally:
+                self.connected = False
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_agent_writes(session: Session, flush_context: Any) -> None:
+    if any(isinstance(obj, Agent) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info[_WRITES_KEY] = True
+        api_key_cache.invalidate()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_agent_writes(session: Session) -> None:
+    if session.info.pop(_WRITES_KEY, False):
+        api_key_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_agent_writes(session: Session) -> None:
+    session.info.pop(_WRITES_KEY, None)
+
+
+# Singleton instances
+api_key_cache = APIKeyCache(
+    ttl_seconds=settings.api_key_cache_ttl_seconds,
+    negative_ttl_seconds=settings.api_key_negative_cache_ttl_seconds,
+    max_size=settings.api_key_cache_max_size,
+)
+agent_change_listener = AgentChangeListener(api_key_cache, settings.database_url)
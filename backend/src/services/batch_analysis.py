@@ -0,0 +1,366 @@
+"""Bounded-parallel batch analysis engine.
+
+Runs job analyses (Claude, RAG, optional cover letter) concurrently while
+keeping at most ``concurrency`` analyses in flight and pacing new starts
+with a token bucket. Results are persisted by a single writer that commits
+each job in its own short-lived session, so one failed job never rolls
+back the rest of the batch and slow LLM calls never hold a DB connection.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models import CoverLetter, Job, JobStatus, RoleType
+from src.schemas.ai_analysis_coach import JDMatchResult
+from src.schemas.job import BatchAnalyzeJobResult
+from src.schemas.job import RoleType as SchemaRoleType
+
+from .ai_analysis_service import generate_typed_notes
+from .cover_letter_service import cover_letter_service
+from .job_analysis_service import JobAnalysisResult, analyze_job_with_ai
+from .rag_match_store import MATCH_LIMIT_PER_REQ, MATCH_THRESHOLD, rag_match_store
+from .sparkles_client import sparkles_client
+
+logger = structlog.get_logger(__name__)
+
+
+class TokenBucket:
+    """Async token bucket limiting how often new work may start.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    each ``acquire`` consumes one token, waiting for a refill if needed.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class _JobOutcome:
+    """Result of analyzing one job, waiting to be persisted."""
+
+    job_id: UUID
+    title: str
+    company: str
+    started_at: float
+    analysis: JobAnalysisResult | None = None
+    typed_notes: list[dict[str, Any]] = field(default_factory=list)
+    cover_letter: dict[str, Any] | None = None
+    # (requirements, corpus version, matches) freshly retrieved, to store
+    rag_matches: tuple[list[str], str, list[JDMatchResult]] | None = None
+    error: str | None = None
+
+
+@dataclass
+class BatchRunSummary:
+    """Aggregate outcome of a batch run."""
+
+    results: list[BatchAnalyzeJobResult]
+    successful: int
+    failed: int
+    cover_letters_generated: int
+    duration_seconds: float
+
+    @property
+    def throughput_per_minute(self) -> float:
+        """Completed jobs per minute over the wall-clock duration."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return round(len(self.results) / self.duration_seconds * 60, 2)
+
+
+class BatchAnalyzer:
+    """Analyze many jobs with bounded concurrency and rate limiting."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        concurrency: int,
+        rate_per_second: float,
+        auto_cover_letter: bool = False,
+    ):
+        """Create a batch analyzer.
+
+        Args:
+            session_factory: Factory for the per-job write sessions
+            concurrency: Maximum number of analyses in flight
+            rate_per_second: Token-bucket refill rate for job starts
+            auto_cover_letter: Generate a cover letter for each analyzed job
+        """
+        self.session_factory = session_factory
+        self.concurrency = max(1, concurrency)
+        self.bucket = TokenBucket(rate=rate_per_second, capacity=self.concurrency)
+        self.auto_cover_letter = auto_cover_letter
+
+    async def run(self, jobs: list[Job]) -> BatchRunSummary:
+        """Analyze and persist every job in ``jobs``.
+
+        The passed jobs are treated as read-only snapshots; all writes go
+        through fresh sessions from ``session_factory``.
+
+        Args:
+            jobs: Jobs to analyze
+
+        Returns:
+            Per-job results (in completion order) and run statistics
+        """
+        started = time.monotonic()
+        pending: asyncio.Queue[Job] = asyncio.Queue()
+        for job in jobs:
+            pending.put_nowait(job)
+        completed: asyncio.Queue[_JobOutcome | None] = asyncio.Queue()
+
+        summary = BatchRunSummary(
+            results=[], successful=0, failed=0, cover_letters_generated=0, duration_seconds=0.0
+        )
+
+        async def worker() -> None:
+            while True:
+                try:
+                    job = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await self.bucket.acquire()
+                await completed.put(await self._analyze(job))
+
+        async def writer() -> None:
+            while (outcome := await completed.get()) is not None:
+                summary.results.append(await self._persist(outcome, summary, len(jobs)))
+
+        writer_task = asyncio.create_task(writer())
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(jobs)))))
+        finally:
+            await completed.put(None)
+            await writer_task
+
+        summary.duration_seconds = round(time.monotonic() - started, 3)
+        return summary
+
+    async def _analyze(self, job: Job) -> _JobOutcome:
+        """Run the network-bound part of a job's analysis (no DB writes)."""
+        outcome = _JobOutcome(
+            job_id=job.id, title=job.title, company=job.company, started_at=time.monotonic()
+        )
+        try:
+            analysis, ai_result = await analyze_job_with_ai(job, use_ai=True)
+            outcome.analysis = analysis
+            requirement_matches = None
+
+            if ai_result:
+                coaching_insights = None
+
+                if sparkles_client.is_configured:
+                    try:
+                        requirements = await rag_match_store.requirements_for(job)
+                        if requirements:
+                            requirement_matches = await self._requirement_matches(
+                                job, requirements, outcome
+                            )
+                            from src.schemas.ai_analysis_coach import CoachingInsights
+
+                            evidence_list = []
+                            for match in requirement_matches:
+                                for top_match in match.top_matches[:1]:
+                                    evidence_list.append(top_match)
+                            coaching_insights = CoachingInsights(
+                                talking_points=[],
+                                strengths_to_highlight=[],
+                                gaps_to_address=[],
+                                study_recommendations=[],
+                                watch_outs=[],
+                                evidence_from_resume=evidence_list,
+                            )
+                    except Exception as e:
+                        logger.warning("batch_rag_failed", job_id=str(job.id), error=str(e))
+
+                typed_notes = generate_typed_notes(
+                    ai_result=ai_result,
+                    coaching=coaching_insights,
+                    requirement_matches=requirement_matches,
+                )
+                outcome.typed_notes = [note.model_dump(mode="json") for note in typed_notes]
+
+            if self.auto_cover_letter and analysis.suggested_role:
+                try:
+                    outcome.cover_letter = await cover_letter_service.generate(
+                        job=job,
+                        target_role=RoleType(analysis.suggested_role.value),
+                        custom_instructions=None,
+                        tone="professional",
+                        use_rag=True,
+                        requirement_matches=requirement_matches,
+                    )
+                except Exception as e:
+                    logger.warning("batch_cover_letter_failed", job_id=str(job.id), error=str(e))
+        except Exception as e:
+            outcome.error = str(e)
+        return outcome
+
+    async def _requirement_matches(
+        self, job: Job, requirements: list[str], outcome: _JobOutcome
+    ) -> list[JDMatchResult]:
+        """The job's stored requirement matches, or fresh ones for the writer to store."""
+        corpus_version = await sparkles_client.corpus_version()
+        async with self.session_factory() as session:
+            stored = await rag_match_store.load(session, job, requirements, corpus_version)
+        if stored is not None:
+            return stored
+        matches = await sparkles_client.match_jd_requirements(
+            requirements=requirements,
+            threshold=MATCH_THRESHOLD,
+            limit_per_req=MATCH_LIMIT_PER_REQ,
+        )
+        outcome.rag_matches = (requirements, corpus_version, matches)
+        return matches
+
+    async def _persist(
+        self, outcome: _JobOutcome, summary: BatchRunSummary, total: int
+    ) -> BatchAnalyzeJobResult:
+        """Commit one job's outcome in its own session."""
+        cover_letter_id = None
+        analysis = outcome.analysis
+        if outcome.error is None and analysis is not None:
+            try:
+                async with self.session_factory() as session:
+                    job = await session.get(Job, outcome.job_id)
+                    if job is None or job.deleted_at is not None:
+                        raise ValueError("Job no longer exists")
+                    _apply_analysis(job, analysis, outcome.typed_notes)
+                    if outcome.cover_letter is not None:
+                        cover_letter_id = await _add_cover_letter(session, job.id, outcome.cover_letter)
+                    if outcome.rag_matches is not None:
+                        await rag_match_store.save(session, job, *outcome.rag_matches)
+                    await session.commit()
+            except Exception as e:
+                outcome.error = str(e)
+                cover_letter_id = None
+
+        latency_ms = round((time.monotonic() - outcome.started_at) * 1000, 1)
+        progress = f"{len(summary.results) + 1}/{total}"
+
+        if outcome.error is not None or analysis is None:
+            summary.failed += 1
+            logger.error(
+                "batch_job_failed",
+                job_id=str(outcome.job_id),
+                error=outcome.error,
+                latency_ms=latency_ms,
+                progress=progress,
+            )
+            return BatchAnalyzeJobResult(
+                job_id=outcome.job_id,
+                title=outcome.title,
+                company=outcome.company,
+                success=False,
+                error=outcome.error,
+                latency_ms=latency_ms,
+            )
+
+        summary.successful += 1
+        if cover_letter_id is not None:
+            summary.cover_letters_generated += 1
+        logger.info(
+            "batch_job_analyzed",
+            job_id=str(outcome.job_id),
+            title=outcome.title,
+            priority=analysis.suggested_priority,
+            latency_ms=latency_ms,
+            progress=progress,
+        )
+        return BatchAnalyzeJobResult(
+            job_id=outcome.job_id,
+            title=outcome.title,
+            company=outcome.company,
+            success=True,
+            priority=analysis.suggested_priority,
+            suggested_role=(
+                SchemaRoleType(analysis.suggested_role.value) if analysis.suggested_role else None
+            ),
+            cover_letter_id=cover_letter_id,
+            latency_ms=latency_ms,
+        )
+
+
+def _apply_analysis(job: Job, analysis: JobAnalysisResult, typed_notes: list[dict[str, Any]]) -> None:
+    """Apply analysis suggestions and typed notes to a job."""
+    job.priority = analysis.suggested_priority
+    job.is_ai_forward = analysis.is_ai_forward
+    job.is_location_compatible = analysis.is_location_compatible
+    if analysis.suggested_role:
+        job.target_role = RoleType(analysis.suggested_role.value)
+
+    # Auto-reject if location incompatible
+    if not analysis.is_location_compatible:
+        job.status = JobStatus.ARCHIVED
+        existing_reasons = job.user_decline_reasons or []
+        if "location" not in existing_reasons:
+            job.user_decline_reasons = existing_reasons + ["location"]
+        if analysis.location_notes:
+            existing_notes = job.decline_notes or ""
+            if existing_notes:
+                job.decline_notes = f"{existing_notes}\n{analysis.location_notes}"
+            else:
+                job.decline_notes = analysis.location_notes
+
+    if typed_notes:
+        job.notes = (job.notes or []) + typed_notes
+
+
+async def _add_cover_letter(
+    session: AsyncSession, job_id: UUID, generation_result: dict[str, Any]
+) -> UUID:
+    """Store a generated cover letter as the job's current version."""
+    version_query = select(func.coalesce(func.max(CoverLetter.version), 0)).where(
+        CoverLetter.job_id == job_id,
+        CoverLetter.deleted_at.is_(None),
+    )
+    current_version = await session.scalar(version_query) or 0
+
+    await session.execute(
+        update(CoverLetter)
+        .where(CoverLetter.job_id == job_id, CoverLetter.is_current == True)
+        .values(is_current=False)
+    )
+
+    cover_letter = CoverLetter(
+        job_id=job_id,
+        content=generation_result["content"],
+        target_role=generation_result["target_role"],
+        generation_prompt=generation_result["generation_prompt"],
+        model_used=generation_result["model_used"],
+        version=current_version + 1,
+        is_current=True,
+        rag_evidence=generation_result.get("rag_evidence"),
+        rag_context_used=generation_result.get("rag_context_used", False),
+    )
+    session.add(cover_letter)
+    await session.flush()
+    return cover_letter.id
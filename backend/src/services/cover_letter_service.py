@@ -2,7 +2,7 @@
 
 from typing import Literal
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 import structlog
 
 from src.config import settings
@@ -12,14 +12,22 @@ from src.schemas.ai_analysis_coach import JDMatchResult
 
 from .jd_analyzer import JDAnalysisResult, detect_and_parse_jd
 from .resume_service import resume_service
-from .sparkles_client import sparkles_client
+from .sparkles_client import narrow_matches, sparkles_client
 
 
 class CoverLetterService:
     """Service for generating tailored cover letters."""
 
     def __init__(self):
-        self.client = Anthropic(api_key=settings.anthropic_api_key) if settings.anthropic_api_key else None
+        self.client = (
+            AsyncAnthropic(
+                api_key=settings.anthropic_api_key,
+                timeout=settings.anthropic_timeout_seconds,
+                max_retries=settings.anthropic_max_retries,
+            )
+            if settings.anthropic_api_key
+            else None
+        )
         self.resume = resume_service
         self.sparkles = sparkles_client
 
@@ -160,16 +168,24 @@ Generate the cover letter now. Do not include any preamble or explanation - just
         job: Job,
         jd_analysis: JDAnalysisResult,
         target_role: RoleType,
+        requirement_matches: list[JDMatchResult] | None = None,
     ) -> tuple[str, list[dict]]:
         """
         Fetch RAG context for cover letter generation.
 
+        Args:
+            job: The job
+            jd_analysis: Parsed job description
+            target_role: The role type the letter targets
+            requirement_matches: The job's stored matches (rag_match_store),
+                narrowed here instead of searching again
+
         Returns:
             Tuple of (formatted context string, list of evidence dicts for storage)
         """
         logger = structlog.get_logger(__name__)
 
-        if not self.sparkles.is_configured:
+        if requirement_matches is None and not self.sparkles.is_configured:
             logger.warning("sparkles_not_configured_for_cover_letter")
             return "", []
 
@@ -184,11 +200,14 @@ Generate the cover letter now. Do not include any preamble or explanation - just
                 return "", []
 
             # Match requirements against career documents
-            matches = await self.sparkles.match_jd_requirements(
-                requirements=requirements,
-                threshold=0.45,
-                limit_per_req=2,
-            )
+            if requirement_matches is not None:
+                matches = narrow_matches(requirement_matches, requirements, threshold=0.45, limit=2)
+            else:
+                matches = await self.sparkles.match_jd_requirements(
+                    requirements=requirements,
+                    threshold=0.45,
+                    limit_per_req=2,
+                )
 
             if not matches:
                 return "", []
@@ -238,6 +257,7 @@ Generate the cover letter now. Do not include any preamble or explanation - just
         custom_instructions: str | None = None,
         tone: Literal["professional", "conversational"] = "professional",
         use_rag: bool = True,
+        requirement_matches: list[JDMatchResult] | None = None,
     ) -> dict:
         """
         Generate a tailored cover letter for a job.
@@ -248,6 +268,8 @@ Generate the cover letter now. Do not include any preamble or explanation - just
             custom_instructions: Optional custom instructions
             tone: Tone of the letter (professional or conversational)
             use_rag: Whether to use RAG for enhanced context (default: True)
+            requirement_matches: The job's already retrieved requirement
+                matches (rag_match_store); searched for when not given
 
         Returns dict with content and metadata, ready for creating CoverLetter model.
         """
@@ -277,6 +299,7 @@ Generate the cover letter now. Do not include any preamble or explanation - just
                 job=job,
                 jd_analysis=jd_analysis,
                 target_role=target_role,
+                requirement_matches=requirement_matches,
             )
 
         # Build prompt with optional RAG context
@@ -290,7 +313,7 @@ Generate the cover letter now. Do not include any preamble or explanation - just
         )
 
         # Generate with Claude
-        response = self.client.messages.create(
+        response = await self.client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=2000,
             messages=[{"role": "user", "content": prompt}],
@@ -316,6 +339,11 @@ Generate the cover letter now. Do not include any preamble or explanation - just
 
         return result
 
+    async def aclose(self) -> None:
+        """Close the async client and release its pooled connections."""
+        if self.client is not None:
+            await self.client.close()
+
     def generate_sync(
         self,
         job: Job,
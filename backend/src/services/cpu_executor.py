@@ -0,0 +1,91 @@
+"""Process pool for CPU-bound work.
+
+HTML parsing and rule-based job analysis are pure Python and hold the GIL,
+so running them on the event loop stalls every other request for the
+duration. ``cpu_executor.run`` ships such calls to a pool of worker
+processes instead. Functions must be module-level and their arguments and
+results picklable (plain values and dataclasses).
+
+With ``cpu_pool_workers = 0`` calls run inline on the event loop, which is
+what tests and single-user development use.
+"""
+
+import asyncio
+import multiprocessing
+import signal
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, TypeVar
+
+import structlog
+
+from src.config import settings
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def _init_worker() -> None:
+    # Ctrl-C goes to the whole process group; let the parent shut us down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class CPUExecutor:
+    """Run CPU-bound functions off the event loop in worker processes."""
+
+    def __init__(self, max_workers: int):
+        """Create an executor.
+
+        Args:
+            max_workers: Worker processes to start on first use; 0 runs
+                calls inline
+        """
+        self.max_workers = max(0, max_workers)
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether calls are sent to worker processes."""
+        return self.max_workers > 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn, not fork: the parent has an event loop, open sockets
+            # and threads that must not be duplicated into workers
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            logger.info("cpu_pool_started", workers=self.max_workers)
+        return self._pool
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``fn(*args, **kwargs)`` in a worker process and await the result.
+
+        Exceptions raised by ``fn`` propagate to the caller.
+        """
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_pool(), partial(fn, *args, **kwargs))
+        except BrokenProcessPool:
+            # A worker died (OOM kill, crash); start a fresh pool next time
+            logger.error("cpu_pool_broken", function=getattr(fn, "__name__", repr(fn)))
+            self._pool = None
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            logger.info("cpu_pool_stopped")
+
+
+# Singleton instance
+cpu_executor = CPUExecutor(max_workers=settings.cpu_pool_workers)
@@ -16,10 +16,11 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import Job
+from src.services.job_stats import get_job_stats
 
 logger = structlog.get_logger(__name__)
 
@@ -93,36 +94,42 @@ class DescriptionFetcherService:
         """
         min_length = min_chars or self.min_length
 
-        # Query for jobs with short descriptions
+        # Query for jobs with short descriptions. The threshold is inlined so
+        # the planner can match idx_jobs_description_incomplete (< 500), and
+        # only the listed columns are read, never the description itself
         query = (
-            select(Job)
+            select(
+                Job.id,
+                Job.title,
+                Job.company,
+                Job.url,
+                Job.job_board,
+                Job.job_board_id,
+                Job.description_length,
+            )
             .where(
                 Job.deleted_at.is_(None),
-                Job.description_raw.isnot(None),
-                func.length(Job.description_raw) < min_length,
+                Job.description_length < bindparam("min_length", min_length, literal_execute=True),
             )
             .order_by(Job.created_at.desc())
             .limit(limit)
         )
 
         result = await db.execute(query)
-        jobs = list(result.scalars().all())
-
-        incomplete_jobs = []
-        for job in jobs:
-            desc_len = len(job.description_raw) if job.description_raw else 0
-            incomplete_jobs.append(
-                IncompleteJobInfo(
-                    id=job.id,
-                    title=job.title,
-                    company=job.company,
-                    url=job.url,
-                    job_board=job.job_board,
-                    job_board_id=job.job_board_id,
-                    description_length=desc_len,
-                    needs_fetch=desc_len < min_length,
-                )
+
+        incomplete_jobs = [
+            IncompleteJobInfo(
+                id=row.id,
+                title=row.title,
+                company=row.company,
+                url=row.url,
+                job_board=row.job_board,
+                job_board_id=row.job_board_id,
+                description_length=row.description_length,
+                needs_fetch=row.description_length < min_length,
             )
+            for row in result
+        ]
 
         logger.info(
             "incomplete_jobs_found",
@@ -148,30 +155,29 @@ class DescriptionFetcherService:
             List of jobs with empty/null descriptions
         """
         query = (
-            select(Job)
+            select(Job.id, Job.title, Job.company, Job.url, Job.job_board, Job.job_board_id)
             .where(
                 Job.deleted_at.is_(None),
-                (Job.description_raw.is_(None)) | (Job.description_raw == ""),
+                (Job.description_length.is_(None)) | (Job.description_length == 0),
             )
             .order_by(Job.created_at.desc())
             .limit(limit)
         )
 
         result = await db.execute(query)
-        jobs = list(result.scalars().all())
 
         return [
             IncompleteJobInfo(
-                id=job.id,
-                title=job.title,
-                company=job.company,
-                url=job.url,
-                job_board=job.job_board,
-                job_board_id=job.job_board_id,
+                id=row.id,
+                title=row.title,
+                company=row.company,
+                url=row.url,
+                job_board=row.job_board,
+                job_board_id=row.job_board_id,
                 description_length=0,
                 needs_fetch=True,
             )
-            for job in jobs
+            for row in result
         ]
 
     def build_fetch_url(self, job_info: IncompleteJobInfo) -> str | None:
@@ -230,7 +236,7 @@ class DescriptionFetcherService:
                 error=f"Job {job_id} not found",
             )
 
-        old_length = len(job.description_raw) if job.description_raw else 0
+        old_length = job.description_length or 0
         new_length = len(new_description)
 
         # Only update if new description is longer
@@ -269,49 +275,14 @@ class DescriptionFetcherService:
         Returns:
             Dict with counts of complete, incomplete, and missing descriptions
         """
-        # Total jobs
-        total_query = select(func.count()).select_from(Job).where(Job.deleted_at.is_(None))
-        total = await db.scalar(total_query) or 0
-
-        # Jobs with descriptions
-        with_desc_query = (
-            select(func.count())
-            .select_from(Job)
-            .where(
-                Job.deleted_at.is_(None),
-                Job.description_raw.isnot(None),
-                Job.description_raw != "",
-            )
-        )
-        with_desc = await db.scalar(with_desc_query) or 0
-
-        # Jobs with complete descriptions (>= target length)
-        complete_query = (
-            select(func.count())
-            .select_from(Job)
-            .where(
-                Job.deleted_at.is_(None),
-                Job.description_raw.isnot(None),
-                func.length(Job.description_raw) >= self.target_length,
-            )
-        )
-        complete = await db.scalar(complete_query) or 0
-
-        # Jobs with incomplete descriptions (< min length but not empty)
-        incomplete_query = (
-            select(func.count())
-            .select_from(Job)
-            .where(
-                Job.deleted_at.is_(None),
-                Job.description_raw.isnot(None),
-                Job.description_raw != "",
-                func.length(Job.description_raw) < self.min_length,
-            )
-        )
-        incomplete = await db.scalar(incomplete_query) or 0
-
-        # Jobs without descriptions
-        missing = total - with_desc
+        # Counters kept by the job_stat_counts triggers; their thresholds
+        # are MIN_DESCRIPTION_LENGTH and TARGET_DESCRIPTION_LENGTH
+        stats = await get_job_stats(db)
+        total = stats.total
+        missing = stats.by_description_state["missing"]
+        incomplete = stats.by_description_state["incomplete"]
+        complete = stats.by_description_state["complete"]
+        with_desc = total - missing
 
         return {
             "total_jobs": total,
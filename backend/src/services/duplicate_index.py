@@ -0,0 +1,430 @@
+"""Near-duplicate job detection with MinHash and locality-sensitive hashing.
+
+Every job gets a MinHash signature of the word 5-shingles of its normalized
+title and description (boilerplate stripped, see analysis_cache). Two
+jobs are near-duplicates when their signatures agree in at least
+``threshold`` of positions (an estimate of the Jaccard similarity of their
+shingle sets) and their company names match after normalization, which
+keeps one agency's template posted for several clients apart.
+
+The index keeps signatures in memory, split into LSH bands: a lookup hashes
+16 bands into dicts and only compares against the jobs sharing one, so it
+stays well under a millisecond however many jobs are indexed. Signatures
+are stored in ``jobs.minhash_signature`` so a process builds its index
+without rehashing every description. The index follows other processes'
+writes by re-reading rows updated or signed since its last sync, and fills
+in signatures missing from older rows a batch at a time. Backfilled
+signatures are derived data: the jobs updated_at trigger skips them
+(migration 020), so they don't reorder job lists or move cursors; they
+are stamped with minhash_signed_at instead.
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import numpy as np
+import structlog
+from sqlalchemy import bindparam, event, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.models import Job
+from src.services.analysis_cache import normalize_description, normalize_text
+from src.services.cpu_executor import cpu_executor
+
+logger = structlog.get_logger(__name__)
+
+NUM_PERM = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+
+# Rows re-read on each sync to cover transactions that committed late
+SYNC_OVERLAP = timedelta(minutes=2)
+# Older jobs given a signature per sync
+BACKFILL_BATCH = 500
+
+_PRIME = 4294967311  # smallest prime above 2**32
+_MAX_HASH = 0xFFFFFFFF
+_SHINGLE_MULTIPLIER = 0x01000193
+_TOKEN = re.compile(r"\w+")
+_COMPANY_SUFFIXES = {"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "company", "gmbh", "plc", "the"}
+_PENDING_KEY = "duplicate_index_pending"
+
+
+def _coefficients(label: str) -> np.ndarray:
+    """Deterministic hash coefficients, identical in every process and release."""
+    return np.array(
+        [
+            int.from_bytes(hashlib.blake2b(f"{label}{i}".encode(), digest_size=4).digest(), "little") | 1
+            for i in range(NUM_PERM)
+        ],
+        dtype=np.uint64,
+    )
+
+
+_A = _coefficients("minhash-a")
+_B = _coefficients("minhash-b")
+
+
+def compute_signature(title: str | None, description: str | None) -> np.ndarray | None:
+    """MinHash signature of a job's title and description.
+
+    Returns:
+        NUM_PERM uint32 values, or None if the text has no words
+    """
+    text = normalize_text(title) + "\n" + normalize_description(description)
+    tokens = _TOKEN.findall(text)
+    if not tokens:
+        return None
+
+    token_hashes = np.array([zlib.crc32(token.encode()) for token in tokens], dtype=np.uint64)
+    size = min(SHINGLE_SIZE, len(tokens))
+    count = len(tokens) - size + 1
+    # Rolling polynomial hash of each run of `size` tokens (stays below 2**64)
+    shingles = token_hashes[:count].copy()
+    for offset in range(1, size):
+        shingles = (shingles * _SHINGLE_MULTIPLIER + token_hashes[offset:offset + count]) & _MAX_HASH
+    shingles = np.unique(shingles)
+
+    # NUM_PERM universal hashes of every shingle; keep each one's minimum
+    permuted = (_A[:, None] * shingles[None, :] + _B[:, None]) % _PRIME & _MAX_HASH
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def compute_signatures(texts: list[tuple[str | None, str | None]]) -> list[np.ndarray | None]:
+    """compute_signature for many (title, description) pairs, e.g. in one CPU pool call."""
+    return [compute_signature(title, description) for title, description in texts]
+
+
+def company_key(company: str | None) -> str:
+    """Normalize a company name so listings on different boards compare equal."""
+    tokens = _TOKEN.findall(normalize_text(company))
+    return " ".join(token for token in tokens if token not in _COMPANY_SUFFIXES)
+
+
+def encode_signature(signature: np.ndarray) -> bytes:
+    """Serialize a signature for jobs.minhash_signature."""
+    return signature.astype("<u4").tobytes()
+
+
+def decode_signature(data: bytes) -> np.ndarray | None:
+    """Deserialize jobs.minhash_signature, or None if it has the wrong size."""
+    if len(data) != NUM_PERM * 4:
+        return None
+    return np.frombuffer(data, dtype="<u4").astype(np.uint32)
+
+
+@dataclass
+class NearDuplicate:
+    """An indexed job that a lookup matched."""
+
+    job_id: UUID
+    similarity: float  # Estimated Jaccard similarity of the shingle sets
+
+
+class DuplicateIndex:
+    """In-memory MinHash LSH index of jobs, synced from the database."""
+
+    def __init__(self, threshold: float = 0.8, sync_interval_seconds: float = 5.0, enabled: bool = True):
+        self.threshold = threshold
+        self.sync_interval_seconds = sync_interval_seconds
+        self.enabled = enabled
+        self._signatures: dict[UUID, np.ndarray] = {}
+        self._companies: dict[UUID, str] = {}
+        self._buckets: list[dict[bytes, set[UUID]]] = [{} for _ in range(BANDS)]
+        self._watermark: datetime | None = None
+        self._synced_at: float | None = None
+        self._sync_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    @staticmethod
+    def _band_keys(signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes()
+            for band in range(BANDS)
+        ]
+
+    def add(self, job_id: UUID, company: str | None, signature: np.ndarray) -> None:
+        """Index a job, replacing its previous signature."""
+        self.remove(job_id)
+        self._signatures[job_id] = signature
+        self._companies[job_id] = company_key(company)
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, set()).add(job_id)
+
+    def remove(self, job_id: UUID) -> None:
+        """Drop a job from the index (no-op if it isn't indexed)."""
+        signature = self._signatures.pop(job_id, None)
+        if signature is None:
+            return
+        del self._companies[job_id]
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            members = bucket[key]
+            members.discard(job_id)
+            if not members:
+                del bucket[key]
+
+    def query(
+        self,
+        signature: np.ndarray,
+        company: str | None,
+        min_similarity: float | None = None,
+    ) -> list[NearDuplicate]:
+        """
+        Find indexed near-duplicates of a job.
+
+        Args:
+            signature: The job's MinHash signature
+            company: The job's company name
+            min_similarity: Override of the index threshold
+
+        Returns:
+            Matches, most similar first
+        """
+        threshold = self.threshold if min_similarity is None else min_similarity
+        key = company_key(company)
+        candidates: set[UUID] = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(band_key, ()))
+
+        matches = []
+        for job_id in candidates:
+            if self._companies[job_id] != key:
+                continue
+            similarity = np.count_nonzero(self._signatures[job_id] == signature) / NUM_PERM
+            if similarity >= threshold:
+                matches.append(NearDuplicate(job_id=job_id, similarity=similarity))
+        matches.sort(key=lambda match: match.similarity, reverse=True)
+        return matches
+
+    def clusters(self, min_similarity: float | None = None) -> list[list[UUID]]:
+        """
+        Group indexed jobs into clusters of near-duplicates.
+
+        Jobs are in the same cluster when a chain of near-duplicate pairs
+        connects them.
+
+        Returns:
+            Clusters of two or more job IDs, largest first
+        """
+        threshold = self.threshold if min_similarity is None else min_similarity
+        parent: dict[UUID, UUID] = {}
+
+        def find(job_id: UUID) -> UUID:
+            root = parent.setdefault(job_id, job_id)
+            while root != parent[root]:
+                root = parent[root]
+            while job_id != root:
+                parent[job_id], job_id = root, parent[job_id]
+            return root
+
+        compared: set[tuple[UUID, UUID]] = set()
+        for bucket in self._buckets:
+            for members in bucket.values():
+                if len(members) < 2:
+                    continue
+                ordered = sorted(members)
+                for i, first in enumerate(ordered):
+                    for second in ordered[i + 1:]:
+                        if (first, second) in compared:
+                            continue
+                        compared.add((first, second))
+                        if self._companies[first] != self._companies[second]:
+                            continue
+                        agreement = np.count_nonzero(self._signatures[first] == self._signatures[second])
+                        if agreement / NUM_PERM >= threshold:
+                            parent[find(first)] = find(second)
+
+        groups: dict[UUID, list[UUID]] = {}
+        for job_id in parent:
+            groups.setdefault(find(job_id), []).append(job_id)
+        return sorted((group for group in groups.values() if len(group) > 1), key=len, reverse=True)
+
+    async def sync(self, session: AsyncSession, force: bool = False) -> None:
+        """
+        Bring the index up to date with the database.
+
+        The first sync loads every signature; later ones re-read only rows
+        updated since the previous sync, and are skipped within
+        sync_interval_seconds of it unless forced.
+
+        Args:
+            session: Session to read (and backfill signatures) with
+            force: Sync even if the last sync was recent
+        """
+        if not self.enabled:
+            return
+        if (
+            not force
+            and self._synced_at is not None
+            and time.monotonic() - self._synced_at < self.sync_interval_seconds
+        ):
+            return
+
+        async with self._sync_lock:
+            started = time.monotonic()
+            query = select(
+                Job.id, Job.company, Job.minhash_signature, Job.deleted_at, Job.updated_at, Job.minhash_signed_at
+            )
+            if self._watermark is None:
+                query = query.where(Job.deleted_at.is_(None), Job.minhash_signature.is_not(None))
+            else:
+                since = self._watermark - SYNC_OVERLAP
+                query = query.where(or_(Job.updated_at >= since, Job.minhash_signed_at >= since))
+
+            loaded = 0
+            for job_id, company, data, deleted_at, updated_at, signed_at in await session.execute(query):
+                changed_at = max(updated_at, signed_at) if signed_at is not None else updated_at
+                if self._watermark is None or changed_at > self._watermark:
+                    self._watermark = changed_at
+                signature = decode_signature(data) if data is not None else None
+                if deleted_at is not None or signature is None:
+                    self.remove(job_id)
+                else:
+                    self.add(job_id, company, signature)
+                    loaded += 1
+
+            backfilled = await self._backfill(session)
+            self._synced_at = time.monotonic()
+            if loaded or backfilled:
+                logger.info(
+                    "duplicate_index_sync",
+                    loaded=loaded,
+                    backfilled=backfilled,
+                    size=len(self),
+                    duration_ms=round((time.monotonic() - started) * 1000, 1),
+                )
+
+    async def _backfill(self, session: AsyncSession) -> int:
+        """Compute, store and index signatures of jobs saved without one."""
+        rows = (
+            await session.execute(
+                select(Job.id, Job.title, Job.company, Job.description_raw)
+                .where(Job.minhash_signature.is_(None), Job.deleted_at.is_(None))
+                .limit(BACKFILL_BATCH)
+            )
+        ).all()
+        if not rows:
+            return 0
+
+        signatures = await cpu_executor.run(
+            compute_signatures, [(title, description) for _job_id, title, _company, description in rows]
+        )
+        # Signatures of jobs without words are stored empty so they aren't retried
+        jobs = Job.__table__
+        await session.execute(
+            update(jobs)
+            .where(jobs.c.id == bindparam("job_id"))
+            # Derived data: keep updated_at (the column's onupdate is
+            # overridden here, and the trigger skips filling a signature)
+            .values(
+                minhash_signature=bindparam("signature"),
+                minhash_signed_at=func.now(),
+                updated_at=jobs.c.updated_at,
+            ),
+            [
+                {"job_id": job_id, "signature": encode_signature(signature) if signature is not None else b""}
+                for (job_id, _title, _company, _description), signature in zip(rows, signatures)
+            ],
+        )
+        for (job_id, _title, company, _description), signature in zip(rows, signatures):
+            if signature is not None:
+                self.add(job_id, company, signature)
+        return len(rows)
+
+    async def flag_near_duplicates(self, session: AsyncSession, jobs: list[Job]) -> None:
+        """
+        Sign new jobs and point each near-duplicate at the job it repeats.
+
+        Sets minhash_signature and duplicate_of_id on the (not yet flushed)
+        jobs, matching against the index and against earlier jobs in the
+        list. The jobs are added to the index once the session commits.
+
+        Args:
+            session: The session the jobs will be saved with
+            jobs: New jobs
+        """
+        if not self.enabled or not jobs:
+            return
+
+        signatures = await cpu_executor.run(
+            compute_signatures, [(job.title, job.description_raw) for job in jobs]
+        )
+        # Jobs already added to the session must not be flushed unsigned,
+        # or the backfill would pick them up
+        with session.no_autoflush:
+            await self.sync(session)
+
+        batch = DuplicateIndex(threshold=self.threshold)
+        for job, signature in zip(jobs, signatures):
+            if signature is None:
+                job.minhash_signature = b""
+                continue
+            if job.id is None:
+                job.id = uuid4()
+            matches = [
+                match
+                for match in self.query(signature, job.company) + batch.query(signature, job.company)
+                if match.job_id != job.id
+            ]
+            if matches:
+                best = max(matches, key=lambda match: match.similarity)
+                job.duplicate_of_id = best.job_id
+                logger.info(
+                    "near_duplicate_job",
+                    job_id=str(job.id),
+                    duplicate_of=str(best.job_id),
+                    similarity=round(best.similarity, 3),
+                )
+            job.minhash_signature = encode_signature(signature)
+            batch.add(job.id, job.company, signature)
+            self._add_on_commit(session, job.id, job.company, signature)
+
+    async def refresh(self, session: AsyncSession, job: Job) -> None:
+        """Re-sign a job whose title, company or description changed."""
+        if not self.enabled:
+            return
+        signature = await cpu_executor.run(compute_signature, job.title, job.description_raw)
+        if signature is None:
+            job.minhash_signature = b""
+            self._remove_on_commit(session, job.id)
+        else:
+            job.minhash_signature = encode_signature(signature)
+            self._add_on_commit(session, job.id, job.company, signature)
+
+    def _add_on_commit(self, session: AsyncSession, job_id: UUID, company: str | None, signature: np.ndarray) -> None:
+        session.sync_session.info.setdefault(_PENDING_KEY, []).append(
+            lambda: self.add(job_id, company, signature)
+        )
+
+    def _remove_on_commit(self, session: AsyncSession, job_id: UUID) -> None:
+        session.sync_session.info.setdefault(_PENDING_KEY, []).append(lambda: self.remove(job_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_index_updates(session: Session) -> None:
+    for apply in session.info.pop(_PENDING_KEY, ()):
+        apply()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_index_updates(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# Singleton instance
+duplicate_index = DuplicateIndex(
+    threshold=settings.duplicate_similarity_threshold,
+    sync_interval_seconds=settings.duplicate_index_sync_seconds,
+    enabled=settings.duplicate_detection_enabled,
+)
@@ -0,0 +1,233 @@
+"""Persistent on-disk cache of text embeddings.
+
+Embeddings are keyed by the SHA-256 of the normalized text (see
+analysis_cache.normalize_text), one directory per embedding model. Each
+directory holds two append-only files:
+
+- ``vectors.bin``: raw rows of ``dtype`` (float16 by default, half the
+  size of float32 and far finer than the differences cosine ranking
+  depends on), ``dimensions`` values per row.
+- ``keys.txt``: one hex key per line; line ``n`` names row ``n``.
+
+Rows are written before their keys, so a crash can leave at most a
+trailing partial row, which the next load truncates. Writers in other
+processes append under an exclusive ``flock``; a lookup miss re-reads
+keys appended since the last read, so one worker's embeddings are hits
+for the others. Vectors are read through a memory map, so opening a
+large cache costs only its key list.
+"""
+
+import fcntl
+import hashlib
+import json
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Literal
+
+import numpy as np
+import structlog
+
+from src.services.analysis_cache import normalize_text
+
+logger = structlog.get_logger(__name__)
+
+EmbeddingDtype = Literal["float16", "float32"]
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def embedding_key(text: str) -> str:
+    """Cache key of a text: the hash of its normalized form."""
+    return hashlib.sha256(normalize_text(text).encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """Append-only float16/float32 matrix of embeddings with a key index."""
+
+    def __init__(self, directory: str | Path, model: str, dtype: EmbeddingDtype = "float16"):
+        self.directory = Path(directory) / _UNSAFE.sub("_", model)
+        self.model = model
+        self.dtype = np.dtype(dtype)
+        self.dimensions: int | None = None
+        self._rows: dict[str, int] | None = None
+        self._key_lines = 0
+        self._keys_offset = 0
+        self._matrix: np.memmap | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.directory / "vectors.bin"
+
+    @property
+    def _keys_path(self) -> Path:
+        return self.directory / "keys.txt"
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.directory / "meta.json"
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / "cache.lock", "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _row_bytes(self) -> int:
+        assert self.dimensions is not None
+        return self.dimensions * self.dtype.itemsize
+
+    # Index
+
+    def _load(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._rows = {}
+        self._key_lines = 0
+        self._keys_offset = 0
+        try:
+            meta = json.loads(self._meta_path.read_text("utf-8"))
+        except (OSError, ValueError):
+            return
+        if meta.get("dtype") != self.dtype.name:
+            # Written with another dtype: start over rather than misread rows
+            with self._file_lock():
+                for path in (self._vectors_path, self._keys_path, self._meta_path):
+                    path.unlink(missing_ok=True)
+            logger.info("embedding_cache_reset", model=self.model, dtype=self.dtype.name)
+            return
+        self.dimensions = int(meta["dimensions"])
+        with self._file_lock():
+            self._repair()
+        self._read_new_keys()
+
+    def _repair(self) -> None:
+        """Drop rows without a key and keys without a complete row (after a crash)."""
+        if not self._keys_path.exists():
+            self._vectors_path.unlink(missing_ok=True)
+            return
+        keys = self._keys_path.read_bytes()
+        complete_keys = keys[: keys.rfind(b"\n") + 1]
+        key_count = complete_keys.count(b"\n")
+        row_bytes = self._row_bytes()
+        size = self._vectors_path.stat().st_size if self._vectors_path.exists() else 0
+        rows = min(key_count, size // row_bytes)
+        if rows < key_count:
+            complete_keys = b"".join(line + b"\n" for line in complete_keys.split(b"\n")[:rows])
+        if complete_keys != keys:
+            self._keys_path.write_bytes(complete_keys)
+        if size != rows * row_bytes:
+            with open(self._vectors_path, "ab") as handle:
+                handle.truncate(rows * row_bytes)
+
+    def _read_new_keys(self) -> None:
+        """Index keys appended (by this or another process) since the last read."""
+        assert self._rows is not None
+        try:
+            with open(self._keys_path, "rb") as handle:
+                handle.seek(self._keys_offset)
+                data = handle.read()
+        except OSError:
+            return
+        data = data[: data.rfind(b"\n") + 1]
+        for line in data.splitlines():
+            self._rows.setdefault(line.decode(), self._key_lines)
+            self._key_lines += 1
+        self._keys_offset += len(data)
+
+    def _vector(self, row: int) -> np.ndarray:
+        if self._matrix is None or row >= self._matrix.shape[0]:
+            assert self.dimensions is not None
+            rows = self._vectors_path.stat().st_size // self._row_bytes()
+            self._matrix = np.memmap(
+                self._vectors_path, dtype=self.dtype, mode="r", shape=(rows, self.dimensions)
+            )
+        return np.asarray(self._matrix[row], dtype=np.float32)
+
+    # Lookups
+
+    def get_many(self, texts: list[str]) -> list[list[float] | None]:
+        """Cached embeddings for texts, None where missing."""
+        with self._lock:
+            if self._rows is None:
+                self._load()
+            assert self._rows is not None
+            keys = [embedding_key(text) for text in texts]
+            if any(key not in self._rows for key in keys):
+                self._read_new_keys()
+
+            results: list[list[float] | None] = []
+            for key in keys:
+                row = self._rows.get(key)
+                if row is None:
+                    self.misses += 1
+                    results.append(None)
+                else:
+                    self.hits += 1
+                    results.append(self._vector(row).tolist())
+            return results
+
+    def put_many(self, texts: list[str], embeddings: list[list[float]]) -> None:
+        """Append embeddings for texts not already cached."""
+        if not texts:
+            return
+        with self._lock:
+            if self._rows is None:
+                self._load()
+            assert self._rows is not None
+            if self.dimensions is None:
+                self.dimensions = len(embeddings[0])
+
+            with self._file_lock():
+                if not self._meta_path.exists():
+                    self._meta_path.write_text(
+                        json.dumps({"model": self.model, "dtype": self.dtype.name, "dimensions": self.dimensions})
+                    )
+                self._read_new_keys()
+
+                new_keys: list[str] = []
+                new_rows: list[list[float]] = []
+                for text, embedding in zip(texts, embeddings):
+                    key = embedding_key(text)
+                    if key in self._rows or key in new_keys or len(embedding) != self.dimensions:
+                        continue
+                    new_keys.append(key)
+                    new_rows.append(embedding)
+                if not new_keys:
+                    return
+
+                with open(self._vectors_path, "ab") as handle:
+                    handle.write(np.asarray(new_rows, dtype=self.dtype).tobytes())
+                with open(self._keys_path, "a", encoding="ascii") as handle:
+                    handle.write("".join(f"{key}\n" for key in new_keys))
+                self._read_new_keys()
+
+    def clear(self) -> None:
+        """Remove every cached embedding for this model."""
+        with self._lock, self._file_lock():
+            for path in (self._vectors_path, self._keys_path, self._meta_path):
+                path.unlink(missing_ok=True)
+            self._rows = None
+            self._matrix = None
+            self.dimensions = None
+        logger.info("embedding_cache_clear", model=self.model)
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            entries = len(self._rows) if self._rows is not None else None
+        return {
+            "model": self.model,
+            "dtype": self.dtype.name,
+            "dimensions": self.dimensions,
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,314 @@
+"""On-disk HTML cache for the job scraper.
+
+Pages are stored content-addressed: ``bodies/<sha256>.html`` holds each
+distinct body once, and a small per-URL record (``entries/<key>.json``)
+remembers the body hash plus the ``ETag``/``Last-Modified`` validators used
+for conditional GETs. Parsed ``ScrapedJob`` results are cached next to the
+body they came from, so an unchanged page (a 304, or a 200 with an identical
+body) is neither downloaded nor parsed again.
+
+Parses are keyed by the parser backend too, so switching
+``scrape_parser_backend`` never serves the other backend's results.
+
+Entries expire after ``ttl_seconds`` and the total size on disk is bounded
+by least-recently-used eviction. Every method does blocking file I/O and
+is safe to call from worker threads (the scraper uses ``asyncio.to_thread``).
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import structlog
+
+if TYPE_CHECKING:
+    from .job_scraper import ScrapedJob
+
+logger = structlog.get_logger(__name__)
+
+# Query parameters that identify the visit, not the posting
+TRACKING_PARAMS = {"refid", "trackingid", "trk", "ref", "src", "source", "gclid", "fbclid"}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a job URL so tracking variants share one cache entry."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (
+        (scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)
+    ):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(data, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+@dataclass
+class CachedPage:
+    """Per-URL cache record."""
+
+    url: str
+    body_hash: str
+    stored_at: float
+    last_access: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        """Headers for a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTMLCache:
+    """Size-bounded, TTL-limited on-disk LRU cache of fetched pages."""
+
+    def __init__(self, directory: str | Path, ttl_seconds: float, max_bytes: int):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedPage] | None = None
+        self._body_refs: dict[str, set[str]] = {}
+        self._size = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.parse_hits = 0
+        self.evictions = 0
+
+    # Index
+
+    @property
+    def entries(self) -> OrderedDict[str, CachedPage]:
+        """URL key -> record, least recently used first (loaded lazily)."""
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            assert self._entries is not None
+            return self._entries
+
+    def _load(self) -> None:
+        for sub in ("entries", "bodies", "parsed"):
+            (self.directory / sub).mkdir(parents=True, exist_ok=True)
+
+        records: list[tuple[str, CachedPage]] = []
+        for path in (self.directory / "entries").glob("*.json"):
+            try:
+                records.append((path.stem, CachedPage(**json.loads(path.read_text("utf-8")))))
+            except (OSError, ValueError, TypeError):
+                path.unlink(missing_ok=True)
+        records.sort(key=lambda item: item[1].last_access)
+
+        self._entries = OrderedDict()
+        for key, record in records:
+            if (self.directory / "bodies" / f"{record.body_hash}.html").exists():
+                self._entries[key] = record
+                self._body_refs.setdefault(record.body_hash, set()).add(key)
+            else:
+                self._entry_path(key).unlink(missing_ok=True)
+
+        # Drop bodies and parses no entry points to (e.g. after a crash)
+        for path in (self.directory / "bodies").glob("*.html"):
+            if path.stem not in self._body_refs:
+                self._remove_body(path.stem)
+        self._size = sum(
+            path.stat().st_size
+            for sub in ("bodies", "parsed")
+            for path in (self.directory / sub).iterdir()
+        )
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / "entries" / f"{key}.json"
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.directory / "bodies" / f"{body_hash}.html"
+
+    def _parsed_path(self, body_hash: str, url: str, source: str | None, backend: str) -> Path:
+        variant = _sha256(f"{normalize_url(url)}|{source or ''}|{backend}")[:16]
+        return self.directory / "parsed" / f"{body_hash}-{variant}.json"
+
+    # Pages
+
+    def lookup(self, url: str) -> CachedPage | None:
+        """Get the live record for a URL, dropping it if expired."""
+        with self._lock:
+            key = _sha256(normalize_url(url))
+            record = self.entries.get(key)
+            if record is None:
+                return None
+            if time.time() - record.stored_at > self.ttl_seconds:
+                self._remove_entry(key)
+                return None
+            return record
+
+    def read_body(self, record: CachedPage) -> str | None:
+        """Read a record's body, or None if it vanished from disk."""
+        try:
+            return self._body_path(record.body_hash).read_text("utf-8")
+        except OSError:
+            return None
+
+    def record_hit(self, url: str) -> None:
+        """Mark a successful revalidation (304) as a hit and refresh the entry."""
+        with self._lock:
+            key = _sha256(normalize_url(url))
+            record = self.entries.get(key)
+            if record is None:
+                return
+            record.stored_at = record.last_access = time.time()
+            self.entries.move_to_end(key)
+            _write_atomic(self._entry_path(key), json.dumps(dataclasses.asdict(record)))
+            self.hits += 1
+
+    def store(
+        self,
+        url: str,
+        body: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a freshly downloaded page (counts as a miss)."""
+        with self._lock:
+            self.misses += 1
+            key = _sha256(normalize_url(url))
+            body_hash = _sha256(body)
+
+            previous = self.entries.get(key)
+            if previous is not None and previous.body_hash != body_hash:
+                self._release_body(key, previous.body_hash)
+
+            body_path = self._body_path(body_hash)
+            if not body_path.exists():
+                _write_atomic(body_path, body)
+                self._size += body_path.stat().st_size
+
+            now = time.time()
+            record = CachedPage(
+                url=url,
+                body_hash=body_hash,
+                stored_at=now,
+                last_access=now,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            self.entries[key] = record
+            self.entries.move_to_end(key)
+            self._body_refs.setdefault(body_hash, set()).add(key)
+            _write_atomic(self._entry_path(key), json.dumps(dataclasses.asdict(record)))
+            self._evict()
+
+    # Parsed results
+
+    def get_parsed(self, url: str, body: str, source: str | None, backend: str) -> "ScrapedJob | None":
+        """Get the cached parse of this exact body by ``backend``, if any."""
+        from .job_scraper import ScrapedJob
+
+        with self._lock:
+            path = self._parsed_path(_sha256(body), url, source, backend)
+            try:
+                data: dict[str, Any] = json.loads(path.read_text("utf-8"))
+            except (OSError, ValueError):
+                return None
+            self.parse_hits += 1
+            return ScrapedJob(**data, raw_html=body)
+
+    def put_parsed(
+        self,
+        url: str,
+        body: str,
+        source: str | None,
+        backend: str,
+        scraped: "ScrapedJob",
+    ) -> None:
+        """Cache a parse result alongside the body it came from."""
+        with self._lock:
+            body_hash = _sha256(body)
+            if body_hash not in self._body_refs:
+                return
+            data = dataclasses.asdict(scraped)
+            del data["raw_html"]
+            path = self._parsed_path(body_hash, url, source, backend)
+            _write_atomic(path, json.dumps(data))
+            self._size += path.stat().st_size
+            self._evict()
+
+    # Housekeeping
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and len(self.entries) > 1:
+            key, _record = next(iter(self.entries.items()))
+            self._remove_entry(key)
+            self.evictions += 1
+
+    def _remove_entry(self, key: str) -> None:
+        record = self.entries.pop(key, None)
+        self._entry_path(key).unlink(missing_ok=True)
+        if record is not None:
+            self._release_body(key, record.body_hash)
+
+    def _release_body(self, key: str, body_hash: str) -> None:
+        refs = self._body_refs.get(body_hash)
+        if refs is not None:
+            refs.discard(key)
+            if refs:
+                return
+        self._body_refs.pop(body_hash, None)
+        self._remove_body(body_hash)
+
+    def _remove_body(self, body_hash: str) -> None:
+        paths = [self._body_path(body_hash), *(self.directory / "parsed").glob(f"{body_hash}-*.json")]
+        for path in paths:
+            try:
+                self._size -= path.stat().st_size
+                path.unlink()
+            except OSError:
+                pass
+        self._size = max(self._size, 0)
+
+    def clear(self) -> None:
+        """Remove every cached page."""
+        with self._lock:
+            for key in list(self.entries):
+                self._remove_entry(key)
+            logger.info("html_cache_clear")
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "parse_hits": self.parse_hits,
+                "evictions": self.evictions,
+            }
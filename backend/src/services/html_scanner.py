@@ -0,0 +1,302 @@
+"""Streaming HTML scanner for the job scraper's fast parse path.
+
+Most job pages carry everything the scraper needs in a JSON-LD
+``JobPosting`` block and a few ``<meta>`` tags. Building a BeautifulSoup
+tree for the whole page just to read those is most of the parse cost, so
+this module runs the same ``html.parser`` tokenizer BeautifulSoup uses but
+only keeps the pieces the scraper reads. Results are identical to the
+BeautifulSoup calls they replace (see ``tests/test_html_scanner.py``).
+
+For LinkedIn pages the scanner also answers the scraper's Easy Apply
+check, which would otherwise need a tree of the whole page.
+"""
+
+import html
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EntitySubstitution
+
+# Tags whose text BeautifulSoup leaves out of get_text()
+_RAW_TEXT_TAGS = {"script", "style"}
+
+_META_SELECTOR = re.compile(r"^meta\[(?P<attr>[\w:-]+)='(?P<value>[^']*)'\]$")
+
+# The elements job_scraper._detect_linkedin_easy_apply reads, as
+# (tag, class, attribute) conditions: the first match of each select_one
+# selector, and every match of the container selectors
+_EASY_APPLY_FIRST = (
+    ("button", "jobs-apply-button", None),
+    ("button", None, "data-job-id"),
+    (None, "jobs-apply-button--top-card", None),
+    (None, "apply-button--top-card", None),
+    ("span", "jobs-apply-button__label", None),
+    (None, "easy-apply-text", None),
+)
+_EASY_APPLY_CONTAINERS = {"top-card-layout__cta-container", "apply-button-container", "jobs-unified-top-card"}
+
+
+def _entity_text(name: str) -> str:
+    character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+    return character if character is not None else f"&{name}"
+
+
+def _charref_text(name: str) -> str:
+    return html.unescape(f"&#{name};")
+
+
+@dataclass
+class PageScan:
+    """The parts of a page the scraper reads without a DOM."""
+
+    json_ld: list[str | None] = field(default_factory=list)
+    meta: dict[tuple[str, str], str | None] = field(default_factory=dict)
+    # Result of the Easy Apply check; None if not scanned for or undecided
+    easy_apply: bool | None = None
+
+    def meta_content(self, selectors: list[str]) -> str | None:
+        """Equivalent of ``_meta_content`` for ``meta[attr='value']`` selectors.
+
+        Like ``soup.select_one``, only the first matching tag per selector is
+        considered; an empty ``content`` moves on to the next selector.
+        """
+        for selector in selectors:
+            match = _META_SELECTOR.match(selector)
+            if match is None:
+                raise ValueError(f"Unsupported meta selector: {selector}")
+            content = self.meta.get((match["attr"], match["value"]))
+            if content:
+                return re.sub(r"\s+", " ", content).strip()
+        return None
+
+
+class _PageScanner(HTMLParser):
+    """Collect JSON-LD script bodies and the first <meta> per attribute value.
+
+    With ``easy_apply``, also track the open elements the way BeautifulSoup
+    nests them and gather the ``get_text(strip=True)`` of the elements the
+    Easy Apply check reads.
+    """
+
+    def __init__(self, easy_apply: bool = False) -> None:
+        super().__init__(convert_charrefs=False)
+        self.result = PageScan()
+        self._script: list[str] | None = None
+        self._easy_apply = easy_apply
+        # (tag, text buffer if the Easy Apply check reads this element)
+        self._open: list[tuple[str, list[str] | None]] = []
+        self._watched: list[list[str]] = []
+        self._watching = 0
+        self._unmatched = list(_EASY_APPLY_FIRST)
+        self._undecided = False
+        self._pending: list[str] = []
+        self._raw_tag: str | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "script":
+            # Same match as find_all("script", type="application/ld+json")
+            if dict(attrs).get("type") == "application/ld+json":
+                self._script = []
+        elif tag == "meta":
+            attributes = dict(attrs)
+            for name, value in attributes.items():
+                if name != "content" and value is not None:
+                    self.result.meta.setdefault((name, value), attributes.get("content"))
+        if self._easy_apply:
+            self._open_element(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script" and self._script is not None:
+            self._flush_script()
+        if self._easy_apply:
+            self._close_element(tag)
+
+    def handle_data(self, data: str) -> None:
+        if self._script is not None:
+            self._script.append(data)
+        if self._watching:
+            self._pending.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        if self._watching:
+            self._pending.append(_entity_text(name))
+
+    def handle_charref(self, name: str) -> None:
+        if self._watching:
+            self._pending.append(_charref_text(name))
+
+    def handle_comment(self, data: str) -> None:
+        self._end_string()
+
+    def handle_decl(self, decl: str) -> None:
+        self._end_string()
+
+    def handle_pi(self, data: str) -> None:
+        self._end_string()
+
+    def unknown_decl(self, data: str) -> None:
+        self._end_string()
+        if self._watching and data.upper().startswith("CDATA["):
+            self._pending.append(data[len("CDATA[") :])
+            self._end_string()
+
+    def _flush_script(self) -> None:
+        assert self._script is not None
+        # Mirrors Tag.string: an empty script has no string
+        self.result.json_ld.append("".join(self._script) or None)
+        self._script = None
+
+    def _end_string(self) -> None:
+        # BeautifulSoup ends the current string at every markup event
+        if self._pending:
+            if self._raw_tag is None:
+                text = "".join(self._pending).strip()
+                if text:
+                    for _, buffer in self._open:
+                        if buffer is not None:
+                            buffer.append(text)
+            self._pending = []
+
+    def _open_element(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._end_string()
+        if tag == "template":
+            # Template contents depend on the tree BeautifulSoup builds
+            self._undecided = True
+
+        attributes = dict(attrs)
+        classes = set((attributes.get("class") or "").split())
+        watched = bool(classes & _EASY_APPLY_CONTAINERS)
+        for condition in list(self._unmatched):
+            condition_tag, condition_class, condition_attribute = condition
+            if (
+                (condition_tag is None or tag == condition_tag)
+                and (condition_class is None or condition_class in classes)
+                and (condition_attribute is None or condition_attribute in attributes)
+            ):
+                self._unmatched.remove(condition)
+                watched = True
+
+        if tag in HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS:
+            # Closed at once and without text; a first match here is a miss
+            return
+        if tag in _RAW_TEXT_TAGS:
+            self._raw_tag = tag
+
+        buffer: list[str] | None = None
+        if watched:
+            buffer = []
+            self._watched.append(buffer)
+            self._watching += 1
+        self._open.append((tag, buffer))
+
+    def _close_element(self, tag: str) -> None:
+        self._end_string()
+        if tag == self._raw_tag:
+            self._raw_tag = None
+        # Like BeautifulSoup, close the most recent open element of this
+        # name and everything opened inside it; ignore stray end tags
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index][0] == tag:
+                for _, buffer in self._open[index:]:
+                    if buffer is not None:
+                        self._watching -= 1
+                del self._open[index:]
+                break
+
+    def close(self) -> None:
+        super().close()
+        if self._script is not None:
+            self._flush_script()
+        if self._easy_apply:
+            self._end_string()
+            if not self._undecided:
+                self.result.easy_apply = any(
+                    "easy apply" in "".join(buffer).lower() for buffer in self._watched
+                )
+
+
+class _TextExtractor(HTMLParser):
+    """Reproduce ``BeautifulSoup(markup, "html.parser").get_text(" ", strip=True)``."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self.strings: list[str] = []
+        self._pending: list[str] = []
+        self._raw_tag: str | None = None
+
+    # BeautifulSoup ends the current string at every markup event
+
+    def _end_string(self) -> None:
+        if self._pending:
+            if self._raw_tag is None:
+                text = "".join(self._pending).strip()
+                if text:
+                    self.strings.append(text)
+            self._pending = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._end_string()
+        if tag in _RAW_TEXT_TAGS:
+            self._raw_tag = tag
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._end_string()
+
+    def handle_endtag(self, tag: str) -> None:
+        self._end_string()
+        if tag == self._raw_tag:
+            self._raw_tag = None
+
+    def handle_data(self, data: str) -> None:
+        self._pending.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        self._pending.append(_entity_text(name))
+
+    def handle_charref(self, name: str) -> None:
+        self._pending.append(_charref_text(name))
+
+    def handle_comment(self, data: str) -> None:
+        self._end_string()
+
+    def handle_decl(self, decl: str) -> None:
+        self._end_string()
+
+    def handle_pi(self, data: str) -> None:
+        self._end_string()
+
+    def unknown_decl(self, data: str) -> None:
+        self._end_string()
+        if data.upper().startswith("CDATA["):
+            # CDATA sections are text to get_text()
+            self._pending.append(data[len("CDATA[") :])
+            self._end_string()
+
+    def close(self) -> None:
+        super().close()
+        self._end_string()
+
+
+def scan_page(markup: str, easy_apply: bool = False) -> PageScan:
+    """Scan a page for JSON-LD blocks and meta tags (and the Easy Apply check)."""
+    scanner = _PageScanner(easy_apply)
+    scanner.feed(markup)
+    scanner.close()
+    return scanner.result
+
+
+def html_to_text(markup: str) -> str:
+    """Strip tags from an HTML fragment, joining text runs with spaces."""
+    if "<" not in markup and "&" not in markup:
+        return markup.strip()
+    if "<template" in markup.lower():
+        # Template contents are hidden based on the tree BeautifulSoup
+        # builds (implicitly closed tags and all); let it decide.
+        return BeautifulSoup(markup, "html.parser").get_text(" ", strip=True)
+    extractor = _TextExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    return " ".join(extractor.strings)
@@ -137,12 +137,125 @@ class JDAnalysisResult:
     raw_text: str
 
 
+# Characters for which IGNORECASE matching differs from matching the
+# lowercased text: İ lowercases to two characters, and ı, ſ and the Kelvin
+# sign match ASCII letters only case-insensitively.
+_CASE_FOLD_EXCEPTIONS = re.compile("[\u0130\u0131\u017f\u212a]")
+
+
+def _casefold_for_matching(text: str) -> str | None:
+    """Lowercase text so lowercase patterns can match it case-sensitively.
+
+    Case-sensitive matching on the lowercased text is equivalent to
+    IGNORECASE matching on the original (and several times faster), except
+    for the few characters in _CASE_FOLD_EXCEPTIONS.
+
+    Returns:
+        The lowercased text, or None if the text needs IGNORECASE matching
+    """
+    if _CASE_FOLD_EXCEPTIONS.search(text):
+        return None
+    return text.lower()
+
+
+class _PatternSet:
+    """Case-insensitive regexes evaluated together.
+
+    ``findall`` makes a single scan of the text for all patterns: they are
+    combined into one zero-width alternation, ``(?=(p0)|(p1)|...)``, that
+    matches at every position where any of them does and reports the
+    first pattern that matched there. Patterns must be written in
+    lowercase (see _casefold_for_matching).
+    """
+
+    def __init__(self, patterns: list[str]):
+        if any(pattern != pattern.lower() for pattern in patterns):
+            raise ValueError("patterns must be lowercase")
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self._ignorecase = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        # _combined[i] matches where any of patterns[i:] does
+        self._combined: list[tuple[re.Pattern[str], dict[int, int]]] = []
+        for start in range(len(patterns) + 1):
+            wrappers: dict[int, int] = {}
+            group = 1
+            for index in range(start, len(patterns)):
+                wrappers[group] = index
+                group += 1 + self.patterns[index].groups
+            alternation = "|".join(f"({pattern})" for pattern in patterns[start:]) or "(?!)"
+            # A shared leading word boundary is checked once per position, not per pattern
+            boundary = r"\b" if all(pattern.startswith(r"\b") for pattern in patterns) else ""
+            self._combined.append((re.compile(f"{boundary}(?={alternation})"), wrappers))
+
+    def findall(self, text: str) -> list[list[tuple[int, int]]]:
+        """Spans of each pattern's group 1, as ``pattern.findall`` would find them."""
+        lower_text = _casefold_for_matching(text)
+        if lower_text is None:
+            return [[match.span(1) for match in pattern.finditer(text)] for pattern in self._ignorecase]
+
+        spans: list[list[tuple[int, int]]] = [[] for _ in self.patterns]
+        resume_at = [0] * len(self.patterns)
+        combined, wrappers = self._combined[0]
+        for match in combined.finditer(lower_text):
+            pos = match.start()
+            found: re.Match[str] | None = match
+            group_to_index = wrappers
+            while found is not None:
+                group = found.lastindex
+                assert group is not None
+                index = group_to_index[group]
+                # Like findall, skip matches overlapping this pattern's previous one
+                if pos >= resume_at[index]:
+                    spans[index].append(found.span(group + 1))
+                    resume_at[index] = found.end(group)
+                # Patterns listed later may match at this position too
+                rest, group_to_index = self._combined[index + 1]
+                found = rest.match(lower_text, pos)
+        return spans
+
+    def first(self, text: str) -> tuple[int, tuple[str | None, ...]] | None:
+        """Groups of the first match of the earliest-listed pattern that matches.
+
+        Equivalent to trying ``pattern.search`` for each pattern in order.
+
+        Returns:
+            (pattern index, match groups), or None if nothing matches
+        """
+        lower_text = _casefold_for_matching(text)
+        for index, pattern in enumerate(self.patterns):
+            if lower_text is None:
+                found = self._ignorecase[index].search(text)
+            else:
+                found = pattern.search(lower_text)
+            if found:
+                return index, tuple(
+                    text[start:end] if start >= 0 else None
+                    for start, end in (found.span(group) for group in range(1, pattern.groups + 1))
+                )
+        return None
+
+
+_TECH_MATCHER = _PatternSet(TECH_PATTERNS)
+_EXPERIENCE_MATCHER = _PatternSet(EXPERIENCE_PATTERNS)
+_SENIORITY_MATCHER = _PatternSet([pattern for pattern, _level in SENIORITY_PATTERNS])
+
+_EDUCATION_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), degree_name)
+    for pattern, degree_name in [
+        (r"(?:bachelor'?s?|b\.?s\.?|b\.?a\.?)(?:\s+degree)?(?:\s+in\s+([^,\n]+))?", "Bachelor's"),
+        (r"(?:master'?s?|m\.?s\.?|m\.?a\.?|mba)(?:\s+degree)?(?:\s+in\s+([^,\n]+))?", "Master's"),
+        (r"(?:ph\.?d\.?|doctorate)(?:\s+in\s+([^,\n]+))?", "Ph.D."),
+    ]
+]
+_NUMBERED_BULLET = re.compile(r"^\d+\.")
+_BULLET_PREFIX = re.compile(r"^[-•*·]\s*|\d+\.\s*")
+
+
 def extract_technologies(text: str) -> list[str]:
     """Extract technology keywords from text."""
     technologies = set()
-    for pattern in TECH_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
+    for pattern_spans in _TECH_MATCHER.findall(text):
+        for start, end in pattern_spans:
+            match = text[start:end]
             # Normalize the technology name
             tech = match.lower().strip()
             # Handle variations
@@ -172,24 +285,19 @@ def extract_technologies(text: str) -> list[str]:
 
 def extract_years_experience(text: str) -> int | None:
     """Extract years of experience requirement."""
-    for pattern in EXPERIENCE_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            # Get the first match
-            match = matches[0]
-            if isinstance(match, tuple):
-                # Range pattern - take the minimum
-                return int(match[0])
-            return int(match)
-    return None
+    first = _EXPERIENCE_MATCHER.first(text)
+    if first is None:
+        return None
+    # Range patterns match two numbers - take the minimum (the first)
+    return int(first[1][0])
 
 
 def extract_seniority_level(text: str) -> SeniorityLevel | None:
     """Extract seniority level from text."""
-    for pattern, level in SENIORITY_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return level  # type: ignore
-    return None
+    first = _SENIORITY_MATCHER.first(text)
+    if first is None:
+        return None
+    return SENIORITY_PATTERNS[first[0]][1]  # type: ignore
 
 
 def extract_requirements(text: str) -> ExtractedRequirements:
@@ -206,14 +314,8 @@ def extract_requirements(text: str) -> ExtractedRequirements:
     requirements.seniority_level = extract_seniority_level(text)
 
     # Extract education requirements
-    education_patterns = [
-        (r"(?:bachelor'?s?|b\.?s\.?|b\.?a\.?)(?:\s+degree)?(?:\s+in\s+([^,\n]+))?", "Bachelor's"),
-        (r"(?:master'?s?|m\.?s\.?|m\.?a\.?|mba)(?:\s+degree)?(?:\s+in\s+([^,\n]+))?", "Master's"),
-        (r"(?:ph\.?d\.?|doctorate)(?:\s+in\s+([^,\n]+))?", "Ph.D."),
-    ]
-    for pattern, degree_name in education_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
+    for pattern, degree_name in _EDUCATION_PATTERNS:
+        if pattern.search(text):
             # Add the degree type (not the regex pattern)
             if degree_name not in requirements.education:
                 requirements.education.append(degree_name)
@@ -242,8 +344,8 @@ def extract_requirements(text: str) -> ExtractedRequirements:
             continue
 
         # Extract bullet points
-        if line.startswith(("-", "•", "*", "·")) or re.match(r"^\d+\.", line):
-            bullet_text = re.sub(r"^[-•*·]\s*|\d+\.\s*", "", line).strip()
+        if line.startswith(("-", "•", "*", "·")) or _NUMBERED_BULLET.match(line):
+            bullet_text = _BULLET_PREFIX.sub("", line).strip()
             if bullet_text:
                 if in_nice_to_have_section:
                     requirements.nice_to_have.append(bullet_text)
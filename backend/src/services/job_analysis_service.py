@@ -1,19 +1,24 @@
 """Job Analysis Service - AI detection and fit scoring."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
 import structlog
 
 from src.config import settings
 from src.models import Job
 from src.models.job import RoleType
 from src.schemas.ai_analysis import AIJobAnalysisResult, Recommendation
+from src.services.cpu_executor import cpu_executor
 from src.services.jd_analyzer import (
     detect_and_parse_jd,
+    extract_seniority_level,
     extract_technologies,
+    extract_years_experience,
     JDAnalysisResult,
 )
-from src.services.location_service import validate_location_compatibility
+from src.services.location_service import LocationValidationResult, validate_location_compatibility
 from src.services.resume_service import resume_service
 
 logger = structlog.get_logger(__name__)
@@ -201,6 +206,11 @@ def _get_my_skills() -> set[str]:
 
 def _suggest_role(title: str | None, jd_result: JDAnalysisResult) -> RoleType | None:
     """Suggest the best role type based on job title and requirements."""
+    return _role_for_title(title, jd_result.requirements.seniority_level)
+
+
+def _role_for_title(title: str | None, seniority: str | None) -> RoleType | None:
+    """Suggest the best role type from a job title and the JD's seniority level."""
     import re
 
     if not title:
@@ -233,7 +243,6 @@ def _suggest_role(title: str | None, jd_result: JDAnalysisResult) -> RoleType |
         return RoleType.ARCHITECT
 
     # Check seniority from JD analysis
-    seniority = jd_result.requirements.seniority_level
     if seniority == "staff+":
         return RoleType.ARCHITECT
     elif seniority == "senior":
@@ -252,62 +261,105 @@ def _calculate_fit_score(
 ) -> tuple[int, list[str]]:
     """Calculate a fit score (0-100) and generate analysis notes."""
     score = 50  # Start at middle
-    notes = []
 
     # Role alignment (major factor)
-    if suggested_role:
-        if suggested_role in [RoleType.CTO, RoleType.VP]:
-            score += 20
-            notes.append(f"Executive role alignment: {suggested_role.value}")
-        elif suggested_role == RoleType.DIRECTOR:
-            score += 15
-            notes.append("Director-level role")
-        elif suggested_role == RoleType.ARCHITECT:
-            score += 10
-            notes.append("Architecture/Principal role")
+    score += ROLE_FIT_BONUSES.get(suggested_role, 0)
 
     # Technology match (important factor)
     total_tech = len(matched_tech) + len(missing_tech)
     if total_tech > 0:
         match_ratio = len(matched_tech) / total_tech
-        tech_score = int(match_ratio * 20)
-        score += tech_score
+        score += int(match_ratio * 20)
+        if match_ratio < 0.3 and total_tech > 3:
+            score -= 10
+
+    # AI-forward bonus (for interest alignment)
+    if is_ai_forward:
+        score += 10
+
+    # Experience level check
+    years_req = jd_result.requirements.years_experience
+    if years_req and years_req <= 15:  # Assuming 15+ years experience
+        score += 5
+
+    # Title relevance
+    tech_title, remote_title = _title_relevance(title)
+    if tech_title:
+        score += 5
+    if remote_title:
+        score += 3
+
+    # Clamp score to 0-100
+    score = max(0, min(100, score))
+
+    notes = _fit_notes(title, matched_tech, missing_tech, is_ai_forward, years_req, suggested_role)
+    return score, notes
+
+
+def _title_relevance(title: str | None) -> tuple[bool, bool]:
+    """Whether a job title is technology-focused and whether it mentions remote work."""
+    if not title:
+        return False, False
+    title_lower = title.lower()
+    return (
+        any(kw in title_lower for kw in ["software", "engineering", "technology", "technical"]),
+        any(kw in title_lower for kw in ["remote", "distributed"]),
+    )
+
+
+def _fit_notes(
+    title: str | None,
+    matched_tech: list[str],
+    missing_tech: list[str],
+    is_ai_forward: bool,
+    years_req: int | None,
+    suggested_role: RoleType | None,
+) -> list[str]:
+    """Generate the analysis notes explaining a fit score."""
+    notes = []
+
+    if suggested_role in [RoleType.CTO, RoleType.VP]:
+        notes.append(f"Executive role alignment: {suggested_role.value}")
+    elif suggested_role == RoleType.DIRECTOR:
+        notes.append("Director-level role")
+    elif suggested_role == RoleType.ARCHITECT:
+        notes.append("Architecture/Principal role")
+
+    total_tech = len(matched_tech) + len(missing_tech)
+    if total_tech > 0:
+        match_ratio = len(matched_tech) / total_tech
         if match_ratio >= 0.8:
             notes.append(f"Strong tech match: {len(matched_tech)}/{total_tech}")
         elif match_ratio >= 0.5:
             notes.append(f"Good tech match: {len(matched_tech)}/{total_tech}")
         elif match_ratio < 0.3 and total_tech > 3:
             notes.append(f"Tech gap: missing {', '.join(missing_tech[:3])}")
-            score -= 10
 
-    # AI-forward bonus (for interest alignment)
     if is_ai_forward:
-        score += 10
         notes.append("AI-forward company")
 
-    # Experience level check
-    years_req = jd_result.requirements.years_experience
     if years_req:
-        if years_req <= 15:  # Assuming 15+ years experience
-            score += 5
+        if years_req <= 15:
             notes.append(f"Experience requirement: {years_req}+ years (match)")
         elif years_req > 20:
             notes.append(f"High experience requirement: {years_req}+ years")
 
-    # Title relevance
-    if title:
-        title_lower = title.lower()
-        if any(kw in title_lower for kw in ["software", "engineering", "technology", "technical"]):
-            score += 5
-            notes.append("Technology-focused role")
-        if any(kw in title_lower for kw in ["remote", "distributed"]):
-            score += 3
-            notes.append("Remote-friendly")
+    tech_title, remote_title = _title_relevance(title)
+    if tech_title:
+        notes.append("Technology-focused role")
+    if remote_title:
+        notes.append("Remote-friendly")
 
-    # Clamp score to 0-100
-    score = max(0, min(100, score))
+    return notes
 
-    return score, notes
+
+# Fit score bonus for the suggested role
+ROLE_FIT_BONUSES = {
+    RoleType.CTO: 20,
+    RoleType.VP: 20,
+    RoleType.DIRECTOR: 15,
+    RoleType.ARCHITECT: 10,
+}
 
 
 # Role labels for display
@@ -459,18 +511,198 @@ def _calculate_role_scores(
     return role_scores
 
 
-def analyze_job_with_ai(
+# Role order of the columns in batch role-score matrices
+SCORED_ROLES = [RoleType.CTO, RoleType.VP, RoleType.DIRECTOR, RoleType.ARCHITECT, RoleType.DEVELOPER]
+
+# Rows are indexed by suggested role: SCORED_ROLES positions, then "no suggestion"
+_SUGGESTION_ROWS: list[RoleType | None] = [*SCORED_ROLES, None]
+_ROLE_ALIGNMENT_ARRAY = np.array([
+    [ROLE_ALIGNMENT_MATRIX.get(suggested, ROLE_ALIGNMENT_MATRIX[None]).get(role, 0) for role in SCORED_ROLES]
+    for suggested in _SUGGESTION_ROWS
+])
+_ROLE_FIT_BONUS_ARRAY = np.array([ROLE_FIT_BONUSES.get(suggested, 0) for suggested in _SUGGESTION_ROWS])
+
+# Years above this only ever compare as "more than 20"; keeps the array in int64
+_YEARS_CAP = 1_000_000
+
+
+def analyze_jobs_batch(jobs: Sequence[Job], skills: set[str] | None = None) -> list[JobAnalysisResult]:
+    """
+    Rule-based analysis of many jobs at once.
+
+    Produces the same results as calling analyze_job on each job, but
+    only extracts what scoring needs from each description, then scores
+    every job against the resume with NumPy: the extracted technologies
+    form a sparse job x technology matrix that is matched against the
+    skill set in one pass, and fit scores for all SCORED_ROLES are
+    computed as whole-array operations.
+
+    Args:
+        jobs: Jobs to analyze (description_raw, title, company, location
+            and work_location_type are used)
+        skills: Lowercased resume skills to match against (default: the
+            current resume, as analyze_job uses)
+
+    Returns:
+        One JobAnalysisResult per job, in order
+    """
+    if skills is None:
+        skills = _get_my_skills()
+    count = len(jobs)
+
+    # Per-job text extraction (regex work; independent of the resume).
+    # Reposted jobs share descriptions, so each is only scanned once.
+    extracted: dict[str, tuple[list[str], int | None, str | None]] = {}
+    technologies: list[list[str]] = []
+    years: list[int | None] = []
+    seniorities: list[str | None] = []
+    culture_counts = np.zeros(count, dtype=np.int64)
+    keyword_counts = np.zeros(count, dtype=np.int64)
+    for row, job in enumerate(jobs):
+        description = job.description_raw or ""
+        if description not in extracted:
+            extracted[description] = (
+                extract_technologies(description),
+                extract_years_experience(description),
+                extract_seniority_level(description),
+            )
+        job_technologies, job_years, job_seniority = extracted[description]
+        technologies.append(job_technologies)
+        years.append(job_years)
+        seniorities.append(job_seniority)
+        lower_text = " ".join(filter(None, [job.title, job.company, description])).lower()
+        culture_counts[row] = sum(1 for kw in AI_CULTURE_INDICATORS if kw in lower_text)
+        if not culture_counts[row]:
+            keyword_counts[row] = sum(1 for kw in AI_FORWARD_KEYWORDS if kw in lower_text)
+
+    # Sparse job x technology matrix in coordinate form. AI technologies are
+    # counted once per lowercased name, so they get their own columns.
+    vocabulary: dict[str, int] = {}
+    lower_vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    columns: list[int] = []
+    lower_columns: list[int] = []
+    for row, job_technologies in enumerate(technologies):
+        for tech in job_technologies:
+            rows.append(row)
+            columns.append(vocabulary.setdefault(tech, len(vocabulary)))
+            lower_columns.append(lower_vocabulary.setdefault(tech.lower(), len(lower_vocabulary)))
+    row_ids = np.array(rows, dtype=np.int64)
+    column_ids = np.array(columns, dtype=np.int64)
+    lower_column_ids = np.array(lower_columns, dtype=np.int64)
+
+    is_skill = np.array([tech.lower() in skills for tech in vocabulary], dtype=bool)
+    is_ai_tech = np.array([tech in AI_FORWARD_KEYWORDS for tech in lower_vocabulary], dtype=bool)
+
+    total_tech = np.bincount(row_ids, minlength=count)
+    matched_tech = np.bincount(row_ids, weights=is_skill[column_ids], minlength=count).astype(np.int64)
+    # Distinct (job, lowercased technology) pairs, encoded as row * width + column
+    width = max(len(lower_vocabulary), 1)
+    lower_pairs = np.unique(row_ids * width + lower_column_ids)
+    ai_tech_counts = np.bincount(
+        lower_pairs // width, weights=is_ai_tech[lower_pairs % width], minlength=count
+    ).astype(np.int64)
+
+    # AI-forward detection (see _detect_ai_forward)
+    has_culture = culture_counts > 0
+    many_ai_tech = ai_tech_counts >= 3
+    some_ai = (ai_tech_counts >= 1) | (keyword_counts >= 3)
+    some_ai_confidence = np.minimum(0.4 + ai_tech_counts * 0.15 + keyword_counts * 0.05, 0.8)
+    ai_confidence = np.select(
+        [has_culture, many_ai_tech, some_ai],
+        [
+            np.minimum(0.9 + culture_counts * 0.05, 1.0),
+            np.minimum(0.7 + ai_tech_counts * 0.05, 0.95),
+            some_ai_confidence,
+        ],
+        default=0.1,
+    )
+    is_ai_forward = has_culture | many_ai_tech | (some_ai & (some_ai_confidence > 0.5))
+
+    # Title-derived features; titles repeat a lot, so each is computed once
+    title_features: dict[tuple[str | None, str | None], tuple[int, bool, bool]] = {}
+    suggestion_index = np.empty(count, dtype=np.int64)
+    tech_title = np.empty(count, dtype=bool)
+    remote_title = np.empty(count, dtype=bool)
+    for row, job in enumerate(jobs):
+        key = (job.title, seniorities[row])
+        if key not in title_features:
+            suggested = _role_for_title(job.title, seniorities[row])
+            title_features[key] = (_SUGGESTION_ROWS.index(suggested), *_title_relevance(job.title))
+        suggestion_index[row], tech_title[row], remote_title[row] = title_features[key]
+
+    # Score components shared by the fit score and every role score
+    years_required = np.array([min(value or 0, _YEARS_CAP) for value in years], dtype=np.int64)
+    match_ratio = np.divide(
+        matched_tech, total_tech, out=np.zeros(count), where=total_tech > 0
+    )
+    common = (
+        np.floor(match_ratio * 20).astype(np.int64)
+        - 10 * ((total_tech > 3) & (match_ratio < 0.3))
+        + 10 * is_ai_forward
+        + 5 * ((years_required > 0) & (years_required <= 15))
+        + 5 * tech_title
+        + 3 * remote_title
+    )
+    priorities = np.clip(50 + _ROLE_FIT_BONUS_ARRAY[suggestion_index] + common, 0, 100)
+    role_scores = np.clip(40 + _ROLE_ALIGNMENT_ARRAY[suggestion_index] + common[:, None], 0, 100)
+
+    locations: dict[tuple[str | None, str | None], LocationValidationResult] = {}
+    results = []
+    for row, job in enumerate(jobs):
+        matched = [t for t in technologies[row] if t.lower() in skills]
+        missing = [t for t in technologies[row] if t.lower() not in skills]
+        suggested_role = _SUGGESTION_ROWS[suggestion_index[row]]
+        notes = _fit_notes(
+            job.title, matched, missing, bool(is_ai_forward[row]), years[row], suggested_role
+        )
+
+        work_location_type = job.work_location_type.value if job.work_location_type else None
+        location_key = (job.location, work_location_type)
+        if location_key not in locations:
+            locations[location_key] = validate_location_compatibility(job.location, work_location_type)
+        location_result = locations[location_key]
+        if not location_result.is_compatible:
+            notes.append(f"LOCATION INCOMPATIBLE: {location_result.reason}")
+
+        results.append(JobAnalysisResult(
+            is_ai_forward=bool(is_ai_forward[row]),
+            ai_confidence=float(ai_confidence[row]),
+            suggested_priority=int(priorities[row]),
+            suggested_role=suggested_role,
+            technologies_matched=matched,
+            technologies_missing=missing,
+            years_experience_required=years[row],
+            seniority_level=seniorities[row],
+            analysis_notes=notes,
+            role_scores=[
+                RoleScore(role=role, score=int(score), label=ROLE_LABELS[role])
+                for role, score in zip(SCORED_ROLES, role_scores[row])
+            ],
+            is_location_compatible=location_result.is_compatible,
+            location_notes=location_result.reason,
+        ))
+
+    return results
+
+
+async def analyze_job_with_ai(
     job: Job,
     use_ai: bool = True,
     use_cache: bool = True,
+    timeout: float | None = None,
 ) -> tuple[JobAnalysisResult, AIJobAnalysisResult | None]:
     """
     Analyze a job using AI when available, with rule-based fallback.
 
+    The Claude call is awaited on the async client, so a slow analysis
+    does not block other requests on the event loop.
+
     Args:
         job: The Job model to analyze
         use_ai: Whether to attempt AI analysis (default True)
         use_cache: Whether to use cached AI results (default True)
+        timeout: Deadline in seconds for the AI call (default from settings)
 
     Returns:
         Tuple of (JobAnalysisResult, AIJobAnalysisResult or None)
@@ -483,7 +715,12 @@ def analyze_job_with_ai(
         # Check cache first
         if use_cache:
             from src.services.analysis_cache import analysis_cache
-            cached = analysis_cache.get(str(job.id), job.description_raw)
+            try:
+                cached = await analysis_cache.get_for_job_async(job)
+            except Exception as e:
+                # An unreadable cache is a miss, not a reason to skip the AI
+                logger.warning("ai_analysis_cache_read_failed", job_id=str(job.id), error=str(e) or type(e).__name__)
+                cached = None
             if cached:
                 logger.info("ai_analysis_cache_hit", job_id=str(job.id))
                 return _convert_ai_to_legacy(cached), cached
@@ -491,25 +728,30 @@ def analyze_job_with_ai(
         # Try AI analysis
         try:
             from src.services.ai_analysis_service import ai_analysis_service
-            ai_result = ai_analysis_service.analyze(job)
-
-            # Cache the result
-            if use_cache:
-                from src.services.analysis_cache import analysis_cache
-                analysis_cache.set(str(job.id), job.description_raw, ai_result)
-
-            return _convert_ai_to_legacy(ai_result), ai_result
-
+            ai_result = await ai_analysis_service.analyze_async(job, timeout=timeout)
         except Exception as e:
             logger.warning(
                 "ai_analysis_fallback",
                 job_id=str(job.id),
-                error=str(e),
+                error=str(e) or type(e).__name__,
                 reason="AI analysis failed, using rule-based",
             )
+        else:
+            # Cache the result; failing to do so doesn't discard it
+            if use_cache:
+                from src.services.analysis_cache import analysis_cache
+                try:
+                    await analysis_cache.set_for_job_async(job, ai_result)
+                except Exception as e:
+                    logger.warning(
+                        "ai_analysis_cache_write_failed", job_id=str(job.id), error=str(e) or type(e).__name__
+                    )
+
+            return _convert_ai_to_legacy(ai_result), ai_result
 
     # Fall back to rule-based analysis
-    legacy_result = analyze_job(
+    legacy_result = await cpu_executor.run(
+        analyze_job,
         description=job.description_raw or "",
         title=job.title,
         company=job.company,
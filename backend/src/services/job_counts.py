@@ -0,0 +1,147 @@
+"""Totals for list_jobs without a full count on every call.
+
+Three strategies:
+
+- ``exact`` runs ``count(*)`` over the filtered query (the original).
+- ``estimated`` asks the planner: ``EXPLAIN`` of the filtered query gives
+  its row estimate (from ``pg_class.reltuples`` and column statistics) in
+  well under a millisecond, at the accuracy of the last ANALYZE.
+- ``cached`` keeps exact counts per filter signature. An entry is used
+  while ``max(jobs.updated_at)`` (an index-only read) is unchanged and it
+  is younger than the TTL; committing a job write in this process drops
+  every entry at once. Every job write, including soft deletes, bumps
+  ``updated_at``, so other processes' writes are seen on the next call.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Literal
+
+from sqlalchemy import ClauseElement, Executable, Select, event, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.models import Job
+
+CountMode = Literal["exact", "estimated", "cached"]
+
+_WRITES_KEY = "job_count_cache_writes"
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON)
+def _compile_explain(element: _ExplainJSON, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class JobCountCache:
+    """Exact list_jobs totals per filter signature, validated by the jobs watermark."""
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 60.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[int, datetime | None, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def signature(query: Select) -> str:
+        """Key identifying a filtered query: its SQL and bound values."""
+        compiled = query.compile(dialect=postgresql.dialect())
+        return f"{compiled}|{sorted(compiled.params.items())!r}"
+
+    def get(self, key: str, watermark: datetime | None) -> int | None:
+        """Cached total for a key, if still valid at this watermark."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        total, entry_watermark, stored_at = entry
+        if entry_watermark != watermark or time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return total
+
+    def put(self, key: str, watermark: datetime | None, total: int) -> None:
+        """Store a total, evicting the least recently used entry when full."""
+        self._entries[key] = (total, watermark, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached total."""
+        self._entries.clear()
+
+
+async def exact_count(db: AsyncSession, query: Select) -> int:
+    """count(*) over a filtered query."""
+    return await db.scalar(select(func.count()).select_from(query.subquery())) or 0
+
+
+async def estimated_count(db: AsyncSession, query: Select) -> int:
+    """The planner's row estimate for a filtered query."""
+    raw = await db.scalar(_ExplainJSON(query))
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_jobs(db: AsyncSession, query: Select, mode: CountMode) -> tuple[int, bool]:
+    """
+    Total jobs matching a list_jobs query.
+
+    Args:
+        db: Database session
+        query: The filtered select(Job) query, before ordering and paging
+        mode: Counting strategy
+
+    Returns:
+        (total, whether the total is an estimate)
+    """
+    if mode == "estimated":
+        return await estimated_count(db, query), True
+    if mode == "exact":
+        return await exact_count(db, query), False
+
+    key = job_count_cache.signature(query)
+    watermark = await db.scalar(select(func.max(Job.updated_at)))
+    total = job_count_cache.get(key, watermark)
+    if total is None:
+        total = await exact_count(db, query)
+        job_count_cache.put(key, watermark, total)
+    return total, False
+
+
+@event.listens_for(Session, "after_flush")
+def _note_job_writes(session: Session, flush_context: Any) -> None:
+    if any(isinstance(obj, Job) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_job_writes(session: Session) -> None:
+    if session.info.pop(_WRITES_KEY, False):
+        job_count_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_job_writes(session: Session) -> None:
+    session.info.pop(_WRITES_KEY, None)
+
+
+# Singleton instance
+job_count_cache = JobCountCache(ttl_seconds=settings.job_count_cache_ttl_seconds)
@@ -0,0 +1,112 @@
+"""Keyset (cursor) pagination for list_jobs.
+
+A cursor records where a page ended: the sort key of its last job plus
+that job's ``created_at`` and ``id`` as tie-breakers, so the next page is
+"rows after this one in sort order" instead of ``OFFSET n``. Each page is
+then a range scan of the matching ``idx_jobs_keyset_*`` index, however
+deep, and rows updated or inserted between requests cannot shift the
+page boundary to skip or repeat jobs.
+
+All three keys sort in the same direction so the boundary is a single
+row comparison, ``(key, created_at, id) < (...)``. The salary key is
+NULL for jobs without a salary; those always sort last, so they are
+handled as their own run after every non-NULL salary.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, or_, tuple_
+
+from src.models import Job
+
+# Sort keys that can be NULL (always ordered last)
+NULLABLE_SORT_KEYS = {"salary"}
+DATETIME_SORT_KEYS = {"updated_at", "created_at"}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or was issued for another sort."""
+
+
+@dataclass
+class Cursor:
+    """Position after the last job of a page."""
+
+    sort_by: str
+    sort_order: str
+    value: Any
+    created_at: datetime
+    id: UUID
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Serialize a cursor into an opaque URL-safe token."""
+    value = cursor.value.isoformat() if isinstance(cursor.value, datetime) else cursor.value
+    payload = [cursor.sort_by, cursor.sort_order, value, cursor.created_at.isoformat(), str(cursor.id)]
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort_by: str, sort_order: str) -> Cursor:
+    """
+    Parse a cursor token issued for the given sort.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or for a different sort
+    """
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        cursor_sort_by, cursor_sort_order, value, created_at, job_id = json.loads(data)
+        if cursor_sort_by in DATETIME_SORT_KEYS:
+            value = datetime.fromisoformat(value)
+        cursor = Cursor(
+            sort_by=cursor_sort_by,
+            sort_order=cursor_sort_order,
+            value=value,
+            created_at=datetime.fromisoformat(created_at),
+            id=UUID(job_id),
+        )
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+    if (cursor.sort_by, cursor.sort_order) != (sort_by, sort_order):
+        raise InvalidCursorError("Cursor was issued for a different sort; start again without it")
+    return cursor
+
+
+def keyset_order(sort_column: ColumnElement, sort_by: str, descending: bool) -> list[ColumnElement]:
+    """ORDER BY clauses giving every job a fixed position for the sort."""
+    columns = [sort_column, Job.created_at, Job.id]
+    clauses = [column.desc() if descending else column.asc() for column in columns]
+    if sort_by in NULLABLE_SORT_KEYS:
+        clauses[0] = clauses[0].nulls_last()
+    return clauses
+
+
+def keyset_filter(sort_column: ColumnElement, cursor: Cursor, descending: bool) -> ColumnElement:
+    """WHERE clause selecting the jobs after a cursor, in keyset_order."""
+
+    def after(left, right) -> ColumnElement:
+        return left < right if descending else left > right
+
+    tie_breakers = after(tuple_(Job.created_at, Job.id), tuple_(cursor.created_at, cursor.id))
+    if cursor.sort_by not in NULLABLE_SORT_KEYS:
+        return after(
+            tuple_(sort_column, Job.created_at, Job.id),
+            tuple_(cursor.value, cursor.created_at, cursor.id),
+        )
+    if cursor.value is None:
+        # Already into the trailing NULLs
+        return and_(sort_column.is_(None), tie_breakers)
+    return or_(
+        after(
+            tuple_(sort_column, Job.created_at, Job.id),
+            tuple_(cursor.value, cursor.created_at, cursor.id),
+        ),
+        sort_column.is_(None),
+    )
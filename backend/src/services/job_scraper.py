@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
+from functools import partial
 import json
 import re
+import time
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -12,6 +17,12 @@ import httpx
 from bs4 import BeautifulSoup
 import structlog
 
+from src.config import settings
+
+from .cpu_executor import cpu_executor
+from .html_cache import HTMLCache
+from .html_scanner import PageScan, html_to_text, scan_page
+
 
 class JobScrapeError(ValueError):
     """Raised when a job cannot be scraped or parsed."""
@@ -82,11 +93,15 @@ def _iter_json_ld(data: Any) -> list[dict[str, Any]]:
 
 def _extract_job_posting(soup: BeautifulSoup) -> dict[str, Any] | None:
     scripts = soup.find_all("script", type="application/ld+json")
-    for script in scripts:
-        if not script.string:
+    return _find_job_posting(script.string for script in scripts)
+
+
+def _find_job_posting(blocks: Iterable[str | None]) -> dict[str, Any] | None:
+    for block in blocks:
+        if not block:
             continue
         try:
-            data = json.loads(script.string)
+            data = json.loads(block)
         except json.JSONDecodeError:
             continue
         for item in _iter_json_ld(data):
@@ -389,118 +404,236 @@ def _fallback_parse(soup: BeautifulSoup, source: str) -> tuple[str | None, str |
     return None, None, None, None
 
 
+def parse_job_html(
+    url: str,
+    html: str,
+    source: str | None = None,
+    parser_backend: str = "fast",
+) -> ScrapedJob:
+    """Parse a job posting page.
+
+    Pure function of its arguments, so it can run in a worker process.
+
+    Args:
+        url: Page URL (for source detection and the source id)
+        html: Page HTML
+        source: Job board; detected from the URL if omitted
+        parser_backend: "fast" or "bs4" (see ``scrape_parser_backend``)
+
+    Raises:
+        JobScrapeError: Unsupported board, or no title/company found
+    """
+    resolved_source = (source or detect_source(url) or "").lower()
+    if resolved_source not in SUPPORTED_SOURCES:
+        raise JobScrapeError("Unsupported job board URL")
+
+    # The fast backend reads JSON-LD and meta tags without building a
+    # tree; the soup is only built if selectors are needed below.
+    fast = parser_backend == "fast"
+    soup: BeautifulSoup | None = None
+    page: PageScan | None = None
+    if fast:
+        page = scan_page(html, easy_apply=resolved_source == "linkedin")
+        job_posting = _find_job_posting(page.json_ld)
+        meta_content = page.meta_content
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+        job_posting = _extract_job_posting(soup)
+        meta_content = partial(_meta_content, soup)
+
+    title = None
+    company = None
+    location = None
+    description = None
+
+    if job_posting:
+        title = _clean_text(job_posting.get("title"))
+        description_value = job_posting.get("description")
+        if isinstance(description_value, str):
+            if fast:
+                description = _clean_text(html_to_text(description_value))
+            else:
+                description = _clean_text(
+                    BeautifulSoup(description_value, "html.parser").get_text(" ", strip=True)
+                )
+        org = job_posting.get("hiringOrganization")
+        if isinstance(org, dict):
+            company = _clean_text(org.get("name"))
+        location = _extract_location(job_posting)
+
+    if not title:
+        title = meta_content(["meta[property='og:title']", "meta[name='twitter:title']"])
+    if not description:
+        description = meta_content(["meta[property='og:description']", "meta[name='description']"])
+
+    if soup is None and not all([title, company, location, description]):
+        soup = BeautifulSoup(html, "html.parser")
+
+    if not all([title, company, location, description]):
+        fallback_title, fallback_company, fallback_location, fallback_description = _fallback_parse(
+            soup,
+            resolved_source,
+        )
+        title = title or fallback_title
+        company = company or fallback_company
+        location = location or fallback_location
+        description = description or fallback_description
+
+    title = _clean_text(title) or ""
+    company = _clean_text(company) or ""
+    location = _clean_text(location)
+    description = _clean_text(description)
+
+    if not title or not company:
+        raise JobScrapeError("Failed to parse job title or company")
+
+    # Detect Easy Apply for LinkedIn jobs
+    is_easy_apply = False
+    if resolved_source == "linkedin":
+        if page is not None and page.easy_apply is not None:
+            is_easy_apply = page.easy_apply
+        else:
+            if soup is None:
+                soup = BeautifulSoup(html, "html.parser")
+            is_easy_apply = _detect_linkedin_easy_apply(soup)
+
+    # Extract enhanced fields from JSON-LD
+    salary_min = None
+    salary_max = None
+    salary_currency = None
+    employment_type = None
+    work_location_type = None
+    posted_at = None
+
+    if job_posting:
+        salary_min, salary_max, salary_currency = _extract_salary(job_posting)
+        employment_type = _extract_employment_type(job_posting)
+        work_location_type = _extract_work_location_type(job_posting)
+        posted_at = _extract_posted_date(job_posting)
+
+    return ScrapedJob(
+        title=title,
+        company=company,
+        location=location,
+        description=description,
+        source=resolved_source,
+        source_id=extract_source_id(url, resolved_source),
+        raw_html=html,
+        is_easy_apply=is_easy_apply,
+        salary_min=salary_min,
+        salary_max=salary_max,
+        salary_currency=salary_currency,
+        employment_type=employment_type,
+        work_location_type=work_location_type,
+        posted_at=posted_at,
+    )
+
+
+def _parse_detached(url: str, html: str, source: str | None, parser_backend: str) -> ScrapedJob:
+    """parse_job_html without echoing the page back across the process boundary."""
+    return replace(parse_job_html(url, html, source, parser_backend), raw_html="")
+
+
 logger = structlog.get_logger(__name__)
 
 
 class JobScraper:
     """Scrape and parse job postings."""
 
-    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        per_host_limit: int | None = None,
+        cache: HTMLCache | None = None,
+        parser_backend: str | None = None,
+    ) -> None:
+        """Create a scraper.
+
+        Args:
+            client: HTTP client to use; by default a shared pooled client is
+                created on first use and closed by ``aclose``
+            per_host_limit: Maximum concurrent requests to a single host
+            cache: On-disk page cache for conditional GETs and parse reuse
+            parser_backend: "fast" (streaming scan, BeautifulSoup only for
+                selector fallbacks) or "bs4"; defaults to the setting
+        """
         self._client = client
+        self._owns_client = client is None
+        self._host_limits: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(per_host_limit or settings.scrape_per_host_concurrency)
+        )
+        self.cache = cache
+        self.parser_backend = parser_backend or settings.scrape_parser_backend
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Process-wide pooled client (HTTP/2, keep-alive), created lazily."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                headers={"User-Agent": "Mozilla/5.0 (compatible; MeridianJobTracker/1.0)"},
+                follow_redirects=True,
+                timeout=httpx.Timeout(20.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=settings.scrape_max_connections,
+                    max_keepalive_connections=settings.scrape_max_connections,
+                    keepalive_expiry=settings.scrape_keepalive_seconds,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client if this scraper created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch_html(self, url: str) -> str:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; MeridianJobTracker/1.0)",
-        }
-        timeout = httpx.Timeout(20.0, connect=10.0)
-        if self._client:
-            response = await self._client.get(url, headers=headers, follow_redirects=True, timeout=timeout)
-        else:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, follow_redirects=True, timeout=timeout)
+        """Fetch a page, revalidating a cached copy with a conditional GET."""
+        # The cache does blocking file I/O; keep it off the event loop
+        record = await asyncio.to_thread(self.cache.lookup, url) if self.cache else None
+        headers = record.validators() if record else {}
+
+        async with self._host_limits[urlparse(url).hostname or ""]:
+            response = await self.client.get(url, headers=headers)
+            if response.status_code == 304 and record is not None and self.cache is not None:
+                body = await asyncio.to_thread(self.cache.read_body, record)
+                if body is not None:
+                    await asyncio.to_thread(self.cache.record_hit, url)
+                    return body
+                # Cached body vanished; fetch it unconditionally
+                response = await self.client.get(url)
+
         response.raise_for_status()
+        if self.cache is not None:
+            await asyncio.to_thread(
+                self.cache.store,
+                url,
+                response.text,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
         return response.text
 
-    def parse(self, url: str, html: str, source: str | None = None) -> ScrapedJob:
-        resolved_source = (source or detect_source(url) or "").lower()
-        if resolved_source not in SUPPORTED_SOURCES:
-            raise JobScrapeError("Unsupported job board URL")
-
-        soup = BeautifulSoup(html, "html.parser")
-        job_posting = _extract_job_posting(soup)
-
-        title = None
-        company = None
-        location = None
-        description = None
-
-        if job_posting:
-            title = _clean_text(job_posting.get("title"))
-            description_value = job_posting.get("description")
-            if isinstance(description_value, str):
-                description = _clean_text(
-                    BeautifulSoup(description_value, "html.parser").get_text(" ", strip=True)
-                )
-            org = job_posting.get("hiringOrganization")
-            if isinstance(org, dict):
-                company = _clean_text(org.get("name"))
-            location = _extract_location(job_posting)
-
-        if not title:
-            title = _meta_content(soup, ["meta[property='og:title']", "meta[name='twitter:title']"])
-        if not description:
-            description = _meta_content(soup, ["meta[property='og:description']", "meta[name='description']"])
-
-        if not any([title, company, location, description]):
-            title, company, location, description = _fallback_parse(soup, resolved_source)
-        else:
-            fallback_title, fallback_company, fallback_location, fallback_description = _fallback_parse(
-                soup,
-                resolved_source,
-            )
-            title = title or fallback_title
-            company = company or fallback_company
-            location = location or fallback_location
-            description = description or fallback_description
-
-        title = _clean_text(title) or ""
-        company = _clean_text(company) or ""
-        location = _clean_text(location)
-        description = _clean_text(description)
-
-        if not title or not company:
-            raise JobScrapeError("Failed to parse job title or company")
-
-        # Detect Easy Apply for LinkedIn jobs
-        is_easy_apply = False
-        if resolved_source == "linkedin":
-            is_easy_apply = _detect_linkedin_easy_apply(soup)
+    async def _parse_cached(self, url: str, html: str, source: str | None) -> ScrapedJob:
+        """Parse a page off the event loop, reusing the cached result for an identical body."""
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get_parsed, url, html, source, self.parser_backend)
+            if cached is not None:
+                return cached
+        scraped = await cpu_executor.run(_parse_detached, url, html, source, self.parser_backend)
+        scraped = replace(scraped, raw_html=html)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put_parsed, url, html, source, self.parser_backend, scraped)
+        return scraped
 
-        # Extract enhanced fields from JSON-LD
-        salary_min = None
-        salary_max = None
-        salary_currency = None
-        employment_type = None
-        work_location_type = None
-        posted_at = None
-
-        if job_posting:
-            salary_min, salary_max, salary_currency = _extract_salary(job_posting)
-            employment_type = _extract_employment_type(job_posting)
-            work_location_type = _extract_work_location_type(job_posting)
-            posted_at = _extract_posted_date(job_posting)
-
-        return ScrapedJob(
-            title=title,
-            company=company,
-            location=location,
-            description=description,
-            source=resolved_source,
-            source_id=extract_source_id(url, resolved_source),
-            raw_html=html,
-            is_easy_apply=is_easy_apply,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
-            employment_type=employment_type,
-            work_location_type=work_location_type,
-            posted_at=posted_at,
-        )
+    def parse(self, url: str, html: str, source: str | None = None) -> ScrapedJob:
+        return parse_job_html(url, html, source, self.parser_backend)
 
     async def scrape(self, url: str, source: str | None = None) -> ScrapedJob:
         logger.info("job_scrape_start", url=url, source=source)
         html = await self.fetch_html(url)
-        scraped = self.parse(url, html, source)
+        scraped = await self._parse_cached(url, html, source)
         logger.info(
             "job_scrape_success",
             url=url,
@@ -509,5 +642,58 @@ class JobScraper:
         )
         return scraped
 
-
-job_scraper = JobScraper()
+    async def scrape_many(
+        self,
+        targets: Sequence[tuple[str, str | None]],
+        max_concurrency: int = 10,
+    ) -> list[ScrapedJob | JobScrapeError]:
+        """Scrape many URLs concurrently.
+
+        Fetches run in parallel up to ``max_concurrency`` overall and the
+        scraper's per-host limit, so a batch spread over many job boards
+        finishes in roughly the time of its slowest host rather than the sum
+        of every fetch. Each page is parsed as soon as its fetch completes.
+
+        Args:
+            targets: (url, source) pairs
+            max_concurrency: Maximum fetches in flight overall
+
+        Returns:
+            One ScrapedJob or JobScrapeError per target, in input order
+        """
+        overall = asyncio.Semaphore(max_concurrency)
+        started = time.monotonic()
+
+        async def scrape_one(url: str, source: str | None) -> ScrapedJob | JobScrapeError:
+            if (source or detect_source(url) or "").lower() not in SUPPORTED_SOURCES:
+                return JobScrapeError("Unsupported job board URL")
+            try:
+                async with overall:
+                    html = await self.fetch_html(url)
+            except httpx.HTTPError as exc:
+                return JobScrapeError(f"Failed to fetch URL: {exc}")
+            try:
+                return await self._parse_cached(url, html, source)
+            except JobScrapeError as exc:
+                return exc
+
+        results = await asyncio.gather(*(scrape_one(url, source) for url, source in targets))
+        logger.info(
+            "job_scrape_batch",
+            urls=len(targets),
+            hosts=len({urlparse(url).hostname for url, _ in targets}),
+            failed=sum(isinstance(result, JobScrapeError) for result in results),
+            duration_ms=round((time.monotonic() - started) * 1000, 1),
+        )
+        return results
+
+
+job_scraper = JobScraper(
+    cache=HTMLCache(
+        directory=settings.scrape_cache_dir,
+        ttl_seconds=settings.scrape_cache_ttl_seconds,
+        max_bytes=settings.scrape_cache_max_mb * 1024 * 1024,
+    )
+    if settings.scrape_cache_enabled
+    else None
+)
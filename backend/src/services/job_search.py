@@ -0,0 +1,103 @@
+"""Job search predicates for list_jobs.
+
+Two modes:
+
+- ``fulltext`` matches the ``idx_jobs_fts`` expression with
+  ``websearch_to_tsquery`` (so ``"staff engineer" -contract`` works), ORed
+  with title/company substring matches that the ``pg_trgm`` indexes serve
+  and a primary-key range for job ID prefixes. Every arm is index-backed.
+- ``substring`` is the original ``ILIKE '%term%'`` over title, company,
+  description and ID: a sequential scan, kept for exact substring needs.
+
+The full-text document must stay byte-for-byte the indexed expression
+(migration 001) or Postgres will not use the index, so the language and
+separators are rendered as SQL literals rather than bound parameters.
+"""
+
+import re
+from typing import Literal
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, String, cast, func, literal_column
+
+from src.models import Job
+
+SearchMode = Literal["fulltext", "substring"]
+
+# pg_trgm extracts no trigrams from shorter patterns, so they can't use its indexes
+TRIGRAM_MIN_LENGTH = 3
+# Shorter hex strings are more likely words ("cafe") than ID prefixes
+ID_PREFIX_MIN_LENGTH = 6
+
+_TS_CONFIG = literal_column("'english'")
+_EMPTY = literal_column("''")
+_SPACE = literal_column("' '")
+_HEX = re.compile(r"^[0-9a-f]+$")
+
+
+def fulltext_document() -> ColumnElement:
+    """The tsvector expression indexed by idx_jobs_fts."""
+    return func.to_tsvector(
+        _TS_CONFIG,
+        func.coalesce(Job.description_raw, _EMPTY)
+        + _SPACE
+        + func.coalesce(Job.title, _EMPTY)
+        + _SPACE
+        + func.coalesce(Job.company, _EMPTY),
+    )
+
+
+def fulltext_query(search: str) -> ColumnElement:
+    """Parse user search syntax (quotes, OR, -term) into a tsquery."""
+    return func.websearch_to_tsquery(_TS_CONFIG, search)
+
+
+def id_range(search: str) -> tuple[UUID, UUID] | None:
+    """
+    Primary-key range of the job IDs starting with a search term.
+
+    UUIDs sort by their bytes, so a hex prefix is a contiguous range of
+    the primary key index.
+
+    Returns:
+        (lowest, highest) IDs with that prefix, or None if the term can't
+        be an ID prefix
+    """
+    digits = search.strip().lower().replace("-", "")
+    if not ID_PREFIX_MIN_LENGTH <= len(digits) <= 32 or not _HEX.match(digits):
+        return None
+    return UUID(digits.ljust(32, "0")), UUID(digits.ljust(32, "f"))
+
+
+def search_filter(search: str, mode: SearchMode = "fulltext") -> ColumnElement:
+    """
+    WHERE clause matching jobs for a list_jobs search term.
+
+    Args:
+        search: The user's search text
+        mode: ``fulltext`` (indexed) or ``substring`` (sequential scan)
+
+    Returns:
+        A boolean expression over Job
+    """
+    pattern = f"%{search}%"
+    if mode == "substring":
+        return (
+            Job.title.ilike(pattern)
+            | Job.company.ilike(pattern)
+            | Job.description_raw.ilike(pattern)
+            | cast(Job.id, String).ilike(pattern)
+        )
+
+    clause = fulltext_document().op("@@")(fulltext_query(search))
+    if len(search.strip()) >= TRIGRAM_MIN_LENGTH:
+        clause = clause | Job.title.ilike(pattern) | Job.company.ilike(pattern)
+    bounds = id_range(search)
+    if bounds is not None:
+        clause = clause | Job.id.between(*bounds)
+    return clause
+
+
+def search_rank(search: str) -> ColumnElement:
+    """Relevance of a job to a search term, higher first (fulltext mode)."""
+    return func.ts_rank(fulltext_document(), fulltext_query(search))
@@ -0,0 +1,54 @@
+"""Dashboard counters from the trigger-maintained job_stat_counts table.
+
+The table holds one row per (status, job board, easy apply, description
+state) combination, so every counter comes from a single read of a few
+dozen rows instead of count(*) scans of jobs.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import JobStatCount, JobStatus
+
+APPLIED_STATUSES = {JobStatus.APPLIED.value, JobStatus.INTERVIEWING.value, JobStatus.OFFER.value}
+
+
+@dataclass
+class JobStats:
+    """Counts of live jobs."""
+
+    total: int = 0
+    by_status: Counter[str] = field(default_factory=Counter)
+    by_job_board: Counter[str] = field(default_factory=Counter)  # '' for jobs without a board
+    by_description_state: Counter[str] = field(default_factory=Counter)
+    easy_apply: int = 0
+
+    @property
+    def applied(self) -> int:
+        """Jobs applied to, including those interviewing or with an offer."""
+        return sum(self.by_status[status] for status in APPLIED_STATUSES)
+
+
+async def get_job_stats(db: AsyncSession) -> JobStats:
+    """Aggregate the job_stat_counts rows."""
+    rows = await db.execute(
+        select(
+            JobStatCount.status,
+            JobStatCount.job_board,
+            JobStatCount.is_easy_apply,
+            JobStatCount.description_state,
+            JobStatCount.job_count,
+        ).where(JobStatCount.job_count > 0)
+    )
+    stats = JobStats()
+    for status, job_board, is_easy_apply, description_state, job_count in rows:
+        stats.total += job_count
+        stats.by_status[status] += job_count
+        stats.by_job_board[job_board] += job_count
+        stats.by_description_state[description_state] += job_count
+        if is_easy_apply:
+            stats.easy_apply += job_count
+    return stats
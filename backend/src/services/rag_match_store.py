@@ -0,0 +1,161 @@
+"""Per-job store of RAG requirement matches.
+
+Job analysis and cover-letter generation both match a JD's requirements
+against the resume corpus. The analysis set (the first 10 must-haves and
+5 nice-to-haves, at threshold 0.40 with 3 results each) covers the
+cover letter's stricter one, so the matches are retrieved once and kept
+in ``job_rag_matches``; the cover letter narrows them (see
+sparkles_client.narrow_matches) instead of searching again.
+
+A stored row is reused while the job's description hash, the requirement
+list and the corpus version (SparklesClient.corpus_version) match and it
+is younger than ``rag_match_ttl_seconds``. Editing the description or
+refreshing the resume index triggers a new retrieval on next use.
+"""
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models import Job, JobRAGMatch
+from src.schemas.ai_analysis_coach import JDMatchResult
+
+from .cpu_executor import cpu_executor
+from .jd_analyzer import JDAnalysisResult, detect_and_parse_jd
+from .sparkles_client import SparklesClient, sparkles_client
+
+logger = structlog.get_logger(__name__)
+
+# Search parameters of the stored matches (the analysis's)
+MATCH_THRESHOLD = 0.40
+MATCH_LIMIT_PER_REQ = 3
+
+
+def description_hash(job: Job) -> str:
+    """Hash of the description the requirements are extracted from."""
+    return hashlib.sha256((job.description_raw or "").encode()).hexdigest()
+
+
+def rag_requirements(jd_result: JDAnalysisResult) -> list[str]:
+    """Requirements matched for a job: the first 10 must-haves and 5 nice-to-haves."""
+    return jd_result.requirements.must_have[:10] + jd_result.requirements.nice_to_have[:5]
+
+
+class RAGMatchStore:
+    """Retrieve a job's requirement matches once and share them."""
+
+    def __init__(self, client: SparklesClient, ttl_seconds: float):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+
+    async def requirements_for(self, job: Job) -> list[str]:
+        """Extract the requirements to match from a job's description."""
+        if not job.description_raw:
+            return []
+        jd_result = await cpu_executor.run(detect_and_parse_jd, job.description_raw)
+        return rag_requirements(jd_result)
+
+    async def load(
+        self,
+        db: AsyncSession,
+        job: Job,
+        requirements: list[str],
+        corpus_version: str,
+    ) -> list[JDMatchResult] | None:
+        """Stored matches for a job, if still valid."""
+        row = await db.scalar(
+            select(JobRAGMatch)
+            .where(JobRAGMatch.job_id == job.id)
+            .execution_options(populate_existing=True)
+        )
+        if row is None:
+            return None
+        created_at = row.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        if (
+            row.description_hash != description_hash(job)
+            or row.corpus_version != corpus_version
+            or row.requirements != requirements
+            or row.threshold != MATCH_THRESHOLD
+            or row.limit_per_req != MATCH_LIMIT_PER_REQ
+            or datetime.now(timezone.utc) - created_at > timedelta(seconds=self.ttl_seconds)
+        ):
+            return None
+        return [JDMatchResult.model_validate(match) for match in row.matches]
+
+    async def save(
+        self,
+        db: AsyncSession,
+        job: Job,
+        requirements: list[str],
+        corpus_version: str,
+        matches: list[JDMatchResult],
+    ) -> bool:
+        """
+        Store a job's matches, replacing any earlier ones.
+
+        Incomplete results (requirements cut off by the RAG timeout) and
+        results without a single piece of evidence, which is what a failed
+        retrieval looks like, are not stored.
+
+        Returns:
+            Whether the matches were stored
+        """
+        if len(matches) != len(requirements) or not any(match.top_matches for match in matches):
+            return False
+        values = {
+            "description_hash": description_hash(job),
+            "corpus_version": corpus_version,
+            "requirements": requirements,
+            "threshold": MATCH_THRESHOLD,
+            "limit_per_req": MATCH_LIMIT_PER_REQ,
+            "matches": [match.model_dump(mode="json") for match in matches],
+            "created_at": datetime.now(timezone.utc),
+        }
+        # In a savepoint, so a failed write can't abort the caller's transaction
+        async with db.begin_nested():
+            await db.execute(
+                insert(JobRAGMatch)
+                .values(job_id=job.id, **values)
+                .on_conflict_do_update(index_elements=[JobRAGMatch.job_id], set_=values)
+            )
+        return True
+
+    async def matches_for_job(self, db: AsyncSession, job: Job) -> list[JDMatchResult]:
+        """
+        A job's requirement matches, from the store or a fresh retrieval.
+
+        Args:
+            db: Session to read and write the stored matches with
+            job: The job (needs its description)
+
+        Returns:
+            Match results in requirement order (empty if nothing to match)
+        """
+        requirements = await self.requirements_for(job)
+        if not requirements or not self.client.is_configured:
+            return []
+
+        corpus_version = await self.client.corpus_version()
+        stored = await self.load(db, job, requirements, corpus_version)
+        if stored is not None:
+            logger.info("rag_matches_reused", job_id=str(job.id), requirements=len(requirements))
+            return stored
+
+        matches = await self.client.match_jd_requirements(
+            requirements=requirements,
+            threshold=MATCH_THRESHOLD,
+            limit_per_req=MATCH_LIMIT_PER_REQ,
+        )
+        await self.save(db, job, requirements, corpus_version, matches)
+        return matches
+
+
+# Singleton instance
+rag_match_store = RAGMatchStore(sparkles_client, ttl_seconds=settings.rag_match_ttl_seconds)
@@ -0,0 +1,230 @@
+"""Local vector index over the Sparkles resume chunks.
+
+The resume corpus is a few hundred chunks and rarely changes, so instead
+of a Supabase RPC round trip per query, the chunks and their embeddings
+are synced once into ``directory``:
+
+- ``v<version>/vectors.npy``: float32 matrix, one L2-normalized row per chunk
+- ``v<version>/chunks.json``: id, content and metadata of each row
+- ``current.json``: the live version, its model and when it was synced
+
+A query is one matrix-vector product over the memory-mapped matrix: the
+cosine similarity to every chunk in well under a millisecond. Each sync
+writes a new version directory and then swaps ``current.json``, so other
+worker processes pick the new corpus up on their next query (a ``stat``
+of that file) and never see a half-written one.
+
+Unlike the Supabase ``match_resume_chunks`` RPC, ranking is by vector
+similarity alone, without its keyword component.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import structlog
+
+from src.schemas.ai_analysis_coach import ResumeSearchResult
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class ResumeChunk:
+    """One resume chunk as stored in the index."""
+
+    id: str
+    content: str
+    source: str
+    category: str
+    section: str | None = None
+
+
+def corpus_version(chunks: list[ResumeChunk], model: str) -> str:
+    """Fingerprint of a corpus: its chunks and the model that embedded them."""
+    digest = hashlib.sha256(model.encode())
+    for chunk in sorted(chunks, key=lambda chunk: chunk.id):
+        digest.update(f"\x1e{chunk.id}\x1f{chunk.category}\x1f{chunk.content}".encode())
+    return digest.hexdigest()[:16]
+
+
+class ResumeVectorIndex:
+    """Memory-mapped embedding matrix of the resume corpus."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.meta: dict | None = None
+        self._matrix: np.ndarray | None = None
+        self._chunks: list[ResumeChunk] = []
+        self._categories: np.ndarray = np.array([], dtype=object)
+        self._loaded_mtime: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def _current_path(self) -> Path:
+        return self.directory / "current.json"
+
+    @property
+    def version(self) -> str | None:
+        """Version of the loaded corpus."""
+        return self.meta["version"] if self.meta else None
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def is_ready(self) -> bool:
+        """Whether a synced corpus is available, (re)loading it if it changed on disk."""
+        try:
+            mtime = self._current_path.stat().st_mtime_ns
+        except OSError:
+            return self._matrix is not None
+        if mtime != self._loaded_mtime:
+            with self._lock:
+                if mtime != self._loaded_mtime:
+                    self._load(mtime)
+        return self._matrix is not None
+
+    def _load(self, mtime: int) -> None:
+        try:
+            meta = json.loads(self._current_path.read_text("utf-8"))
+            version_dir = self.directory / f"v{meta['version']}"
+            matrix = np.load(version_dir / "vectors.npy", mmap_mode="r")
+            chunks = [ResumeChunk(**item) for item in json.loads((version_dir / "chunks.json").read_text("utf-8"))]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("resume_index_load_error", error=str(e))
+            self._loaded_mtime = mtime
+            return
+        if matrix.shape[0] != len(chunks):
+            logger.warning("resume_index_mismatch", rows=matrix.shape[0], chunks=len(chunks))
+            self._loaded_mtime = mtime
+            return
+
+        self._matrix = matrix
+        self._chunks = chunks
+        self._categories = np.array([chunk.category for chunk in chunks], dtype=object)
+        self.meta = meta
+        self._loaded_mtime = mtime
+        logger.info("resume_index_loaded", version=meta["version"], chunks=len(chunks))
+
+    def replace(self, chunks: list[ResumeChunk], vectors: list[list[float]], model: str) -> dict:
+        """
+        Write a new corpus version and make it current.
+
+        Args:
+            chunks: Resume chunks
+            vectors: Embedding of each chunk, in the same order
+            model: Embedding model the vectors came from
+
+        Returns:
+            The new index metadata
+        """
+        if not chunks:
+            raise ValueError("No resume chunks to index")
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(chunks), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+
+        version = corpus_version(chunks, model)
+        version_dir = self.directory / f"v{version}"
+        staging = self.directory / f".v{version}.{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        np.save(staging / "vectors.npy", matrix)
+        (staging / "chunks.json").write_text(json.dumps([asdict(chunk) for chunk in chunks]), "utf-8")
+        if version_dir.exists():
+            shutil.rmtree(staging)
+        else:
+            os.replace(staging, version_dir)
+
+        meta = {
+            "version": version,
+            "model": model,
+            "chunks": len(chunks),
+            "dimensions": int(matrix.shape[1]),
+            "synced_at": datetime.now(timezone.utc).isoformat(),
+        }
+        tmp = self._current_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(meta), "utf-8")
+        os.replace(tmp, self._current_path)
+        # Serve the new version from this instance right away
+        with self._lock:
+            self._load(self._current_path.stat().st_mtime_ns)
+
+        # Readers still mapping an old version keep it until they reload
+        for old in self.directory.glob("v*"):
+            if old != version_dir:
+                shutil.rmtree(old, ignore_errors=True)
+
+        logger.info("resume_index_synced", version=version, chunks=len(chunks))
+        return meta
+
+    def search(
+        self,
+        embedding: list[float],
+        categories: list[str] | None,
+        threshold: float,
+        limit: int,
+    ) -> list[ResumeSearchResult]:
+        """
+        Top chunks by cosine similarity to a query embedding.
+
+        Args:
+            embedding: Query embedding (same model as the index)
+            categories: Optional filter by document categories
+            threshold: Minimum similarity
+            limit: Maximum results
+
+        Returns:
+            Matching chunks, most similar first
+        """
+        matrix = self._matrix
+        if matrix is None or limit <= 0:
+            return []
+        query = np.asarray(embedding, dtype=np.float32)
+        if query.shape != (matrix.shape[1],):
+            raise ValueError(f"Query has {query.size} dimensions, index has {matrix.shape[1]}")
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+
+        scores = matrix @ (query / norm)
+        if categories:
+            scores = np.where(np.isin(self._categories, categories), scores, -np.inf)
+        candidates = np.flatnonzero(scores >= threshold)
+        if candidates.size > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        results = []
+        for row in candidates:
+            chunk = self._chunks[row]
+            results.append(
+                ResumeSearchResult(
+                    id=chunk.id,
+                    content=chunk.content,
+                    source=chunk.source,
+                    category=chunk.category,
+                    similarity=float(min(max(scores[row], 0.0), 1.0)),
+                    section=chunk.section,
+                )
+            )
+        return results
+
+    def status(self) -> dict:
+        """Get index status."""
+        ready = self.is_ready()
+        meta = self.meta or {}
+        return {
+            "ready": ready,
+            "version": meta.get("version"),
+            "model": meta.get("model"),
+            "chunks": len(self._chunks),
+            "dimensions": meta.get("dimensions"),
+            "synced_at": meta.get("synced_at"),
+        }
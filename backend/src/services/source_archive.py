@@ -0,0 +1,59 @@
+"""Access to archived job source pages.
+
+Scraped pages are kept zlib-compressed in ``job_sources``, one row per
+job, instead of a wide ``jobs.source_html`` column. Compression runs on a
+worker thread (zlib releases the GIL), so archiving a large page doesn't
+stall the event loop.
+
+    job.source = await source_archive.build(scraped.raw_html)  # new jobs
+    html = await source_archive.get(db, job.id)                # reprocessing
+"""
+
+import asyncio
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import JobSource
+from src.models.job_source import compress_html, decompress_html
+
+
+class SourceArchive:
+    """Store and read the raw HTML jobs were scraped from."""
+
+    async def build(self, html: str | None) -> JobSource | None:
+        """
+        Compress a page into a JobSource for a new job.
+
+        Assign the result to ``Job.source`` so it's inserted with the job.
+
+        Returns:
+            The source row, or None if there is no page
+        """
+        if not html:
+            return None
+        html_zlib, content_hash, original_size = await asyncio.to_thread(compress_html, html)
+        return JobSource(html_zlib=html_zlib, content_hash=content_hash, original_size=original_size)
+
+    async def put(self, session: AsyncSession, job_id: UUID, html: str) -> None:
+        """Store or replace an existing job's page."""
+        html_zlib, content_hash, original_size = await asyncio.to_thread(compress_html, html)
+        values = {"content_hash": content_hash, "original_size": original_size, "html_zlib": html_zlib}
+        await session.execute(
+            insert(JobSource)
+            .values(job_id=job_id, **values)
+            .on_conflict_do_update(index_elements=[JobSource.job_id], set_=values)
+        )
+
+    async def get(self, session: AsyncSession, job_id: UUID) -> str | None:
+        """A job's page, or None if none was archived."""
+        html_zlib = await session.scalar(select(JobSource.html_zlib).where(JobSource.job_id == job_id))
+        if html_zlib is None:
+            return None
+        return await asyncio.to_thread(decompress_html, html_zlib)
+
+
+# Singleton instance
+source_archive = SourceArchive()
@@ -5,13 +5,19 @@ Connects to Sparkles Supabase database to perform semantic search over
 Tom's 260+ career documents for personalized coaching insights.
 
 Uses:
-- OpenAI text-embedding-3-small for query embeddings (1536 dimensions)
+- OpenAI text-embedding-3-small for query embeddings (1536 dimensions),
+  requested in batches and cached on disk (see embedding_cache)
 - Supabase PostgreSQL + pgvector for vector search
 - Hybrid search (vector similarity + keyword matching with RRF)
+- In "local" retrieval mode, an in-process copy of the chunk vectors
+  (see resume_index) instead of the RPC, synced from Supabase on first use
 """
 
 import asyncio
-from typing import Literal
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any, Literal
 
 import httpx
 import structlog
@@ -19,6 +25,18 @@ from openai import OpenAI
 
 from src.config import settings
 from src.schemas.ai_analysis_coach import JDMatchResult, RAGEvidence, ResumeSearchResult
+from src.services.adaptive_limit import AIMDLimit
+from src.services.analysis_cache import normalize_text
+from src.services.embedding_cache import EmbeddingCache
+from src.services.resume_index import ResumeChunk, ResumeVectorIndex
+
+# Characters of text sent per embedding (~2000 tokens, well under the model limit)
+MAX_EMBEDDING_CHARS = 8000
+# Chunks fetched per request when syncing the local index
+SYNC_PAGE_SIZE = 500
+SYNC_TIMEOUT_SECONDS = 60.0
+# After a failed sync, queries use the RPC for this long before retrying
+SYNC_RETRY_SECONDS = 300.0
 
 logger = structlog.get_logger(__name__)
 
@@ -36,6 +54,67 @@ def _get_match_strength(similarity: float) -> MatchStrength:
     return "none"
 
 
+def _unmatched(requirement: str) -> JDMatchResult:
+    """Result for a requirement that could not be matched."""
+    return JDMatchResult(
+        requirement=requirement,
+        match_strength="none",
+        evidence=[],
+        top_matches=[],
+        avg_similarity=0,
+    )
+
+
+def narrow_matches(
+    matches: list[JDMatchResult],
+    requirements: list[str],
+    threshold: float,
+    limit: int,
+) -> list[JDMatchResult]:
+    """
+    Cut matches retrieved at a lower threshold or higher limit down to a stricter search.
+
+    Each requirement's search returns its most similar chunks above the
+    threshold, so keeping the top ``limit`` of those at or above a higher
+    threshold gives the results the stricter search would have.
+
+    Args:
+        matches: Matches from a search at most as strict
+        requirements: Requirements to keep, in the order to return them
+        threshold: Minimum similarity
+        limit: Max results per requirement
+
+    Returns:
+        Match results for the requirements found in ``matches``
+    """
+    by_requirement = {match.requirement: match for match in matches}
+    narrowed = []
+    for requirement in requirements:
+        match = by_requirement.get(requirement)
+        if match is None:
+            continue
+        kept = sorted(
+            (
+                (top, snippet)
+                for top, snippet in zip(match.top_matches, match.evidence)
+                if top.similarity_score >= threshold
+            ),
+            key=lambda pair: pair[0].similarity_score,
+            reverse=True,
+        )[:limit]
+        avg_similarity = sum(top.similarity_score for top, _ in kept) / len(kept) if kept else 0
+        narrowed.append(
+            JDMatchResult(
+                requirement=requirement,
+                match_strength=_get_match_strength(avg_similarity),
+                evidence=[snippet for _, snippet in kept],
+                top_matches=[top for top, _ in kept],
+                avg_similarity=avg_similarity,
+            )
+        )
+    return narrowed
+
+
 class SparklesClient:
     """
     RAG client connecting to Sparkles resume data.
@@ -48,13 +127,25 @@ class SparklesClient:
     - Career analysis documents
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        embedding_cache: EmbeddingCache | None = None,
+        resume_index: ResumeVectorIndex | None = None,
+        match_limit: AIMDLimit | None = None,
+    ):
         self.supabase_url = settings.sparkles_supabase_url
         self.supabase_key = settings.sparkles_supabase_service_key
         self.openai_key = settings.openai_api_key
+        self.embedding_model = settings.embedding_model
+        self.embedding_cache = embedding_cache
+        self.resume_index = resume_index
+        # Requirement searches in flight, across every JD being matched
+        self.match_limit = match_limit or AIMDLimit(max_limit=settings.rag_max_concurrency)
 
         self._openai: OpenAI | None = None
         self._http_client: httpx.AsyncClient | None = None
+        self._sync_lock = asyncio.Lock()
+        self._sync_failed_at: float | None = None
 
     @property
     def is_configured(self) -> bool:
@@ -84,26 +175,152 @@ class SparklesClient:
             )
         return self._http_client
 
+    async def _request_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """One OpenAI embeddings request for a batch of texts, in input order."""
+        # Run in a thread since the OpenAI client is sync
+        response = await asyncio.to_thread(
+            self.openai.embeddings.create,
+            model=self.embedding_model,
+            input=texts,
+        )
+        embeddings = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        if len(embeddings) != len(texts) or not all(embeddings):
+            raise ValueError("No embedding returned from OpenAI")
+        return embeddings
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embeddings for several texts, from the cache or batched requests.
+
+        Texts are normalized (case, Unicode forms, whitespace) and truncated
+        before embedding, so variants of one requirement share a vector.
+        Each distinct uncached text is sent once, up to
+        ``embedding_batch_size`` texts per request.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text, in order
+        """
+        normalized = [normalize_text(text)[:MAX_EMBEDDING_CHARS] for text in texts]
+        if self.embedding_cache is not None:
+            cached = await asyncio.to_thread(self.embedding_cache.get_many, normalized)
+        else:
+            cached = [None] * len(normalized)
+
+        found = {text: embedding for text, embedding in zip(normalized, cached) if embedding is not None}
+        missing = list(dict.fromkeys(text for text in normalized if text not in found))
+        batch_size = max(settings.embedding_batch_size, 1)
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start : start + batch_size]
+            embeddings = await self._request_embeddings(batch)
+            found.update(zip(batch, embeddings))
+            if self.embedding_cache is not None:
+                await asyncio.to_thread(self.embedding_cache.put_many, batch, embeddings)
+
+        if missing:
+            logger.info(
+                "embeddings_generated",
+                requested=len(texts),
+                cached=len(texts) - len(missing),
+                generated=len(missing),
+            )
+        return [found[text] for text in normalized]
+
     async def _generate_embedding(self, text: str) -> list[float]:
         """Generate OpenAI embedding for query text."""
-        # Truncate to ~8000 chars to stay within token limits
-        truncated = text[:8000]
-
-        # Run in thread pool since OpenAI client is sync
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.openai.embeddings.create(
-                model="text-embedding-3-small",
-                input=truncated,
-            ),
+        return (await self.embed_texts([text]))[0]
+
+    def _parse_chunk(self, item: dict[str, Any]) -> ResumeChunk:
+        metadata = item.get("metadata") or {}
+        return ResumeChunk(
+            id=str(item.get("id", "")),
+            content=item.get("content", ""),
+            source=metadata.get("source", "unknown"),
+            category=metadata.get("category", "unknown"),
+            section=metadata.get("section"),
         )
 
-        embedding = response.data[0].embedding
-        if not embedding:
-            raise ValueError("No embedding returned from OpenAI")
+    async def sync_resume_index(self) -> dict:
+        """
+        Copy every resume chunk and its vector from Supabase into the local index.
+
+        Returns:
+            The new index metadata
+
+        Raises:
+            ValueError: If there is no local index or Sparkles isn't configured
+            httpx.HTTPError: If Supabase can't be read
+        """
+        if self.resume_index is None:
+            raise ValueError("Local resume index is disabled (RAG_RETRIEVAL_MODE=supabase)")
+        if not self.is_configured:
+            raise ValueError("Sparkles is not configured")
+
+        client = await self._get_http_client()
+        chunks: list[ResumeChunk] = []
+        vectors: list[list[float]] = []
+        offset = 0
+        while True:
+            response = await client.get(
+                f"/{settings.sparkles_chunks_table}",
+                params={
+                    "select": "id,content,metadata,embedding",
+                    "order": "id",
+                    "limit": SYNC_PAGE_SIZE,
+                    "offset": offset,
+                },
+                timeout=SYNC_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+            page = response.json() or []
+            for item in page:
+                embedding = item.get("embedding")
+                # pgvector columns come back as "[0.1,0.2,...]"
+                if isinstance(embedding, str):
+                    embedding = json.loads(embedding)
+                if not embedding:
+                    continue
+                chunks.append(self._parse_chunk(item))
+                vectors.append(embedding)
+            if len(page) < SYNC_PAGE_SIZE:
+                break
+            offset += SYNC_PAGE_SIZE
+
+        meta = await asyncio.to_thread(self.resume_index.replace, chunks, vectors, self.embedding_model)
+        self._sync_failed_at = None
+        return meta
+
+    async def _local_index_ready(self) -> bool:
+        """Whether local search can answer queries, syncing the index on first use."""
+        index = self.resume_index
+        if index is None:
+            return False
+        if not index.is_ready():
+            if self._sync_failed_at is not None and time.monotonic() - self._sync_failed_at < SYNC_RETRY_SECONDS:
+                return False
+            async with self._sync_lock:
+                if not index.is_ready():
+                    try:
+                        await self.sync_resume_index()
+                    except Exception as e:
+                        self._sync_failed_at = time.monotonic()
+                        logger.error("resume_index_sync_error", error=str(e))
+                        return False
+        return index.meta is not None and index.meta.get("model") == self.embedding_model
+
+    async def corpus_version(self) -> str:
+        """
+        Identify the resume corpus searches currently run against.
 
-        return embedding
+        The local index's version changes whenever its chunks do. Through
+        the RPC there is no such signal, so only the model is recorded.
+        """
+        if await self._local_index_ready():
+            assert self.resume_index is not None
+            return f"index:{self.resume_index.version}"
+        return f"rpc:{self.embedding_model}"
 
     async def search_resume_context(
         self,
@@ -111,6 +328,7 @@ class SparklesClient:
         categories: list[str] | None = None,
         threshold: float | None = None,
         limit: int | None = None,
+        embedding: list[float] | None = None,
     ) -> list[ResumeSearchResult]:
         """
         Semantic search over career documents.
@@ -120,6 +338,7 @@ class SparklesClient:
             categories: Optional filter by document categories
             threshold: Minimum similarity threshold (default from settings)
             limit: Maximum results (default from settings)
+            embedding: The query's embedding, if already generated
 
         Returns:
             List of matching document chunks with similarity scores
@@ -132,59 +351,82 @@ class SparklesClient:
         limit = limit or settings.rag_max_results
 
         try:
-            # Generate embedding for query
+            return await self._search(query, categories, threshold, limit, embedding)
+        except Exception as e:
+            logger.error("sparkles_search_error", error=str(e))
+            return []
+
+    async def _search(
+        self,
+        query: str,
+        categories: list[str] | None,
+        threshold: float,
+        limit: int,
+        embedding: list[float] | None,
+    ) -> list[ResumeSearchResult]:
+        """Search the local index or the Supabase RPC, raising on failure."""
+        # Generate embedding for query
+        if embedding is None:
             embedding = await self._generate_embedding(query)
-            embedding_str = f"[{','.join(str(x) for x in embedding)}]"
-
-            # Call Supabase RPC function
-            client = await self._get_http_client()
-
-            if categories:
-                rpc_name = "match_resume_chunks_by_category"
-                payload = {
-                    "query_embedding": embedding_str,
-                    "categories": categories,
-                    "query_text": query,
-                    "match_threshold": threshold,
-                    "match_count": limit,
-                }
-            else:
-                rpc_name = "match_resume_chunks"
-                payload = {
-                    "query_embedding": embedding_str,
-                    "query_text": query,
-                    "match_threshold": threshold,
-                    "match_count": limit,
-                }
-
-            response = await client.post(f"/rpc/{rpc_name}", json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse results
-            results = []
-            for item in data or []:
-                results.append(
-                    ResumeSearchResult(
-                        id=str(item.get("id", "")),
-                        content=item.get("content", ""),
-                        source=item.get("metadata", {}).get("source", "unknown"),
-                        category=item.get("metadata", {}).get("category", "unknown"),
-                        similarity=float(item.get("similarity", 0)),
-                        section=item.get("metadata", {}).get("section"),
-                    )
-                )
 
-            logger.info(
-                "sparkles_search_complete",
+        if await self._local_index_ready():
+            assert self.resume_index is not None
+            results = self.resume_index.search(embedding, categories, threshold, limit)
+            logger.debug(
+                "sparkles_local_search_complete",
                 query_length=len(query),
                 results_count=len(results),
             )
             return results
 
-        except Exception as e:
-            logger.error("sparkles_search_error", error=str(e))
-            return []
+        embedding_str = json.dumps(embedding, separators=(",", ":"))
+
+        # Call Supabase RPC function
+        client = await self._get_http_client()
+
+        if categories:
+            rpc_name = "match_resume_chunks_by_category"
+            payload = {
+                "query_embedding": embedding_str,
+                "categories": categories,
+                "query_text": query,
+                "match_threshold": threshold,
+                "match_count": limit,
+            }
+        else:
+            rpc_name = "match_resume_chunks"
+            payload = {
+                "query_embedding": embedding_str,
+                "query_text": query,
+                "match_threshold": threshold,
+                "match_count": limit,
+            }
+
+        response = await client.post(f"/rpc/{rpc_name}", json=payload)
+        response.raise_for_status()
+        data = response.json()
+
+        # Parse results
+        results = []
+        for item in data or []:
+            chunk = self._parse_chunk(item)
+            results.append(
+                ResumeSearchResult(
+                    id=chunk.id,
+                    content=chunk.content,
+                    source=chunk.source,
+                    category=chunk.category,
+                    similarity=float(item.get("similarity", 0)),
+                    section=chunk.section,
+                )
+            )
+
+        logger.info(
+            "sparkles_search_complete",
+            query_length=len(query),
+            results_count=len(results),
+        )
+        return results
 
     async def match_jd_requirements(
         self,
@@ -196,7 +438,9 @@ class SparklesClient:
         Match job requirements against resume context.
 
         Performs multi-query RAG search for each requirement to find
-        evidence of matching skills/experience.
+        evidence of matching skills/experience. Collects
+        stream_jd_requirements, so requirements not matched within
+        ``rag_timeout_seconds`` are left out.
 
         Args:
             requirements: List of job requirements to match
@@ -204,33 +448,15 @@ class SparklesClient:
             limit_per_req: Max results per requirement
 
         Returns:
-            List of match results with evidence and strength indicators
+            List of match results with evidence and strength indicators,
+            in requirement order
         """
-        if not self.is_configured:
-            logger.warning("sparkles_not_configured_for_jd_match")
-            return []
-
-        results: list[JDMatchResult] = []
-
-        # Process in batches of 5 for efficiency
-        batch_size = 5
-        for i in range(0, len(requirements), batch_size):
-            batch = requirements[i : i + batch_size]
-
-            # Process batch in parallel
-            batch_results = await asyncio.gather(
-                *[
-                    self._match_single_requirement(req, threshold, limit_per_req)
-                    for req in batch
-                ],
-                return_exceptions=True,
-            )
-
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.error("requirement_match_error", error=str(result))
-                    continue
-                results.append(result)
+        results = [
+            result
+            async for result in self.stream_jd_requirements(requirements, threshold, limit_per_req)
+        ]
+        position = {requirement: i for i, requirement in reversed(list(enumerate(requirements)))}
+        results.sort(key=lambda result: position[result.requirement])
 
         logger.info(
             "jd_requirements_matched",
@@ -243,19 +469,88 @@ class SparklesClient:
 
         return results
 
+    async def stream_jd_requirements(
+        self,
+        requirements: list[str],
+        threshold: float = 0.40,
+        limit_per_req: int = 3,
+    ) -> AsyncIterator[JDMatchResult]:
+        """
+        Match job requirements against resume context, yielding each as it completes.
+
+        Every requirement is embedded in one request, then searched through
+        ``match_limit``: a sliding window that starts the next search the
+        moment one finishes, its width adapting to the latency and errors
+        the backend shows. The whole match, embedding included, gets
+        ``rag_timeout_seconds``; searches still running then are cancelled
+        and their requirements not yielded.
+
+        Args:
+            requirements: List of job requirements to match
+            threshold: Minimum similarity for matches
+            limit_per_req: Max results per requirement
+
+        Yields:
+            Match results in completion order
+        """
+        if not self.is_configured:
+            logger.warning("sparkles_not_configured_for_jd_match")
+            return
+        if not requirements:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.rag_timeout_seconds
+
+        # Embed every requirement up front: one request, minus cache hits
+        try:
+            embeddings = await asyncio.wait_for(
+                self.embed_texts(requirements), timeout=settings.rag_timeout_seconds
+            )
+        except TimeoutError:
+            logger.warning("requirement_embedding_timeout", total_requirements=len(requirements))
+            return
+        except Exception as e:
+            logger.error("requirement_embedding_error", error=str(e))
+            for requirement in requirements:
+                yield _unmatched(requirement)
+            return
+
+        tasks = [
+            asyncio.create_task(
+                self._match_single_requirement(requirement, threshold, limit_per_req, embedding)
+            )
+            for requirement, embedding in zip(requirements, embeddings)
+        ]
+        completed = 0
+        try:
+            for next_result in asyncio.as_completed(tasks, timeout=max(deadline - loop.time(), 0)):
+                result = await next_result
+                completed += 1
+                yield result
+        except TimeoutError:
+            logger.warning(
+                "jd_requirements_timeout",
+                completed=completed,
+                total_requirements=len(requirements),
+                timeout_seconds=settings.rag_timeout_seconds,
+                **self.match_limit.stats(),
+            )
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def _match_single_requirement(
         self,
         requirement: str,
         threshold: float,
         limit: int,
+        embedding: list[float] | None = None,
     ) -> JDMatchResult:
         """Match a single requirement against resume."""
         try:
-            matches = await self.search_resume_context(
-                query=requirement,
-                threshold=threshold,
-                limit=limit,
-            )
+            async with self.match_limit.slot():
+                matches = await self._search(requirement, None, threshold, limit, embedding)
 
             # Calculate average similarity
             avg_similarity = (
@@ -295,13 +590,7 @@ class SparklesClient:
                 requirement=requirement[:50],
                 error=str(e),
             )
-            return JDMatchResult(
-                requirement=requirement,
-                match_strength="none",
-                evidence=[],
-                top_matches=[],
-                avg_similarity=0,
-            )
+            return _unmatched(requirement)
 
     async def get_coaching_context(
         self,
@@ -425,4 +714,17 @@ project details, case studies, and interview prep materials.
 
 
 # Singleton instance
-sparkles_client = SparklesClient()
+sparkles_client = SparklesClient(
+    embedding_cache=(
+        EmbeddingCache(
+            settings.embedding_cache_dir,
+            settings.embedding_model,
+            dtype=settings.embedding_cache_dtype,
+        )
+        if settings.embedding_cache_enabled
+        else None
+    ),
+    resume_index=(
+        ResumeVectorIndex(settings.rag_index_dir) if settings.rag_retrieval_mode == "local" else None
+    ),
+)
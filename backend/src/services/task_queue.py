@@ -0,0 +1,374 @@
+"""Durable Postgres-backed work queue.
+
+Tasks live in the ``background_tasks`` table and are claimed with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of workers - in the API
+process or in a separate ``scripts/run_task_worker.py`` process - can drain
+the queue without claiming the same task twice. A claimed task holds a lease
+(``locked_until``) that the worker renews while the handler runs; if the
+worker dies, the lease expires and the task becomes claimable again. Failed
+attempts are retried with exponential backoff until ``max_attempts``.
+"""
+
+import asyncio
+import os
+import socket
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.models import BackgroundTask, TaskKind, TaskStatus
+
+logger = structlog.get_logger(__name__)
+
+
+def _kind_value(kind: TaskKind | str) -> str:
+    return kind.value if isinstance(kind, TaskKind) else kind
+
+
+class TaskPermanentError(Exception):
+    """Raised by handlers for failures that retrying cannot fix."""
+
+
+@dataclass
+class TaskContext:
+    """Everything a handler needs to run one task attempt."""
+
+    task_id: UUID
+    kind: str
+    payload: dict[str, Any]
+    attempt: int
+    session: AsyncSession
+    session_factory: async_sessionmaker[AsyncSession]
+
+
+TaskHandler = Callable[[TaskContext], Awaitable[dict[str, Any] | None]]
+
+
+class TaskQueue:
+    """Enqueue, claim and settle background tasks."""
+
+    def __init__(
+        self,
+        visibility_timeout_seconds: float,
+        max_attempts: int,
+        retry_backoff_seconds: float,
+    ):
+        self.visibility_timeout = timedelta(seconds=visibility_timeout_seconds)
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._handlers: dict[str, TaskHandler] = {}
+
+    def register(self, kind: TaskKind | str) -> Callable[[TaskHandler], TaskHandler]:
+        """Decorator registering the handler for a task kind."""
+
+        def decorator(handler: TaskHandler) -> TaskHandler:
+            self._handlers[_kind_value(kind)] = handler
+            return handler
+
+        return decorator
+
+    def handler_for(self, kind: str) -> TaskHandler | None:
+        """Get the registered handler for a task kind."""
+        return self._handlers.get(kind)
+
+    async def enqueue(
+        self,
+        session: AsyncSession,
+        kind: TaskKind | str,
+        payload: dict[str, Any],
+        max_attempts: int | None = None,
+    ) -> BackgroundTask:
+        """Add a task to the queue.
+
+        The task becomes visible to workers when ``session`` commits.
+
+        Args:
+            session: Session to add the task in
+            kind: Task kind (see TaskKind)
+            payload: JSON-serializable handler arguments
+            max_attempts: Override the default attempt limit
+
+        Returns:
+            The queued task
+        """
+        task = BackgroundTask(
+            kind=_kind_value(kind),
+            status=TaskStatus.QUEUED.value,
+            payload=payload,
+            max_attempts=max_attempts or self.max_attempts,
+        )
+        session.add(task)
+        await session.flush()
+        await session.refresh(task)
+        logger.info("task_enqueued", task_id=str(task.id), kind=task.kind)
+        return task
+
+    async def get(self, session: AsyncSession, task_id: UUID) -> BackgroundTask | None:
+        """Get a task by id."""
+        return await session.get(BackgroundTask, task_id, populate_existing=True)
+
+    async def claim(self, session: AsyncSession, worker_id: str) -> BackgroundTask | None:
+        """Claim the next runnable task and take a lease on it.
+
+        Runnable means queued and due, or running with an expired lease
+        (its worker died or stalled). Rows locked by concurrent claimers
+        are skipped rather than waited on.
+
+        Args:
+            session: Session to claim in; commit it to publish the lease
+            worker_id: Identifier recorded as the lease holder
+
+        Returns:
+            The claimed task, or None if nothing is runnable
+        """
+        now = func.clock_timestamp()
+        next_task = (
+            select(BackgroundTask.id)
+            .where(
+                or_(
+                    and_(
+                        BackgroundTask.status == TaskStatus.QUEUED.value,
+                        BackgroundTask.run_after <= now,
+                    ),
+                    and_(
+                        BackgroundTask.status == TaskStatus.RUNNING.value,
+                        BackgroundTask.locked_until < now,
+                    ),
+                )
+            )
+            .order_by(BackgroundTask.run_after)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(BackgroundTask)
+            .where(BackgroundTask.id == next_task)
+            .values(
+                status=TaskStatus.RUNNING.value,
+                attempts=BackgroundTask.attempts + 1,
+                locked_by=worker_id,
+                locked_until=now + self.visibility_timeout,
+                started_at=now,
+                updated_at=now,
+            )
+            .returning(BackgroundTask)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await session.execute(stmt)
+        return result.scalars().first()
+
+    async def extend_lease(self, session: AsyncSession, task_id: UUID, worker_id: str) -> bool:
+        """Renew a held lease. Returns False if the lease was lost."""
+        now = func.clock_timestamp()
+        result = await session.execute(
+            update(BackgroundTask)
+            .where(
+                BackgroundTask.id == task_id,
+                BackgroundTask.locked_by == worker_id,
+                BackgroundTask.status == TaskStatus.RUNNING.value,
+            )
+            .values(locked_until=now + self.visibility_timeout, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def complete(
+        self,
+        session: AsyncSession,
+        task_id: UUID,
+        worker_id: str,
+        result: dict[str, Any] | None,
+    ) -> bool:
+        """Mark a task succeeded. Returns False if the lease was lost."""
+        now = func.clock_timestamp()
+        updated = await session.execute(
+            update(BackgroundTask)
+            .where(
+                BackgroundTask.id == task_id,
+                BackgroundTask.locked_by == worker_id,
+                BackgroundTask.status == TaskStatus.RUNNING.value,
+            )
+            .values(
+                status=TaskStatus.SUCCEEDED.value,
+                result=result,
+                error=None,
+                locked_by=None,
+                locked_until=None,
+                finished_at=now,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return updated.rowcount == 1
+
+    async def fail(
+        self,
+        session: AsyncSession,
+        task: BackgroundTask,
+        worker_id: str,
+        error: str,
+        retry: bool = True,
+    ) -> str:
+        """Record a failed attempt, requeueing with backoff if attempts remain.
+
+        Returns:
+            The task's new status
+        """
+        now = func.clock_timestamp()
+        if retry and task.attempts < task.max_attempts:
+            delay = timedelta(seconds=self.retry_backoff_seconds * 2 ** (task.attempts - 1))
+            values: dict[str, Any] = {
+                "status": TaskStatus.QUEUED.value,
+                "run_after": now + delay,
+            }
+        else:
+            values = {"status": TaskStatus.FAILED.value, "finished_at": now}
+
+        await session.execute(
+            update(BackgroundTask)
+            .where(BackgroundTask.id == task.id, BackgroundTask.locked_by == worker_id)
+            .values(error=error, locked_by=None, locked_until=None, updated_at=now, **values)
+            .execution_options(synchronize_session=False)
+        )
+        return values["status"]
+
+
+class TaskWorker:
+    """Pool of coroutines draining a TaskQueue."""
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        session_factory: async_sessionmaker[AsyncSession],
+        concurrency: int = 1,
+        poll_interval_seconds: float = 1.0,
+        worker_id: str | None = None,
+    ):
+        self.queue = queue
+        self.session_factory = session_factory
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._loops: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Start the worker loops."""
+        if self._loops:
+            return
+        self._loops = [asyncio.create_task(self._loop()) for _ in range(self.concurrency)]
+        logger.info("task_worker_started", worker_id=self.worker_id, concurrency=self.concurrency)
+
+    async def stop(self) -> None:
+        """Cancel the worker loops; in-flight tasks are retried once their lease expires."""
+        for loop in self._loops:
+            loop.cancel()
+        await asyncio.gather(*self._loops, return_exceptions=True)
+        self._loops = []
+        logger.info("task_worker_stopped", worker_id=self.worker_id)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                ran = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("task_worker_error", worker_id=self.worker_id, error=str(e))
+                ran = False
+            if not ran:
+                await asyncio.sleep(self.poll_interval)
+
+    async def run_once(self) -> bool:
+        """Claim and run a single task.
+
+        Returns:
+            True if a task was run, False if the queue had nothing runnable
+        """
+        async with self.session_factory() as session:
+            task = await self.queue.claim(session, self.worker_id)
+            await session.commit()
+        if task is None:
+            return False
+        await self._execute(task)
+        return True
+
+    async def _execute(self, task: BackgroundTask) -> None:
+        log = logger.bind(task_id=str(task.id), kind=task.kind, attempt=task.attempts)
+        handler = self.queue.handler_for(task.kind)
+
+        if handler is None or task.attempts > task.max_attempts:
+            error = (
+                f"No handler registered for task kind '{task.kind}'"
+                if handler is None
+                else f"Lease expired on final attempt {task.max_attempts}"
+            )
+            await self._record_failure(task, error, retry=False)
+            log.error("task_failed", error=error)
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(task.id))
+        try:
+            async with self.session_factory() as session:
+                try:
+                    result = await handler(
+                        TaskContext(
+                            task_id=task.id,
+                            kind=task.kind,
+                            payload=task.payload,
+                            attempt=task.attempts,
+                            session=session,
+                            session_factory=self.session_factory,
+                        )
+                    )
+                    # Handler writes and the completion commit together
+                    if not await self.queue.complete(session, task.id, self.worker_id, result):
+                        await session.rollback()
+                        log.warning("task_lease_lost")
+                        return
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+            log.info("task_succeeded")
+        except asyncio.CancelledError:
+            raise
+        except TaskPermanentError as e:
+            await self._record_failure(task, str(e), retry=False)
+            log.error("task_failed", error=str(e))
+        except Exception as e:
+            new_status = await self._record_failure(task, str(e) or type(e).__name__, retry=True)
+            log.warning("task_attempt_failed", error=str(e), status=new_status)
+        finally:
+            heartbeat.cancel()
+
+    async def _record_failure(self, task: BackgroundTask, error: str, retry: bool) -> str:
+        async with self.session_factory() as session:
+            new_status = await self.queue.fail(session, task, self.worker_id, error, retry=retry)
+            await session.commit()
+        return new_status
+
+    async def _heartbeat(self, task_id: UUID) -> None:
+        interval = max(1.0, self.queue.visibility_timeout.total_seconds() / 3)
+        while True:
+            await asyncio.sleep(interval)
+            async with self.session_factory() as session:
+                renewed = await self.queue.extend_lease(session, task_id, self.worker_id)
+                await session.commit()
+            if not renewed:
+                return
+
+
+# Singleton instance
+task_queue = TaskQueue(
+    visibility_timeout_seconds=settings.task_visibility_timeout_seconds,
+    max_attempts=settings.task_max_attempts,
+    retry_backoff_seconds=settings.task_retry_backoff_seconds,
+)
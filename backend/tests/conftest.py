@@ -5,6 +5,16 @@ rolled back at the end, so no test data persists to the database.
 """
 
 import asyncio
+import os
+
+# Keep the scraper's on-disk page cache out of the working tree during tests
+os.environ.setdefault("SCRAPE_CACHE_ENABLED", "false")
+# Keep the shared analysis cache store out of the working tree too
+os.environ.setdefault("ANALYSIS_CACHE_PERSIST", "false")
+# Run CPU-bound work inline so tests can patch it
+os.environ.setdefault("CPU_POOL_WORKERS", "0")
+# Tests that need the near-duplicate index build their own
+os.environ.setdefault("DUPLICATE_DETECTION_ENABLED", "false")
 
 import pytest
 import httpx
@@ -13,7 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import NullPool
 
 from src.config import settings
-from src.config.database import Base, get_db
+from src.config.database import Base, get_db, get_session_factory
 from src.main import app
 
 
@@ -69,11 +79,27 @@ async def db_session(engine):
 
 
 @pytest.fixture
-async def client(db_session):
+def session_factory(db_session):
+    """Session factory for code that opens its own sessions.
+
+    Sessions share the test connection; their commits become savepoint
+    releases so the outer transaction still rolls everything back.
+    """
+    return async_sessionmaker(
+        bind=db_session.bind,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.fixture
+async def client(db_session, session_factory):
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -0,0 +1,40 @@
+"""Representative job descriptions shared by the analyzer tests and benchmarks."""
+
+SAMPLE_DESCRIPTIONS = [
+    """About the role
+We are looking for a Senior Backend Engineer to join our platform team. You will design
+and build services in Python (FastAPI, SQLAlchemy, Celery) backed by PostgreSQL and Redis,
+deployed on AWS with Kubernetes and Terraform.
+
+Requirements
+- 5+ years of experience building distributed systems
+- Strong knowledge of REST and GraphQL API design
+- Experience with Kafka or RabbitMQ
+Nice to have
+- Familiar with LangChain, OpenAI or Anthropic APIs
+- Bachelor's degree in Computer Science
+Compensation: $180k-$220k, full-time, remote (US). Equal opportunity employer.""",
+    """Staff Frontend Engineer (Hybrid - Austin, TX)
+What you'll do: lead the migration of our React/Next.js application to TypeScript, own our
+design system in Tailwind and Figma, and mentor mid-level engineers.
+Minimum qualifications: at least 8 years of professional JavaScript experience, deep
+knowledge of webpack or Vite, CI/CD with GitHub Actions. Preferred qualifications: Node.js,
+NestJS, GraphQL, Vercel. Benefits include 401k, health, and unlimited PTO.""",
+    """Principal ML Engineer
+Key responsibilities
+1. Build LLM-powered RAG pipelines with PyTorch, TensorFlow and scikit-learn
+2. Own MLOps on GCP and Azure; Docker, Kubernetes (k8s), Jenkins
+3. Partner with the data team on Elasticsearch, DynamoDB, Cosmos DB and Cassandra
+Required experience: 7-10 years in machine learning, deep learning, NLP or computer vision.
+Master's or Ph.D. preferred. Salary range $250k+. This is an on-site role in Seattle.""",
+    """Junior Software Engineer - Entry Level
+Join Acme as an associate engineer working on Java, Spring and Kotlin microservices. You will
+be responsible for writing tests, fixing bugs and learning our Agile/Scrum process in Jira
+and Confluence. Knowledge of SQL Server, MySQL or Oracle is a plus. Internship experience
+welcome. Part-time and contract options available. Apply now!""",
+    """Engineering Manager, Platform
+The ideal candidate has 10+ yrs of exp in software engineering, including 3 years managing
+teams shipping Go, Rust and C++ services. Background in SRE/DevOps, serverless (AWS Lambda,
+SQS, SNS) and Supabase/Firebase. Experience in Ruby on Rails, Laravel/PHP, Django/Flask,
+ASP.NET and .NET is valued. Equal opportunity employer; EEO statement applies.""",
+]
@@ -1,7 +1,11 @@
 """Tests for agent and webhook endpoints."""
 
+from uuid import uuid4
+
 import pytest
 
+from src.services.api_key_cache import AgentIdentity, APIKeyCache
+
 
 @pytest.mark.asyncio
 async def test_create_agent_and_use_permissions(client, api_key_header, test_job_payload):
@@ -24,6 +28,47 @@ async def test_create_agent_and_use_permissions(client, api_key_header, test_job
     assert list_response.status_code == 200
 
 
+@pytest.mark.asyncio
+async def test_agent_updates_apply_to_cached_keys(client, api_key_header):
+    agent_response = await client.post(
+        "/api/v1/agents",
+        json={"name": "cached-agent", "permissions": ["jobs:read"]},
+        headers=api_key_header,
+    )
+    agent = agent_response.json()
+    agent_headers = {"X-API-Key": agent["api_key"]}
+
+    assert (await client.get("/api/v1/jobs", headers=agent_headers)).status_code == 200
+    assert (await client.get("/api/v1/webhooks", headers=agent_headers)).status_code == 403
+
+    update_response = await client.patch(
+        f"/api/v1/agents/{agent['id']}",
+        json={"permissions": ["jobs:read", "webhooks:read"]},
+        headers=api_key_header,
+    )
+    assert update_response.status_code == 200
+    assert (await client.get("/api/v1/webhooks", headers=agent_headers)).status_code == 200
+
+    await client.patch(f"/api/v1/agents/{agent['id']}", json={"is_active": False}, headers=api_key_header)
+    assert (await client.get("/api/v1/jobs", headers=agent_headers)).status_code == 403
+
+
+def test_api_key_cache_skips_lookups_that_raced_an_invalidation():
+    cache = APIKeyCache(ttl_seconds=60, negative_ttl_seconds=0)
+    agent = AgentIdentity(id=uuid4(), name="agent", permissions=frozenset({"jobs:read"}))
+
+    generation = cache.generation
+    cache.invalidate()
+    cache.put("agent_key", agent, generation)
+    assert cache.get("agent_key") == (False, None)
+
+    cache.put("agent_key", agent, cache.generation)
+    assert cache.get("agent_key") == (True, agent)
+
+    cache.put("bad_key", None, cache.generation)  # negative entries expire immediately here
+    assert cache.get("bad_key") == (False, None)
+
+
 @pytest.mark.asyncio
 async def test_create_and_list_webhooks(client, api_key_header):
     create_response = await client.post(
@@ -1,8 +1,10 @@
 """Tests for AI-powered job analysis."""
 
+import asyncio
 import json
+import sqlite3
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 from src.models import Job
@@ -13,8 +15,14 @@ from src.schemas.ai_analysis import (
     Recommendation,
     SeniorityMatch,
 )
-from src.services.ai_analysis_service import AIAnalysisService, _build_user_prompt
-from src.services.analysis_cache import AnalysisCache
+from src.services.ai_analysis_service import AIAnalysisService, _build_user_prompt, ai_analysis_service
+from src.services.analysis_cache import (
+    AnalysisCache,
+    CacheEntry,
+    SQLiteAnalysisStore,
+    analysis_cache,
+    normalize_description,
+)
 from src.services.job_analysis_service import analyze_job_with_ai, _convert_ai_to_legacy
 
 
@@ -171,6 +179,34 @@ class TestAIAnalysisService:
         director_score = next(rs for rs in result.role_scores if rs.role == RoleType.DIRECTOR)
         assert director_score.score == 80
 
+    async def test_analyze_async_success(self, sample_job, mock_ai_response):
+        """Test AI analysis through the async client."""
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text=json.dumps(mock_ai_response))]
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
+
+        service = AIAnalysisService()
+        service._async_client = mock_client
+        result = await service.analyze_async(sample_job)
+
+        assert result.role_classification.suggested_role == RoleType.DIRECTOR
+        assert result.overall_assessment.priority_score == 78
+        mock_client.messages.create.assert_awaited_once()
+
+    async def test_analyze_async_timeout(self, sample_job):
+        """Test that a slow AI call is cut off at the deadline."""
+        async def slow_create(**_kwargs):
+            await asyncio.sleep(5)
+
+        mock_client = MagicMock()
+        mock_client.messages.create = slow_create
+
+        service = AIAnalysisService()
+        service._async_client = mock_client
+        with pytest.raises(TimeoutError):
+            await service.analyze_async(sample_job, timeout=0.01)
+
     def test_fallback_result(self, sample_job):
         """Test fallback result generation."""
         service = AIAnalysisService()
@@ -421,16 +457,172 @@ class TestAnalysisCache:
         assert cache.get("job2", "desc") is not None
         assert cache.get("job3", "desc") is not None
 
+    def test_cache_eviction_follows_recency(self, mock_ai_response):
+        """Test that a hit protects an entry from eviction."""
+        cache = AnalysisCache(max_size=2)
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+
+        cache.set("job1", "desc", result)
+        cache.set("job2", "desc", result)
+        assert cache.get("job1", "desc") is not None
+        cache.set("job3", "desc", result)
+
+        assert cache.get("job2", "desc") is None
+        assert cache.get("job1", "desc") is not None
+        assert cache.get("job3", "desc") is not None
+
+    def test_store_is_shared_between_caches(self, mock_ai_response, tmp_path):
+        """Test that an analysis cached by one worker is a hit for another."""
+        path = tmp_path / "analysis_cache.sqlite3"
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+        worker_a = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path))
+        worker_b = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path))
+
+        worker_a.set("job1", "desc", result)
+
+        assert worker_b.get("job1", "desc") == result
+        assert worker_b.get("job1", "changed desc") is None
+        assert worker_b.stats()["size"] == 1  # promoted to memory
+
+    async def test_async_access_goes_through_the_store(self, mock_ai_response, sample_job, tmp_path):
+        """Test the async wrappers the analysis service uses."""
+        path = tmp_path / "analysis_cache.sqlite3"
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+        worker_a = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path))
+        worker_b = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path))
+
+        await worker_a.set_for_job_async(sample_job, result)
+
+        assert await worker_b.get_for_job_async(sample_job) == result
+
+    def test_invalidate_removes_job_from_both_tiers(self, mock_ai_response, tmp_path):
+        """Test that invalidation reaches the store, not just this process's memory."""
+        path = tmp_path / "analysis_cache.sqlite3"
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+        worker_a = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path))
+        worker_b = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path))
+        worker_a.set("job1", "old desc", result)
+        worker_a.set("job1", "new desc", result)
+        worker_a.set("job2", "desc", result)
+
+        worker_b.invalidate("job1")
+
+        assert worker_b.get("job1", "old desc") is None
+        assert worker_b.get("job1", "new desc") is None
+        assert worker_b.get("job2", "desc") is not None
+        assert worker_b.stats()["store_size"] == 1
+
+    def test_invalidate_reaches_other_workers_memory(self, mock_ai_response, tmp_path):
+        """Test that an entry another worker holds in memory is dropped by invalidation."""
+        path = tmp_path / "analysis_cache.sqlite3"
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+        worker_a = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path))
+        worker_b = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path))
+        worker_a.set("job1", "desc", result)
+        worker_a.set("job2", "desc", result)
+        assert worker_b.get("job1", "desc") == result
+        assert worker_b.get("job2", "desc") == result
+
+        worker_a.invalidate("job1")
+
+        assert worker_b.get("job1", "desc") is None
+        assert worker_b.get("job2", "desc") == result  # re-read from the store
+        # The invalidating worker keeps the rest of its memory tier
+        assert worker_a.stats()["size"] == 1
+        assert worker_a.get("job2", "desc") == result
+
+    def test_expired_store_entries_are_misses(self, mock_ai_response, tmp_path):
+        """Test that the TTL counts from when the analysis was first cached."""
+        store = SQLiteAnalysisStore(tmp_path / "analysis_cache.sqlite3")
+        cache = AnalysisCache(max_size=10, store=store)
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+        key = cache._compute_key("job1", "desc")
+        store.put(key, "job1", CacheEntry(result=result, created_at=0.0))
+
+        assert cache.get("job1", "desc") is None
+        assert store.count() == 0
+
+    def test_content_mode_shares_analysis_between_listings(self, mock_ai_response, sample_job):
+        """Test that a re-listed or cross-posted job reuses the original analysis."""
+        cache = AnalysisCache(max_size=10, key_mode="content", version="v1")
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+        cache.set_for_job(sample_job, result)
+
+        relisted = Job(
+            id=uuid4(),
+            title="  director of engineering - AI platform",
+            company=sample_job.company,
+            location=sample_job.location,
+            work_location_type=sample_job.work_location_type,
+            description_raw=(
+                "Job ID: 48213\nPosted 3 days ago\n"
+                + sample_job.description_raw.replace("- ", "• ").replace("\n", "\n\n")
+                + "\nAcme is an equal opportunity employer.\nApply now!"
+            ),
+        )
+        assert cache.get_for_job(relisted) == result
+
+        elsewhere = Job(
+            id=uuid4(),
+            title=sample_job.title,
+            company=sample_job.company,
+            location="Remote US (CA, WA)",
+            work_location_type=WorkLocationType.REMOTE,
+            description_raw=sample_job.description_raw,
+        )
+        assert cache.get_for_job(elsewhere) is None
+
+    def test_prompt_version_change_misses(self, mock_ai_response, sample_job, tmp_path):
+        """Test that analyses made with another prompt/model version are not reused."""
+        path = tmp_path / "analysis_cache.sqlite3"
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+        old = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path), key_mode="content", version="v1")
+        new = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path), key_mode="content", version="v2")
+
+        old.set_for_job(sample_job, result)
+
+        assert new.get_for_job(sample_job) is None
+        assert old.get_for_job(sample_job) == result
+
+    def test_content_mode_invalidate_through_any_linked_job(self, mock_ai_response, sample_job, tmp_path):
+        """Test that invalidating a job that reused an analysis drops it in every worker."""
+        path = tmp_path / "analysis_cache.sqlite3"
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+        worker_a = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path), key_mode="content")
+        worker_b = AnalysisCache(max_size=10, store=SQLiteAnalysisStore(path), key_mode="content")
+        relisted = Job(
+            id=uuid4(),
+            title=sample_job.title,
+            company=sample_job.company,
+            location=sample_job.location,
+            work_location_type=sample_job.work_location_type,
+            description_raw=sample_job.description_raw,
+        )
+
+        worker_a.set_for_job(sample_job, result)
+        assert worker_b.get_for_job(relisted) == result
+        worker_b.invalidate(str(relisted.id))
+
+        assert worker_b.get_for_job(sample_job) is None
+        worker_a.invalidate(str(sample_job.id))
+        assert worker_a.get_for_job(sample_job) is None
+
+    def test_normalize_description_drops_boilerplate(self):
+        """Test description normalization for fingerprints."""
+        assert normalize_description(
+            "  Senior  Engineer\n\n- Python\n* AWS\nReq #123\nWe are an Equal Opportunity Employer"
+        ) == "senior engineer\npython\naws"
+
 
 class TestAnalyzeJobWithAI:
     """Tests for the integrated analyze_job_with_ai function."""
 
     @patch("src.services.job_analysis_service.settings")
-    def test_fallback_to_rules_when_no_api_key(self, mock_settings, sample_job):
+    async def test_fallback_to_rules_when_no_api_key(self, mock_settings, sample_job):
         """Test fallback to rule-based analysis when API key not set."""
         mock_settings.anthropic_api_key = None
 
-        result, ai_result = analyze_job_with_ai(sample_job, use_ai=True)
+        result, ai_result = await analyze_job_with_ai(sample_job, use_ai=True)
 
         # Should have used rule-based analysis
         assert ai_result is None
@@ -438,12 +630,33 @@ class TestAnalyzeJobWithAI:
         assert result.suggested_priority >= 0
 
     @patch("src.services.job_analysis_service.settings")
-    def test_rules_only_mode(self, mock_settings, sample_job):
+    async def test_rules_only_mode(self, mock_settings, sample_job):
         """Test forcing rule-based analysis."""
         mock_settings.anthropic_api_key = "test-key"
 
-        result, ai_result = analyze_job_with_ai(sample_job, use_ai=False)
+        result, ai_result = await analyze_job_with_ai(sample_job, use_ai=False)
 
         # Should have used rule-based analysis
         assert ai_result is None
         assert result is not None
+
+    @patch("src.services.job_analysis_service.settings")
+    async def test_cache_write_failure_keeps_ai_result(self, mock_settings, sample_job, mock_ai_response):
+        """Test that a failed cache write doesn't throw away a good AI analysis."""
+        mock_settings.anthropic_api_key = "test-key"
+        result = AIJobAnalysisResult.model_validate(mock_ai_response)
+
+        with (
+            patch.object(ai_analysis_service, "analyze_async", AsyncMock(return_value=result)),
+            patch.object(analysis_cache, "get_for_job_async", AsyncMock(return_value=None)),
+            patch.object(
+                analysis_cache,
+                "set_for_job_async",
+                AsyncMock(side_effect=sqlite3.OperationalError("database is locked")),
+            ) as set_for_job,
+        ):
+            legacy, ai_result = await analyze_job_with_ai(sample_job, use_ai=True)
+
+        assert ai_result == result
+        assert legacy.suggested_priority == result.overall_assessment.priority_score
+        set_for_job.assert_awaited_once()
@@ -1,10 +1,13 @@
 """Tests for batch analyze endpoint."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 
 from src.models.job import RoleType
-from src.services.ai_analysis_service import AIAnalysisResult
+from src.services.batch_analysis import TokenBucket
 
 
 @pytest.mark.asyncio
@@ -60,7 +63,7 @@ async def test_batch_analyze_processes_eligible_jobs(monkeypatch, client, api_ke
     mock_result.technologies_missing = []
     mock_result.location_notes = None
 
-    mock_ai_result = MagicMock(spec=AIAnalysisResult)
+    mock_ai_result = MagicMock()
     mock_ai_result.overall_assessment.priority_score = 85
     mock_ai_result.overall_assessment.recommendation.value = "apply"
     mock_ai_result.overall_assessment.summary = "Good fit"
@@ -69,11 +72,13 @@ async def test_batch_analyze_processes_eligible_jobs(monkeypatch, client, api_ke
     mock_ai_result.skills_alignment.strong_matches = ["Python"]
     mock_ai_result.skills_alignment.partial_matches = []
     mock_ai_result.skills_alignment.gaps = []
+    mock_ai_result.ai_forward_assessment.is_ai_forward = False
+    mock_ai_result.location_assessment.is_compatible = True
 
-    def mock_analyze(*_args, **_kwargs):
+    async def mock_analyze(*_args, **_kwargs):
         return mock_result, mock_ai_result
 
-    monkeypatch.setattr("src.api.routes.jobs.analyze_job_with_ai", mock_analyze)
+    monkeypatch.setattr("src.services.batch_analysis.analyze_job_with_ai", mock_analyze)
 
     # Create job with long enough description
     long_description = "A" * 600  # More than 500 chars
@@ -119,7 +124,7 @@ async def test_batch_analyze_skips_already_analyzed_jobs(monkeypatch, client, ap
     mock_result.technologies_missing = []
     mock_result.location_notes = None
 
-    mock_ai_result = MagicMock(spec=AIAnalysisResult)
+    mock_ai_result = MagicMock()
     mock_ai_result.overall_assessment.priority_score = 75
     mock_ai_result.overall_assessment.recommendation.value = "apply"
     mock_ai_result.overall_assessment.summary = "Decent fit"
@@ -128,11 +133,13 @@ async def test_batch_analyze_skips_already_analyzed_jobs(monkeypatch, client, ap
     mock_ai_result.skills_alignment.strong_matches = []
     mock_ai_result.skills_alignment.partial_matches = []
     mock_ai_result.skills_alignment.gaps = []
+    mock_ai_result.ai_forward_assessment.is_ai_forward = False
+    mock_ai_result.location_assessment.is_compatible = True
 
-    def mock_analyze(*_args, **_kwargs):
+    async def mock_analyze(*_args, **_kwargs):
         return mock_result, mock_ai_result
 
-    monkeypatch.setattr("src.api.routes.jobs.analyze_job_with_ai", mock_analyze)
+    monkeypatch.setattr("src.services.batch_analysis.analyze_job_with_ai", mock_analyze)
 
     # Create job with long enough description
     long_description = "B" * 600
@@ -187,7 +194,7 @@ async def test_batch_analyze_respects_limit(monkeypatch, client, api_key_header,
     mock_result.technologies_missing = []
     mock_result.location_notes = None
 
-    mock_ai_result = MagicMock(spec=AIAnalysisResult)
+    mock_ai_result = MagicMock()
     mock_ai_result.overall_assessment.priority_score = 80
     mock_ai_result.overall_assessment.recommendation.value = "apply"
     mock_ai_result.overall_assessment.summary = "Good"
@@ -196,11 +203,13 @@ async def test_batch_analyze_respects_limit(monkeypatch, client, api_key_header,
     mock_ai_result.skills_alignment.strong_matches = []
     mock_ai_result.skills_alignment.partial_matches = []
     mock_ai_result.skills_alignment.gaps = []
+    mock_ai_result.ai_forward_assessment.is_ai_forward = False
+    mock_ai_result.location_assessment.is_compatible = True
 
-    def mock_analyze(*_args, **_kwargs):
+    async def mock_analyze(*_args, **_kwargs):
         return mock_result, mock_ai_result
 
-    monkeypatch.setattr("src.api.routes.jobs.analyze_job_with_ai", mock_analyze)
+    monkeypatch.setattr("src.services.batch_analysis.analyze_job_with_ai", mock_analyze)
 
     # Create multiple jobs
     long_description = "C" * 600
@@ -253,3 +262,112 @@ async def test_batch_analyze_request_validation(client, api_key_header):
         headers=api_key_header,
     )
     assert response.status_code == 422
+
+
+def _mock_analysis_results(priority):
+    """Build (analysis, ai_result) mocks for analyze_job_with_ai."""
+    mock_result = MagicMock()
+    mock_result.suggested_priority = priority
+    mock_result.is_ai_forward = False
+    mock_result.is_location_compatible = True
+    mock_result.suggested_role = RoleType.VP
+    mock_result.location_notes = None
+
+    mock_ai_result = MagicMock()
+    mock_ai_result.overall_assessment.priority_score = priority
+    mock_ai_result.overall_assessment.recommendation.value = "apply"
+    mock_ai_result.overall_assessment.summary = "Good"
+    mock_ai_result.overall_assessment.key_strengths = []
+    mock_ai_result.overall_assessment.key_concerns = []
+    mock_ai_result.skills_alignment.strong_matches = []
+    mock_ai_result.skills_alignment.partial_matches = []
+    mock_ai_result.skills_alignment.gaps = []
+    mock_ai_result.ai_forward_assessment.is_ai_forward = False
+    mock_ai_result.location_assessment.is_compatible = True
+    return mock_result, mock_ai_result
+
+
+@pytest.mark.asyncio
+async def test_batch_analyze_runs_jobs_concurrently(monkeypatch, client, api_key_header, test_job_payload):
+    """Test batch analyze keeps up to `concurrency` analyses in flight."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_analyze(*_args, **_kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return _mock_analysis_results(70)
+
+    monkeypatch.setattr("src.services.batch_analysis.analyze_job_with_ai", mock_analyze)
+
+    for i in range(4):
+        await client.post(
+            "/api/v1/jobs",
+            json=test_job_payload(title=f"Parallel {i}", description_raw="D" * 600),
+            headers=api_key_header,
+        )
+
+    response = await client.post(
+        "/api/v1/jobs/analyze-all",
+        json={"limit": 4, "min_description_length": 500, "delay_seconds": 0.1, "concurrency": 2},
+        headers=api_key_header,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["successful"] == 4
+    assert data["concurrency"] == 2
+    assert max_in_flight == 2
+    assert data["throughput_per_minute"] > 0
+    assert all(r["latency_ms"] >= 50 for r in data["results"])
+
+
+@pytest.mark.asyncio
+async def test_batch_analyze_isolates_job_failures(monkeypatch, client, api_key_header, test_job_payload):
+    """Test a failing job does not prevent the others from being committed."""
+    async def mock_analyze(job, *_args, **_kwargs):
+        if job.title == "Broken":
+            raise RuntimeError("analysis exploded")
+        return _mock_analysis_results(90)
+
+    monkeypatch.setattr("src.services.batch_analysis.analyze_job_with_ai", mock_analyze)
+
+    ok_response = await client.post(
+        "/api/v1/jobs",
+        json=test_job_payload(title="Works", description_raw="E" * 600),
+        headers=api_key_header,
+    )
+    await client.post(
+        "/api/v1/jobs",
+        json=test_job_payload(title="Broken", description_raw="E" * 600),
+        headers=api_key_header,
+    )
+
+    response = await client.post(
+        "/api/v1/jobs/analyze-all",
+        json={"limit": 2, "min_description_length": 500, "delay_seconds": 0.1},
+        headers=api_key_header,
+    )
+    data = response.json()
+    assert data["successful"] == 1
+    assert data["failed"] == 1
+    broken = next(r for r in data["results"] if r["title"] == "Broken")
+    assert broken["error"] == "analysis exploded"
+
+    job = (await client.get(f"/api/v1/jobs/{ok_response.json()['id']}", headers=api_key_header)).json()
+    assert job["priority"] == 90
+    assert any(n.get("note_type") == "ai_analysis_summary" for n in job["notes"])
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_acquisitions():
+    """Test the token bucket allows a burst, then refills at the configured rate."""
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    elapsed = time.monotonic() - start
+    # Two tokens are available immediately; the next two take ~1/20s each
+    assert 0.08 <= elapsed < 0.5
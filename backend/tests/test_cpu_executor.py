@@ -0,0 +1,45 @@
+"""Tests for the CPU-bound work process pool."""
+
+import os
+
+import pytest
+
+from src.services.cpu_executor import CPUExecutor
+from src.services.jd_analyzer import detect_and_parse_jd
+from src.services.job_scraper import JobScrapeError, parse_job_html
+
+PAGE_HTML = (
+    '<html><head><script type="application/ld+json">'
+    '{"@type": "JobPosting", "title": "Engineer", "hiringOrganization": {"name": "Acme"}, '
+    '"description": "<p>Python, PostgreSQL and AWS. 5+ years of experience.</p>"}'
+    "</script></head></html>"
+)
+URL = "https://boards.greenhouse.io/acme/jobs/1"
+
+
+@pytest.fixture(scope="module")
+def pool_executor():
+    executor = CPUExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+async def test_inline_when_no_workers():
+    executor = CPUExecutor(max_workers=0)
+    assert not executor.enabled
+    assert await executor.run(os.getpid) == os.getpid()
+
+
+async def test_runs_in_worker_process(pool_executor):
+    assert await pool_executor.run(os.getpid) != os.getpid()
+
+
+async def test_pool_results_match_inline(pool_executor):
+    assert await pool_executor.run(parse_job_html, URL, PAGE_HTML) == parse_job_html(URL, PAGE_HTML)
+    description = parse_job_html(URL, PAGE_HTML).description
+    assert await pool_executor.run(detect_and_parse_jd, description) == detect_and_parse_jd(description)
+
+
+async def test_worker_exceptions_propagate(pool_executor):
+    with pytest.raises(JobScrapeError):
+        await pool_executor.run(parse_job_html, URL, "<html></html>")
@@ -0,0 +1,128 @@
+"""Tests for near-duplicate job detection."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from src.api.routes import jobs as jobs_routes
+from src.models import Job
+from src.services import job_scraper
+from src.services.duplicate_index import (
+    DuplicateIndex,
+    compute_signature,
+    decode_signature,
+    encode_signature,
+)
+from src.services.job_scraper import ScrapedJob
+from tests.jd_samples import SAMPLE_DESCRIPTIONS
+
+DESCRIPTION = SAMPLE_DESCRIPTIONS[0]
+EEO = "We are an equal opportunity employer and value diversity at our company."
+
+
+def test_signature_similarity():
+    index = DuplicateIndex(threshold=0.8)
+    original, reworded, other = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    index.add(original, "Acme", compute_signature("Staff Engineer", DESCRIPTION))
+    index.add(other, "Acme", compute_signature("Staff Engineer", SAMPLE_DESCRIPTIONS[1]))
+
+    signature = compute_signature("Staff Engineer", DESCRIPTION + "\nApply by Friday.")
+    matches = index.query(signature, "Acme")
+    assert [match.job_id for match in matches] == [original]
+    assert matches[0].similarity >= 0.8
+
+    index.add(reworded, "Acme", signature)
+    [cluster] = index.clusters()
+    assert set(cluster) == {original, reworded}
+
+
+def test_signature_ignores_boilerplate_and_formatting():
+    plain = compute_signature("Staff Engineer", DESCRIPTION)
+    decorated = compute_signature("STAFF ENGINEER", "• " + DESCRIPTION.replace("\n", "\n  ") + "\n" + EEO)
+    assert (plain == decorated).all()
+    assert compute_signature(None, "  ") is None
+    assert (decode_signature(encode_signature(plain)) == plain).all()
+    assert decode_signature(b"") is None
+
+
+def test_company_must_match():
+    index = DuplicateIndex()
+    job_id = uuid.uuid4()
+    signature = compute_signature("Staff Engineer", DESCRIPTION)
+    index.add(job_id, "Acme, Inc.", signature)
+
+    assert [match.job_id for match in index.query(signature, "acme")] == [job_id]
+    assert index.query(signature, "Globex") == []
+
+    index.remove(job_id)
+    assert index.query(signature, "Acme") == []
+    assert len(index) == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_flags_near_duplicates(monkeypatch, client, api_key_header):
+    company = f"Dup Test {uuid.uuid4().hex[:8]}"
+    listings = {
+        "1": DESCRIPTION,
+        "2": DESCRIPTION + "\n" + EEO,  # cross-posted with an EEO footer
+        "3": SAMPLE_DESCRIPTIONS[1],
+    }
+
+    async def fake_scrape(url: str, source: str | None = None):
+        source_id = url.rsplit("/", 1)[-1]
+        return ScrapedJob(
+            title="Staff Engineer",
+            company=company,
+            location="Remote",
+            description=listings[source_id.split("-")[0]],
+            source=source or "test",
+            source_id=source_id,
+            raw_html="<html></html>",
+        )
+
+    monkeypatch.setattr(job_scraper, "scrape", fake_scrape)
+    monkeypatch.setattr(jobs_routes, "duplicate_index", DuplicateIndex(sync_interval_seconds=0))
+
+    run = uuid.uuid4().hex[:8]
+    created = []
+    for listing in listings:
+        response = await client.post(
+            "/api/v1/jobs/ingest",
+            json={"url": f"https://example.com/jobs/{listing}-{run}", "source": "test"},
+            headers=api_key_header,
+        )
+        assert response.status_code == 201
+        created.append(response.json())
+
+    assert created[0]["duplicate_of_id"] is None
+    assert created[1]["duplicate_of_id"] == created[0]["id"]
+    assert created[2]["duplicate_of_id"] is None
+
+    response = await client.get("/api/v1/jobs/duplicates", headers=api_key_header)
+    assert response.status_code == 200
+    clusters = [
+        [job["id"] for job in cluster["jobs"]]
+        for cluster in response.json()["clusters"]
+        if cluster["jobs"][0]["company"] == company
+    ]
+    assert clusters == [[created[0]["id"], created[1]["id"]]]
+
+
+@pytest.mark.asyncio
+async def test_backfill_leaves_updated_at_alone(db_session):
+    stale = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    job = Job(title="Staff Engineer", company="Backfill Co", description_raw=DESCRIPTION, updated_at=stale)
+    db_session.add(job)
+    await db_session.flush()
+
+    index = DuplicateIndex()
+    query = select(Job.updated_at, Job.minhash_signature, Job.minhash_signed_at).where(Job.id == job.id)
+    # Backfill runs in batches; keep going until it reaches this job
+    while (await db_session.execute(query)).one().minhash_signature is None:
+        assert await index._backfill(db_session)
+
+    updated_at, signature, signed_at = (await db_session.execute(query)).one()
+    assert updated_at == stale
+    assert signature and signed_at is not None
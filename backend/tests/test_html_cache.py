@@ -0,0 +1,137 @@
+"""Tests for the scraper's on-disk HTML cache."""
+
+import time
+
+import httpx
+import pytest
+
+from src.services.html_cache import HTMLCache, normalize_url
+from src.services.job_scraper import JobScraper
+
+
+def _page(title: str) -> str:
+    return (
+        '<html><head><script type="application/ld+json">'
+        f'{{"@type": "JobPosting", "title": "{title}", "hiringOrganization": {{"name": "Acme"}}}}'
+        "</script></head></html>"
+    )
+
+
+def _cache(tmp_path, **kwargs) -> HTMLCache:
+    options = {"ttl_seconds": 3600, "max_bytes": 10 * 1024 * 1024, **kwargs}
+    return HTMLCache(tmp_path / "cache", **options)
+
+
+@pytest.mark.asyncio
+async def test_etag_revalidation_reuses_body_and_parse(tmp_path, monkeypatch):
+    seen_headers = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=_page("Engineer"), headers={"ETag": '"v1"'})
+
+    cache = _cache(tmp_path)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        scraper = JobScraper(client=client, cache=cache)
+        first = await scraper.scrape("https://boards.greenhouse.io/acme/jobs/1")
+
+        parse_calls = []
+        monkeypatch.setattr(scraper, "parse", lambda *args: parse_calls.append(args))
+        second = await scraper.scrape("https://boards.greenhouse.io/acme/jobs/1?utm_source=x")
+
+    assert "if-none-match" not in seen_headers[0]
+    assert seen_headers[1]["if-none-match"] == '"v1"'
+    assert second == first
+    assert parse_calls == []
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["parse_hits"]) == (1, 1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_last_modified_is_sent_as_if_modified_since(tmp_path):
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-modified-since"))
+        return httpx.Response(
+            200, text=_page("Engineer"), headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        scraper = JobScraper(client=client, cache=_cache(tmp_path))
+        await scraper.fetch_html("https://jobs.lever.co/acme/1")
+        await scraper.fetch_html("https://jobs.lever.co/acme/1")
+
+    assert seen == [None, "Wed, 01 Jan 2025 00:00:00 GMT"]
+
+
+@pytest.mark.asyncio
+async def test_changed_page_is_refetched_and_reparsed(tmp_path):
+    versions = iter(["Engineer", "Senior Engineer"])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=_page(next(versions)), headers={"ETag": str(time.time())})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        scraper = JobScraper(client=client, cache=_cache(tmp_path))
+        first = await scraper.scrape("https://boards.greenhouse.io/acme/jobs/1")
+        second = await scraper.scrape("https://boards.greenhouse.io/acme/jobs/1")
+
+    assert (first.title, second.title) == ("Engineer", "Senior Engineer")
+    assert scraper.cache.stats()["misses"] == 2
+    # The superseded body was released
+    assert len(list((tmp_path / "cache" / "bodies").iterdir())) == 1
+
+
+def test_parsed_results_are_kept_per_backend(tmp_path):
+    url, body = "https://boards.greenhouse.io/acme/jobs/1", _page("Engineer")
+    cache = _cache(tmp_path)
+    cache.store(url, body)
+    scraped = JobScraper(parser_backend="fast").parse(url, body)
+    cache.put_parsed(url, body, None, "fast", scraped)
+
+    assert cache.get_parsed(url, body, None, "fast") == scraped
+    assert cache.get_parsed(url, body, None, "bs4") is None
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = _cache(tmp_path, ttl_seconds=0)
+    cache.store("https://jobs.lever.co/acme/1", _page("Engineer"), etag='"v1"')
+    time.sleep(0.01)
+    assert cache.lookup("https://jobs.lever.co/acme/1") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_bounds_size(tmp_path):
+    body_size = len(_page("Role 0").encode())
+    cache = _cache(tmp_path, max_bytes=body_size * 2)
+
+    cache.store("https://jobs.lever.co/acme/0", _page("Role 0"))
+    cache.store("https://jobs.lever.co/acme/1", _page("Role 1"))
+    # Touch 0 so 1 becomes least recently used
+    cache.record_hit("https://jobs.lever.co/acme/0")
+    cache.store("https://jobs.lever.co/acme/2", _page("Role 2"))
+
+    assert cache.lookup("https://jobs.lever.co/acme/0") is not None
+    assert cache.lookup("https://jobs.lever.co/acme/1") is None
+    assert cache.lookup("https://jobs.lever.co/acme/2") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size_bytes"] <= body_size * 2
+
+
+def test_cache_survives_restart(tmp_path):
+    _cache(tmp_path).store("https://jobs.lever.co/acme/1", _page("Engineer"), etag='"v1"')
+
+    reloaded = _cache(tmp_path)
+    record = reloaded.lookup("https://jobs.lever.co/acme/1")
+    assert record is not None
+    assert record.validators() == {"If-None-Match": '"v1"'}
+    assert reloaded.read_body(record) == _page("Engineer")
+
+
+def test_normalize_url_drops_tracking_and_fragment():
+    assert normalize_url(
+        "HTTPS://www.LinkedIn.com:443/jobs/view/123/?trackingId=abc&refId=def&b=2&a=1#top"
+    ) == "https://www.linkedin.com/jobs/view/123?a=1&b=2"
@@ -0,0 +1,92 @@
+"""Tests for the streaming HTML scanner used by the fast parse path."""
+
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.services.html_scanner import html_to_text, scan_page
+from src.services.job_scraper import _detect_linkedin_easy_apply
+
+FRAGMENTS = [
+    "<p>", "</p>", "<b>", "</b>", "<br>", "<br/>", "<div class='x'>", "</div>",
+    "<ul><li>one<li>two</ul>", "<a href=x>link</a>", " ", "  \n", "\xa0", "text", "é",
+    "&amp;", "&amp", "&lt;p&gt;", "&nbsp;", "&#65;", "&#x41;", "&#150;", "&#0;", "&bogus;",
+    "&", "<", "> ", "<!-- c -->", "<![CDATA[cd]]>", "<!DOCTYPE html>", "<?pi ?>", "<![if x]>",
+    "<script>var a='<p>';</script>", "<style>p{}</style>", "<STYLE>s</STYLE>",
+    "<template>", "</template>", "<textarea>&amp;<b></textarea>", "<title>t&amp;</title>",
+    "<script type=\"application/ld+json\">{\"a\": 1}</script>",
+    "<script type='application/ld+json'></script>",
+    "<SCRIPT TYPE=\"application/ld+json\">[1]</SCRIPT>",
+    "<script type=\"Application/ld+json\">{}</script>",
+    "<script type=\"application/ld+json\">{\"x\": \"</p>\"}",
+    "<meta property='og:title' content='T'>", "<Meta PROPERTY=\"og:title\" CONTENT=\" x  y \">",
+    "<meta name=\"description\" content=\"\">", "<meta content=C name=description>",
+    "<meta property=a property=og:title content=dup>",
+]
+
+EASY_APPLY_FRAGMENTS = [
+    "<button class='jobs-apply-button'>", "<button data-job-id=1>", "<button data-job-id>", "</button>",
+    "<div class='top-card-layout__cta-container'>", "<section class='apply-button-container x'>",
+    "</section>", "<div class='jobs-unified-top-card'>", "</div>", "<div>", "<div/>",
+    "<span class='jobs-apply-button__label'>", "</span>", "<p class='easy-apply-text'>", "</p>",
+    "<a class='jobs-apply-button--top-card'>", "</a>", "<b class='apply-button--top-card'>", "</b>",
+    "<input class='easy-apply-text'>", "<br>", "</br>", "Easy Apply", " easy apply ", "Easy", " Apply",
+    "Easy A", "pply", "Easy&nbsp;Apply", "Easy&#32;Apply", "<!-- Easy Apply -->",
+    "<script>Easy Apply</script>", "<style>easy apply</style>", "<![CDATA[Easy Apply]]>",
+    "<textarea>Easy Apply</textarea>", "<template>", "text",
+]
+
+META_SELECTORS = [
+    ["meta[property='og:title']", "meta[name='twitter:title']"],
+    ["meta[property='og:description']", "meta[name='description']"],
+]
+
+
+def _assert_matches_beautifulsoup(markup: str) -> None:
+    soup = BeautifulSoup(markup, "html.parser")
+    scan = scan_page(markup)
+
+    assert html_to_text(markup) == soup.get_text(" ", strip=True), markup
+    assert scan.json_ld == [
+        script.string for script in soup.find_all("script", type="application/ld+json")
+    ], markup
+    for selectors in META_SELECTORS:
+        expected = None
+        for selector in selectors:
+            element = soup.select_one(selector)
+            if element and element.get("content"):
+                expected = " ".join(element["content"].split())
+                break
+        assert scan.meta_content(selectors) == expected, markup
+
+
+def test_scanner_matches_beautifulsoup_on_random_markup():
+    rng = random.Random(7)
+    for _ in range(1000):
+        _assert_matches_beautifulsoup("".join(rng.choices(FRAGMENTS, k=rng.randint(0, 15))))
+
+
+def test_easy_apply_scan_matches_beautifulsoup():
+    rng = random.Random(11)
+    decided = 0
+    for _ in range(2000):
+        markup = "".join(rng.choices(EASY_APPLY_FRAGMENTS, k=rng.randint(0, 15)))
+        scanned = scan_page(markup, easy_apply=True).easy_apply
+        if "<template" in markup:
+            assert scanned is None
+            continue
+        decided += 1
+        assert scanned == _detect_linkedin_easy_apply(BeautifulSoup(markup, "html.parser")), markup
+    assert decided
+    assert scan_page("<button class='jobs-apply-button'>Easy Apply</button>").easy_apply is None
+
+
+def test_html_to_text_skips_scripts_and_comments():
+    markup = "<p>Build <b>reliable</b>&nbsp;systems</p><!-- hidden --><script>track()</script><p>Now</p>"
+    assert html_to_text(markup) == "Build reliable systems Now"
+
+
+def test_meta_content_rejects_other_selectors():
+    with pytest.raises(ValueError):
+        scan_page("<html></html>").meta_content(["div.title"])
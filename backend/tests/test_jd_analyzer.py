@@ -0,0 +1,52 @@
+"""Tests for the job description analyzer's single-pass matchers."""
+
+import pytest
+
+from benchmarks.bench_jd_analyzer import (
+    reference_seniority_level,
+    reference_technologies,
+    reference_years_experience,
+)
+from src.services.jd_analyzer import (
+    _PatternSet,
+    extract_seniority_level,
+    extract_technologies,
+    extract_years_experience,
+)
+from tests.jd_samples import SAMPLE_DESCRIPTIONS
+
+EDGE_CASES = [
+    "",
+    "Redis queue workers, Redis caching and Celery",  # overlapping matches across groups
+    "ASP.NET, .NET and asp.net core; C# and C#9; C++",
+    "golang vs Go vs GoLang; Node.js, NodeJS, next.js, Nest.JS",
+    "Required 3 years; 5+ years of experience; 2-4 yrs",  # priority is by pattern, not position
+    "Experience: 4 - 6 years, at least 2 yrs",
+    "Looking for an Intern, later a Junior, mid-level or SENIOR engineer; team lead preferred",
+    "K8s and Kubernetes",  # Kelvin sign matches k only case-insensitively
+    "PYTHON İstanbul office, ſcala team, ıntern",
+    "Sr. engineer at a Staff-level bar",
+]
+
+
+@pytest.mark.parametrize("text", SAMPLE_DESCRIPTIONS + EDGE_CASES)
+def test_matches_per_pattern_reference(text):
+    assert extract_technologies(text) == reference_technologies(text)
+    assert extract_years_experience(text) == reference_years_experience(text)
+    assert extract_seniority_level(text) == reference_seniority_level(text)
+
+
+def test_pattern_set_reports_overlapping_matches_per_pattern():
+    patterns = _PatternSet([r"\b(redis)\b", r"\b(redis queue|celery)\b", r"\b(celery)\b"])
+    text = "Redis queue and celery"
+    spans = patterns.findall(text)
+    assert [[text[start:end] for start, end in pattern_spans] for pattern_spans in spans] == [
+        ["Redis"],
+        ["Redis queue", "celery"],
+        ["celery"],
+    ]
+
+
+def test_pattern_set_requires_lowercase_patterns():
+    with pytest.raises(ValueError):
+        _PatternSet([r"\b(AWS)\b"])
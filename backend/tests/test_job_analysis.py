@@ -0,0 +1,99 @@
+"""Tests for batch rule-based job analysis."""
+
+import random
+
+import pytest
+
+from src.models import Job
+from src.models.job import RoleType, WorkLocationType
+from src.services import job_analysis_service
+from src.services.job_analysis_service import SCORED_ROLES, analyze_job, analyze_jobs_batch
+from tests.jd_samples import SAMPLE_DESCRIPTIONS
+
+TITLES = [
+    None,
+    "CTO",
+    "Chief Technology Officer - Remote",
+    "VP of Engineering",
+    "Director, Software Engineering",
+    "Head of AI Platform",
+    "Principal Architect",
+    "Senior Software Engineer (Distributed)",
+    "Product Designer",
+]
+COMPANIES = [None, "Acme", "An AI-first company", "Neural Network Labs"]
+LOCATIONS = [
+    (None, None),
+    ("Remote US", WorkLocationType.REMOTE),
+    ("Remote US (CA, WA)", WorkLocationType.REMOTE),
+    ("Atlanta, GA", WorkLocationType.HYBRID),
+    ("Seattle, WA", WorkLocationType.ON_SITE),
+]
+RESUME_SKILLS = {"python", "typescript", "aws", "postgresql", "postgres", "react", "kubernetes", "llm", "openai"}
+EXTRA_TEXT = [
+    "",
+    "Our AI platform uses LLM embeddings, OpenAI, LangChain, PyTorch and a vector database.",
+    "Generative AI and prompt engineering with Claude and GPT.",
+    "Requirements: 25+ years of experience with AWS, aws, Rust, Scala, Elixir, Haskell.",
+    "Must have 0 years of experience. Kotlin, Swift, Perl, PHP, Cassandra, Oracle.",
+]
+
+
+@pytest.fixture(autouse=True)
+def resume_skills(monkeypatch):
+    monkeypatch.setattr(job_analysis_service, "_get_my_skills", lambda: set(RESUME_SKILLS))
+
+
+def make_jobs(count: int, seed: int = 7) -> list[Job]:
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(count):
+        location, work_location_type = rng.choice(LOCATIONS)
+        jobs.append(Job(
+            title=rng.choice(TITLES),
+            company=rng.choice(COMPANIES),
+            location=location,
+            work_location_type=work_location_type,
+            description_raw=rng.choice([None, *SAMPLE_DESCRIPTIONS]) and (
+                rng.choice(SAMPLE_DESCRIPTIONS) + "\n" + rng.choice(EXTRA_TEXT)
+            ),
+        ))
+    return jobs
+
+
+def analyze_one_by_one(jobs: list[Job]):
+    return [
+        analyze_job(
+            description=job.description_raw or "",
+            title=job.title,
+            company=job.company,
+            location=job.location,
+            work_location_type=job.work_location_type.value if job.work_location_type else None,
+        )
+        for job in jobs
+    ]
+
+
+def test_batch_matches_analyze_job():
+    jobs = make_jobs(300)
+    assert analyze_jobs_batch(jobs) == analyze_one_by_one(jobs)
+
+
+def test_batch_of_jobs_without_technologies():
+    jobs = [Job(title="Director", description_raw=None), Job(title=None, description_raw="Hello")]
+    assert analyze_jobs_batch(jobs) == analyze_one_by_one(jobs)
+    assert analyze_jobs_batch([]) == []
+
+
+def test_batch_scores_against_given_skills():
+    job = Job(title="VP of Engineering", description_raw="Python, Rust and Kubernetes. 8+ years of experience.")
+    [default] = analyze_jobs_batch([job])
+    [rescored] = analyze_jobs_batch([job], skills={"rust"})
+
+    assert default.technologies_matched == ["Kubernetes", "Python"]
+    assert rescored.technologies_matched == ["Rust"]
+    assert rescored.technologies_missing == ["Kubernetes", "Python"]
+    # 2 of 3 technologies matched before, 1 of 3 now
+    assert default.suggested_priority - rescored.suggested_priority == int(2 / 3 * 20) - int(1 / 3 * 20)
+    assert [score.role for score in rescored.role_scores] == SCORED_ROLES
+    assert rescored.suggested_role == RoleType.VP
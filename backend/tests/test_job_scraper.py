@@ -1,12 +1,14 @@
 """Tests for job scraping/parsing."""
 
+import asyncio
+
+import httpx
 import pytest
 
 from src.services.job_scraper import JobScraper, JobScrapeError
 
 
-def test_parse_json_ld_job_posting():
-    html = """
+JSON_LD_PAGE_HTML = """
     <html>
       <head>
         <script type="application/ld+json">
@@ -23,8 +25,11 @@ def test_parse_json_ld_job_posting():
       <body></body>
     </html>
     """
+
+
+def test_parse_json_ld_job_posting():
     scraper = JobScraper()
-    result = scraper.parse("https://linkedin.com/jobs/view/123", html, source="linkedin")
+    result = scraper.parse("https://linkedin.com/jobs/view/123", JSON_LD_PAGE_HTML, source="linkedin")
     assert result.title == "Senior Engineer"
     assert result.company == "Acme Corp"
     assert result.location == "Austin, TX, US"
@@ -36,3 +41,114 @@ def test_parse_requires_title_and_company():
     scraper = JobScraper()
     with pytest.raises(JobScrapeError):
         scraper.parse("https://indeed.com/viewjob?jk=abc", html, source="indeed")
+
+
+LINKEDIN_SELECTOR_HTML = """
+<html><head><meta property="og:title" content="Staff  Engineer"></head><body>
+  <h1 class="top-card-layout__title">Ignored</h1>
+  <a class="topcard__org-name-link">Globex</a>
+  <span class="topcard__flavor--bullet">Remote</span>
+  <div class="show-more-less-html__markup"><p>Ship &amp; <b>scale</b></p><ul><li>Go</li></ul></div>
+  <button class="jobs-apply-button">Easy Apply</button>
+</body></html>
+"""
+
+GREENHOUSE_ESCAPED_HTML = """
+<html><head>
+  <meta property="og:site_name" content="Initech">
+  <meta name="description" content="">
+  <script type="application/ld+json">{"@graph": [{"@type": "Organization"}, {
+    "@type": ["JobPosting"],
+    "title": "Data Engineer",
+    "description": "&lt;p&gt;Pipelines &amp;amp; <b>SQL</b>&nbsp;&#8211; hybrid<!-- x --><style>p {}</style></p>",
+    "jobLocation": [{"address": "Denver, CO"}],
+    "baseSalary": {"currency": "USD", "value": {"minValue": 100000, "maxValue": 150000}},
+    "employmentType": "FULL_TIME"
+  }]}</script>
+</head><body><div class="company-name">  </div></body></html>
+"""
+
+
+@pytest.mark.parametrize(
+    ("url", "html", "source"),
+    [
+        ("https://linkedin.com/jobs/view/123", JSON_LD_PAGE_HTML, "linkedin"),
+        ("https://www.linkedin.com/jobs/view/456", LINKEDIN_SELECTOR_HTML, None),
+        ("https://boards.greenhouse.io/initech/jobs/789", GREENHOUSE_ESCAPED_HTML, None),
+    ],
+)
+def test_fast_parser_backend_matches_beautifulsoup(url, html, source):
+    fast = JobScraper(parser_backend="fast").parse(url, html, source)
+    reference = JobScraper(parser_backend="bs4").parse(url, html, source)
+    assert fast == reference
+
+
+JOB_POSTING_HTML = (
+    '<html><head><script type="application/ld+json">'
+    '{"@type": "JobPosting", "title": "Engineer", "hiringOrganization": {"name": "Acme"}}'
+    "</script></head></html>"
+)
+
+
+@pytest.mark.asyncio
+async def test_scrape_many_limits_concurrency_per_host():
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.02)
+        in_flight[host] -= 1
+        return httpx.Response(200, text=JOB_POSTING_HTML)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        scraper = JobScraper(client=client, per_host_limit=2)
+        targets = [(f"https://boards.greenhouse.io/acme/jobs/{i}", None) for i in range(6)]
+        targets += [(f"https://jobs.lever.co/acme/{i}", None) for i in range(6)]
+        results = await scraper.scrape_many(targets, max_concurrency=10)
+
+    assert len(results) == 12
+    assert all(result.title == "Engineer" for result in results)
+    assert results[0].source == "greenhouse" and results[-1].source == "lever"
+    assert peak == {"boards.greenhouse.io": 2, "jobs.lever.co": 2}
+
+
+@pytest.mark.asyncio
+async def test_default_client_is_shared_and_closed_by_aclose():
+    scraper = JobScraper()
+    client = scraper.client
+    assert scraper.client is client
+    assert not client.is_closed
+
+    await scraper.aclose()
+    assert client.is_closed
+    # A fresh pool is created if the scraper is used again
+    assert scraper.client is not client
+    await scraper.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_leaves_injected_client_open():
+    async with httpx.AsyncClient() as client:
+        scraper = JobScraper(client=client)
+        await scraper.aclose()
+        assert not client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_scrape_many_reports_errors_in_place(monkeypatch):
+    async def fake_fetch_html(url: str) -> str:
+        raise httpx.ConnectError("connection refused")
+
+    scraper = JobScraper()
+    monkeypatch.setattr(scraper, "fetch_html", fake_fetch_html)
+
+    results = await scraper.scrape_many(
+        [("https://example.com/job", None), ("https://boards.greenhouse.io/acme/jobs/1", None)]
+    )
+    assert isinstance(results[0], JobScrapeError)
+    assert str(results[0]) == "Unsupported job board URL"
+    assert isinstance(results[1], JobScrapeError)
+    assert "connection refused" in str(results[1])
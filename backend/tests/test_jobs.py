@@ -1,9 +1,12 @@
 """Tests for job endpoints."""
 
+import uuid
+
 import pytest
 
+from src.models import JobSource
 from src.services.job_scraper import ScrapedJob
-from src.services import job_scraper
+from src.services import job_scraper, source_archive
 
 
 @pytest.mark.asyncio
@@ -87,6 +90,37 @@ async def test_ingest_job(monkeypatch, client, api_key_header):
     assert data["company"] == "Acme Corp"
 
 
+@pytest.mark.asyncio
+async def test_ingest_archives_source_html(monkeypatch, client, api_key_header, db_session):
+    page = "<html><body>" + "Staff Engineer at Acme. " * 500 + "</body></html>"
+    source_id = uuid.uuid4().hex[:12]
+
+    async def fake_scrape(url: str, source: str | None = None):
+        return ScrapedJob(
+            title="Staff Engineer",
+            company="Acme Corp",
+            location="Remote",
+            description="Build infrastructure.",
+            source=source or "linkedin",
+            source_id=source_id,
+            raw_html=page,
+        )
+
+    monkeypatch.setattr(job_scraper, "scrape", fake_scrape)
+
+    payload = {"url": f"https://linkedin.com/jobs/view/{source_id}", "source": "linkedin"}
+    response = await client.post("/api/v1/jobs/ingest", json=payload, headers=api_key_header)
+    assert response.status_code == 201
+    job_id = uuid.UUID(response.json()["id"])
+
+    assert await source_archive.get(db_session, job_id) == page
+    stored = await db_session.get(JobSource, job_id)
+    assert stored.original_size == len(page) and len(stored.html_zlib) < len(page) // 10
+
+    await source_archive.put(db_session, job_id, "<html>v2</html>")
+    assert await source_archive.get(db_session, job_id) == "<html>v2</html>"
+
+
 @pytest.mark.asyncio
 async def test_bulk_status_update(client, api_key_header, test_job_payload):
     job_ids = []
@@ -398,3 +432,245 @@ async def test_search_jobs_by_id(client, api_key_header, test_job_payload):
     assert response.status_code == 200
     data = response.json()
     assert any(job["id"] == job_id for job in data["items"])
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_fulltext(client, api_key_header, test_job_payload):
+    """Test full-text search over descriptions, with relevance ranking."""
+    word = f"zq{uuid.uuid4().hex[:10]}"
+    once = test_job_payload(title="Platform Engineer", description_raw=f"Own the {word} pipeline.")
+    twice = test_job_payload(title=f"{word} Lead", description_raw=f"Lead {word} adoption.")
+    ids = []
+    for payload in (once, twice):
+        response = await client.post("/api/v1/jobs", json=payload, headers=api_key_header)
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+
+    response = await client.get(
+        f"/api/v1/jobs?search={word}&sort_by=relevance", headers=api_key_header
+    )
+    assert response.status_code == 200
+    assert [job["id"] for job in response.json()["items"]] == ids[::-1]
+
+    # Word search doesn't match inside words; substring mode does
+    fragment = word[2:]
+    response = await client.get(f"/api/v1/jobs?search={fragment}", headers=api_key_header)
+    assert [job["id"] for job in response.json()["items"]] == [ids[1]]  # title trigram match
+    response = await client.get(
+        f"/api/v1/jobs?search={fragment}&search_mode=substring", headers=api_key_header
+    )
+    assert {job["id"] for job in response.json()["items"]} == set(ids)
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_cursor_pagination(client, api_key_header, test_job_payload):
+    """Test keyset pagination visits every job once, in sort order."""
+    company = f"CursorCo {uuid.uuid4().hex[:8]}"
+    salaries = [150000, None, 90000, 150000, None]
+    for index, salary in enumerate(salaries):
+        payload = test_job_payload(title=f"Job {index}", company=company, priority=50, salary_max=salary)
+        response = await client.post("/api/v1/jobs", json=payload, headers=api_key_header)
+        assert response.status_code == 201
+
+    for sort_by in ("priority", "salary"):
+        for sort_order in ("asc", "desc"):
+            params = {"company": company, "sort_by": sort_by, "sort_order": sort_order, "page_size": 10}
+            response = await client.get("/api/v1/jobs", params=params, headers=api_key_header)
+            expected = [job["id"] for job in response.json()["items"]]
+            assert len(expected) == len(salaries)
+
+            seen = []
+            params["page_size"] = 2
+            while True:
+                response = await client.get("/api/v1/jobs", params=params, headers=api_key_header)
+                assert response.status_code == 200
+                data = response.json()
+                seen.extend(job["id"] for job in data["items"])
+                if not data["next_cursor"]:
+                    break
+                params["cursor"] = data["next_cursor"]
+            assert seen == expected
+
+    response = await client.get(
+        "/api/v1/jobs", params={"sort_by": "created_at", "cursor": params["cursor"]}, headers=api_key_header
+    )
+    assert response.status_code == 400
+    response = await client.get("/api/v1/jobs", params={"cursor": "not-a-cursor"}, headers=api_key_header)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_count_modes(client, api_key_header, test_job_payload):
+    """Test exact, cached and estimated totals."""
+    company = f"CountCo {uuid.uuid4().hex[:8]}"
+    params = {"company": company}
+
+    async def total(mode: str) -> dict:
+        response = await client.get("/api/v1/jobs", params={**params, "count": mode}, headers=api_key_header)
+        assert response.status_code == 200
+        return response.json()
+
+    await client.post("/api/v1/jobs", json=test_job_payload(company=company), headers=api_key_header)
+    assert (await total("exact"))["total"] == 1
+    assert (await total("cached"))["total"] == 1
+
+    # A new job moves the jobs watermark, so the cached total is recounted
+    await client.post("/api/v1/jobs", json=test_job_payload(company=company), headers=api_key_header)
+    data = await total("cached")
+    assert (data["total"], data["total_estimated"]) == (2, False)
+
+    data = await total("estimated")
+    assert data["total_estimated"] is True
+    assert data["total"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_summary_view(client, api_key_header, test_job_payload):
+    """Test the summary view leaves out heavy fields and honors fields=."""
+    company = f"SummaryCo {uuid.uuid4().hex[:8]}"
+    payload = test_job_payload(company=company, description_raw="A long description. " * 100)
+    response = await client.post("/api/v1/jobs", json=payload, headers=api_key_header)
+    job_id = response.json()["id"]
+
+    response = await client.get(
+        "/api/v1/jobs", params={"company": company, "view": "summary"}, headers=api_key_header
+    )
+    assert response.status_code == 200
+    [item] = response.json()["items"]
+    assert item["id"] == job_id
+    assert item["company"] == company
+    assert item["contact_count"] == 0
+    assert "description_raw" not in item and "notes" not in item and "contacts" not in item
+
+    response = await client.get(
+        "/api/v1/jobs", params={"company": company, "fields": "title,status"}, headers=api_key_header
+    )
+    assert response.json()["items"] == [{"id": job_id, "title": payload["title"], "status": "saved"}]
+
+    response = await client.get("/api/v1/jobs", params={"fields": "description_raw"}, headers=api_key_header)
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    assert detail.startswith("Unknown fields: description_raw.")
+    assert "Valid fields: id," in detail
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_summary_view_pages_by_cursor(client, api_key_header, test_job_payload):
+    """Test full summary pages (with contact_count) hand out a working cursor."""
+    company = f"SummaryPages {uuid.uuid4().hex[:8]}"
+    created = set()
+    for index in range(3):
+        response = await client.post(
+            "/api/v1/jobs", json=test_job_payload(title=f"Role {index}", company=company), headers=api_key_header
+        )
+        created.add(response.json()["id"])
+
+    params = {"company": company, "view": "summary", "page_size": 2}
+    response = await client.get("/api/v1/jobs", params=params, headers=api_key_header)
+    assert response.status_code == 200
+    first = response.json()
+    assert len(first["items"]) == 2
+    assert all(item["contact_count"] == 0 for item in first["items"])
+    assert first["next_cursor"]
+
+    response = await client.get(
+        "/api/v1/jobs", params={**params, "cursor": first["next_cursor"]}, headers=api_key_header
+    )
+    assert response.status_code == 200
+    second = response.json()
+    assert len(second["items"]) == 1
+    assert {item["id"] for item in first["items"] + second["items"]} == created
+
+
+@pytest.mark.asyncio
+async def test_dashboard_stats_follow_job_writes(client, api_key_header, test_job_payload):
+    """Test the trigger-maintained counters track inserts, updates and deletes."""
+    board = f"stats-{uuid.uuid4().hex[:8]}"
+
+    async def stats() -> dict:
+        response = await client.get("/api/v1/stats", headers=api_key_header)
+        assert response.status_code == 200
+        return response.json()
+
+    before = await stats()
+    payload = test_job_payload(description_raw="x" * 600, is_easy_apply=True)
+    payload["job_board"] = board
+    response = await client.post("/api/v1/jobs", json=payload, headers=api_key_header)
+    job_id = response.json()["id"]
+
+    after = await stats()
+    assert after["total_jobs"] == before["total_jobs"] + 1
+    assert after["by_job_board"][board] == 1
+    assert after["easy_apply_jobs"] == before["easy_apply_jobs"] + 1
+    assert after["descriptions"]["partial"] == before["descriptions"]["partial"] + 1
+
+    await client.patch(f"/api/v1/jobs/{job_id}/status", json={"status": "applied"}, headers=api_key_header)
+    await client.patch(f"/api/v1/jobs/{job_id}", json={"description_raw": "x" * 2500}, headers=api_key_header)
+    after = await stats()
+    assert after["applied_jobs"] == before["applied_jobs"] + 1
+    assert after["descriptions"]["complete"] == before["descriptions"]["complete"] + 1
+    assert after["descriptions"]["partial"] == before["descriptions"]["partial"]
+
+    await client.delete(f"/api/v1/jobs/{job_id}", headers=api_key_header)
+    after = await stats()
+    assert after["total_jobs"] == before["total_jobs"]
+    assert board not in after["by_job_board"]
+
+
+@pytest.mark.asyncio
+async def test_description_length_tracks_writes(client, api_key_header, test_job_payload):
+    """Test the generated description_length drives the incomplete list."""
+    payload = test_job_payload(description_raw="Short description. " * 5)
+    response = await client.post("/api/v1/jobs", json=payload, headers=api_key_header)
+    job_id = response.json()["id"]
+
+    response = await client.get("/api/v1/jobs/descriptions/incomplete?limit=100", headers=api_key_header)
+    [item] = [job for job in response.json() if job["id"] == job_id]
+    assert item["description_length"] == len(payload["description_raw"])
+
+    response = await client.get(
+        "/api/v1/jobs", params={"search": job_id, "fields": "description_length"}, headers=api_key_header
+    )
+    assert response.json()["items"] == [{"id": job_id, "description_length": len(payload["description_raw"])}]
+
+    await client.patch(f"/api/v1/jobs/{job_id}", json={"description_raw": "x" * 800}, headers=api_key_header)
+    response = await client.get("/api/v1/jobs/descriptions/incomplete?limit=100", headers=api_key_header)
+    assert job_id not in [job["id"] for job in response.json()]
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_dedups_in_one_pass(monkeypatch, client, api_key_header):
+    existing_id, new_id = (str(uuid.uuid4().int)[:12] for _ in range(2))
+
+    async def fake_fetch_html(url: str) -> str:
+        job_id = url.rsplit("/", 1)[-1]
+        return (
+            '<html><head><script type="application/ld+json">'
+            f'{{"@type": "JobPosting", "title": "Role {job_id}", '
+            '"hiringOrganization": {"name": "Acme"}}'
+            "</script></head></html>"
+        )
+
+    monkeypatch.setattr(job_scraper, "fetch_html", fake_fetch_html)
+
+    # Seed a job that the batch will collide with
+    await client.post(
+        "/api/v1/jobs",
+        json={"title": "Seeded", "company": "Acme", "job_board": "linkedin", "job_board_id": existing_id},
+        headers=api_key_header,
+    )
+
+    payload = {
+        "jobs": [
+            {"url": f"https://www.linkedin.com/jobs/view/{existing_id}"},
+            {"url": f"https://www.linkedin.com/jobs/view/{new_id}"},
+            {"url": f"https://www.linkedin.com/jobs/view/{new_id}"},
+            {"url": "https://example.com/careers/1"},
+        ]
+    }
+    response = await client.post("/api/v1/jobs/bulk", json=payload, headers=api_key_header)
+    assert response.status_code == 201
+    data = response.json()
+    assert [job["title"] for job in data["created"]] == [f"Role {new_id}"]
+    errors = [item["error"] for item in data["failed"]]
+    assert errors == ["Job already exists", "Job already exists", "Unsupported job board URL"]
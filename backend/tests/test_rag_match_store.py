@@ -0,0 +1,77 @@
+"""Tests for the per-job RAG match store."""
+
+import pytest
+
+from src.models import Job
+from src.schemas.ai_analysis_coach import JDMatchResult, RAGEvidence
+from src.services.rag_match_store import RAGMatchStore
+from src.services.sparkles_client import SparklesClient, narrow_matches
+from tests.jd_samples import SAMPLE_DESCRIPTIONS
+
+
+def _match(requirement: str, *similarities: float) -> JDMatchResult:
+    top = [
+        RAGEvidence(
+            requirement=requirement,
+            match_strength="moderate",
+            evidence_snippet=f"{requirement} evidence {score}",
+            source_document="resume.md",
+            similarity_score=score,
+        )
+        for score in similarities
+    ]
+    return JDMatchResult(
+        requirement=requirement,
+        match_strength="moderate",
+        evidence=[t.evidence_snippet for t in top],
+        top_matches=top,
+        avg_similarity=sum(similarities) / len(similarities) if similarities else 0,
+    )
+
+
+def test_narrow_matches_applies_stricter_threshold_and_limit():
+    matches = [_match("Python", 0.8, 0.5, 0.42), _match("Go", 0.41), _match("AWS", 0.7)]
+    narrowed = narrow_matches(matches, ["Go", "Python", "Rust"], threshold=0.45, limit=2)
+
+    assert [m.requirement for m in narrowed] == ["Go", "Python"]
+    assert narrowed[0].top_matches == [] and narrowed[0].match_strength == "none"
+    assert [t.similarity_score for t in narrowed[1].top_matches] == [0.8, 0.5]
+    assert narrowed[1].evidence == ["Python evidence 0.8", "Python evidence 0.5"]
+    assert narrowed[1].avg_similarity == pytest.approx(0.65)
+    assert narrowed[1].match_strength == "moderate"
+
+
+@pytest.mark.asyncio
+async def test_matches_reused_until_description_or_corpus_changes(db_session, monkeypatch):
+    job = Job(title="Staff Engineer", company="Acme", description_raw=SAMPLE_DESCRIPTIONS[0])
+    db_session.add(job)
+    await db_session.flush()
+
+    client = SparklesClient()
+    client.supabase_url, client.supabase_key, client.openai_key = "https://sparkles.test", "key", "key"
+    version = "index:v1"
+    retrievals = []
+
+    async def fake_corpus_version():
+        return version
+
+    async def fake_match(requirements, threshold, limit_per_req):
+        retrievals.append(list(requirements))
+        return [_match(requirement, 0.6) for requirement in requirements]
+
+    monkeypatch.setattr(client, "corpus_version", fake_corpus_version)
+    monkeypatch.setattr(client, "match_jd_requirements", fake_match)
+    store = RAGMatchStore(client, ttl_seconds=3600)
+
+    first = await store.matches_for_job(db_session, job)
+    assert first and len(retrievals) == 1
+    assert await store.matches_for_job(db_session, job) == first
+    assert len(retrievals) == 1
+
+    version = "index:v2"
+    await store.matches_for_job(db_session, job)
+    assert len(retrievals) == 2
+
+    job.description_raw = SAMPLE_DESCRIPTIONS[0] + " Kubernetes required."
+    await store.matches_for_job(db_session, job)
+    assert len(retrievals) == 3
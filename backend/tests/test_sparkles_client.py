@@ -0,0 +1,180 @@
+"""Tests for the Sparkles RAG client's embeddings, local index and matching."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import numpy as np
+import pytest
+
+from src.config import settings
+from src.services.adaptive_limit import AIMDLimit
+from src.services.embedding_cache import EmbeddingCache
+from src.services.resume_index import ResumeChunk, ResumeVectorIndex
+from src.services.sparkles_client import SparklesClient
+
+
+def _vector(seed: int, dimensions: int = 8) -> list[float]:
+    return np.random.default_rng(seed).uniform(-0.1, 0.1, dimensions).tolist()
+
+
+def test_embedding_cache_persists_across_instances(tmp_path):
+    cache = EmbeddingCache(tmp_path, "text-embedding-3-small")
+    assert cache.get_many(["5+ years Python"]) == [None]
+
+    cache.put_many(["5+ years Python", "Kubernetes"], [_vector(1), _vector(2)])
+    reopened = EmbeddingCache(tmp_path, "text-embedding-3-small")
+    [python, kubernetes, missing] = reopened.get_many(["  5+ YEARS python ", "Kubernetes", "Go"])
+
+    assert np.allclose(python, _vector(1), atol=1e-3)
+    assert np.allclose(kubernetes, _vector(2), atol=1e-3)
+    assert missing is None
+    assert EmbeddingCache(tmp_path, "text-embedding-3-large").get_many(["Kubernetes"]) == [None]
+
+
+def test_embedding_cache_drops_partial_rows(tmp_path):
+    cache = EmbeddingCache(tmp_path, "model")
+    cache.put_many(["a", "b"], [_vector(1), _vector(2)])
+    with open(cache.directory / "vectors.bin", "ab") as handle:
+        handle.write(b"\x00" * 5)
+
+    reopened = EmbeddingCache(tmp_path, "model")
+    assert all(vector is not None for vector in reopened.get_many(["a", "b"]))
+    reopened.put_many(["c"], [_vector(3)])
+    assert np.allclose(EmbeddingCache(tmp_path, "model").get_many(["c"])[0], _vector(3), atol=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_batches_and_reuses_cache(tmp_path, monkeypatch):
+    requests = []
+
+    async def fake_request(texts):
+        requests.append(texts)
+        return [_vector(len(text)) for text in texts]
+
+    client = SparklesClient(embedding_cache=EmbeddingCache(tmp_path, "model"))
+    monkeypatch.setattr(client, "_request_embeddings", fake_request)
+
+    first = await client.embed_texts(["Python", "Kubernetes", "python ", "AWS"])
+    assert requests == [["python", "kubernetes", "aws"]]
+    assert first[0] == first[2]
+
+    second = await client.embed_texts(["AWS", "Terraform"])
+    assert requests[1:] == [["terraform"]]
+    assert np.allclose(second[0], first[3], atol=1e-3)
+
+
+def _chunk(index: int, category: str = "master-documents") -> ResumeChunk:
+    return ResumeChunk(id=str(index), content=f"chunk {index}", source="resume.md", category=category)
+
+
+def test_resume_index_top_k_by_cosine(tmp_path):
+    index = ResumeVectorIndex(tmp_path)
+    assert not index.is_ready()
+    vectors = [[1, 0, 0], [0.9, 0.1, 0], [0, 1, 0], [0.8, 0, 0.2]]
+    chunks = [_chunk(0), _chunk(1), _chunk(2), _chunk(3, "interview-prep")]
+    meta = index.replace(chunks, vectors, "model")
+
+    reader = ResumeVectorIndex(tmp_path)
+    assert reader.is_ready() and reader.version == meta["version"]
+    results = reader.search([2, 0, 0], None, threshold=0.5, limit=2)
+    assert [r.id for r in results] == ["0", "1"]
+    assert results[0].similarity == pytest.approx(1.0)
+    assert [r.id for r in reader.search([1, 0, 0], ["interview-prep"], 0.5, 5)] == ["3"]
+    assert reader.search([0, 0, 1], None, 0.5, 5) == []
+
+    # A new corpus written by another process is picked up on the next query
+    index.replace(chunks[:2], vectors[:2], "model")
+    assert reader.is_ready() and len(reader) == 2
+
+
+@pytest.mark.asyncio
+async def test_local_search_syncs_once_from_supabase(tmp_path, monkeypatch):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/resume_chunks"):
+            rows = [
+                {"id": 1, "content": "Led platform team", "metadata": {"category": "master-documents"},
+                 "embedding": json.dumps([1.0, 0.0])},
+                {"id": 2, "content": "Built ML pipeline", "metadata": {"category": "master-documents"},
+                 "embedding": json.dumps([0.0, 1.0])},
+            ]
+            return httpx.Response(200, json=rows)
+        return httpx.Response(500)
+
+    async def fake_request(texts):
+        return [[1.0, 0.1] for _ in texts]
+
+    client = SparklesClient(resume_index=ResumeVectorIndex(tmp_path))
+    client.supabase_url, client.supabase_key, client.openai_key = "https://sparkles.test", "key", "key"
+    client.embedding_model = "model"
+    client._http_client = httpx.AsyncClient(
+        base_url="https://sparkles.test/rest/v1", transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(client, "_request_embeddings", fake_request)
+
+    matches = await client.match_jd_requirements(["Leadership", "Team building"], threshold=0.4)
+    assert [m.top_matches[0].evidence_snippet for m in matches] == ["Led platform team"] * 2
+    assert calls == ["/rest/v1/resume_chunks"]
+    await client.close()
+
+
+def test_aimd_limit_grows_and_halves_once_per_overload():
+    limit = AIMDLimit(initial=4, max_limit=8)
+    for _ in range(8):
+        limit.record(time.monotonic(), 0.02, succeeded=True)
+    assert 5 < limit.limit <= 6.5
+
+    started_at = time.monotonic()
+    grown = limit.limit
+    for _ in range(3):
+        limit.record(started_at, 0.02, succeeded=False)
+    assert limit.limit == pytest.approx(grown / 2)
+
+    limit.record(time.monotonic(), 0.5, succeeded=True)  # well over the 20 ms baseline
+    assert limit.limit == pytest.approx(grown / 4)
+
+
+@pytest.mark.asyncio
+async def test_aimd_limit_bounds_in_flight():
+    limit = AIMDLimit(initial=2, max_limit=2)
+    peak = 0
+
+    async def work():
+        nonlocal peak
+        async with limit.slot():
+            peak = max(peak, limit.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak == 2
+    assert limit.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_as_completed_within_deadline(monkeypatch):
+    delays = {"fast": 0.01, "medium": 0.05, "stuck": 10}
+
+    async def fake_embed(texts):
+        return [[1.0] for _ in texts]
+
+    async def fake_search(query, categories, threshold, limit, embedding):
+        await asyncio.sleep(delays[query])
+        return []
+
+    client = SparklesClient()
+    client.supabase_url, client.supabase_key, client.openai_key = "https://sparkles.test", "key", "key"
+    monkeypatch.setattr(client, "embed_texts", fake_embed)
+    monkeypatch.setattr(client, "_search", fake_search)
+    monkeypatch.setattr(settings, "rag_timeout_seconds", 0.3)
+
+    started = time.monotonic()
+    streamed = [r.requirement async for r in client.stream_jd_requirements(["stuck", "medium", "fast"])]
+    assert streamed == ["fast", "medium"]
+    assert time.monotonic() - started < 1
+
+    matched = await client.match_jd_requirements(["medium", "fast"])
+    assert [r.requirement for r in matched] == ["medium", "fast"]
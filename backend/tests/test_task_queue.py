@@ -0,0 +1,171 @@
+"""Tests for the background task queue."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.api import task_handlers  # noqa: F401 - registers task handlers
+from src.models import RoleType
+from src.services import TaskPermanentError, TaskQueue, TaskWorker, task_queue
+
+
+def _mock_analysis():
+    analysis = MagicMock()
+    analysis.is_ai_forward = True
+    analysis.ai_confidence = 0.9
+    analysis.suggested_priority = 77
+    analysis.suggested_role = RoleType.ARCHITECT
+    analysis.technologies_matched = ["Python"]
+    analysis.technologies_missing = []
+    analysis.years_experience_required = None
+    analysis.seniority_level = None
+    analysis.analysis_notes = []
+    analysis.role_scores = None
+    analysis.is_location_compatible = True
+    analysis.location_notes = None
+    return analysis
+
+
+@pytest.mark.asyncio
+async def test_background_analyze_returns_task_and_worker_completes_it(
+    monkeypatch, client, api_key_header, test_job_payload, session_factory
+):
+    """Test ?background=true queues the analysis and a worker produces the result."""
+    async def mock_analyze(*_args, **_kwargs):
+        return _mock_analysis(), None
+
+    monkeypatch.setattr("src.api.routes.jobs.analyze_job_with_ai", mock_analyze)
+
+    job = (await client.post(
+        "/api/v1/jobs",
+        json=test_job_payload(description_raw="Python platform work " * 40),
+        headers=api_key_header,
+    )).json()
+
+    response = await client.post(
+        f"/api/v1/jobs/{job['id']}/analyze?apply_suggestions=true&background=true",
+        headers=api_key_header,
+    )
+    assert response.status_code == 202
+    task = response.json()
+    assert task["status"] == "queued"
+    assert task["kind"] == "analyze_job"
+    assert response.headers["location"] == f"/api/v1/tasks/{task['id']}"
+
+    pending = await client.get(f"/api/v1/tasks/{task['id']}/result", headers=api_key_header)
+    assert pending.status_code == 409
+
+    worker = TaskWorker(task_queue, session_factory)
+    assert await worker.run_once() is True
+
+    status_response = await client.get(f"/api/v1/tasks/{task['id']}", headers=api_key_header)
+    assert status_response.json()["status"] == "succeeded"
+    assert status_response.json()["attempts"] == 1
+
+    result = (await client.get(f"/api/v1/tasks/{task['id']}/result", headers=api_key_header)).json()
+    assert result["result"]["suggested_priority"] == 77
+
+    updated_job = (await client.get(f"/api/v1/jobs/{job['id']}", headers=api_key_header)).json()
+    assert updated_job["priority"] == 77
+
+
+@pytest.mark.asyncio
+async def test_background_task_for_missing_job_is_rejected_up_front(client, api_key_header):
+    """Test validation still happens in the request before anything is queued."""
+    response = await client.post(
+        "/api/v1/jobs/00000000-0000-0000-0000-000000000000/analyze?background=true",
+        headers=api_key_header,
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_failed_attempts_are_retried_until_max_attempts(db_session, session_factory):
+    """Test failures requeue with backoff and give up after max_attempts."""
+    queue = TaskQueue(visibility_timeout_seconds=60, max_attempts=2, retry_backoff_seconds=0)
+    calls = []
+
+    @queue.register("flaky")
+    async def flaky(ctx):
+        calls.append(ctx.attempt)
+        raise RuntimeError("upstream unavailable")
+
+    task = await queue.enqueue(db_session, "flaky", {})
+    worker = TaskWorker(queue, session_factory)
+
+    assert await worker.run_once() is True
+    await db_session.refresh(task)
+    assert task.status == "queued"
+    assert task.error == "upstream unavailable"
+    assert task.run_after is not None
+
+    assert await worker.run_once() is True
+    await db_session.refresh(task)
+    assert task.status == "failed"
+    assert task.attempts == 2
+    assert calls == [1, 2]
+
+    assert await worker.run_once() is False
+
+
+@pytest.mark.asyncio
+async def test_permanent_errors_are_not_retried(db_session, session_factory):
+    """Test TaskPermanentError fails the task on the first attempt."""
+    queue = TaskQueue(visibility_timeout_seconds=60, max_attempts=5, retry_backoff_seconds=0)
+
+    @queue.register("doomed")
+    async def doomed(ctx):
+        raise TaskPermanentError("Job not found")
+
+    task = await queue.enqueue(db_session, "doomed", {})
+    await TaskWorker(queue, session_factory).run_once()
+
+    await db_session.refresh(task)
+    assert task.status == "failed"
+    assert task.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_makes_task_claimable_again(db_session, session_factory):
+    """Test a task whose worker died is reclaimed after the visibility timeout."""
+    queue = TaskQueue(visibility_timeout_seconds=0, max_attempts=3, retry_backoff_seconds=0)
+
+    @queue.register("noop")
+    async def noop(ctx):
+        return {"attempt": ctx.attempt}
+
+    task = await queue.enqueue(db_session, "noop", {})
+
+    # First worker claims and then "dies" without settling the task
+    async with session_factory() as session:
+        claimed = await queue.claim(session, "dead-worker")
+        await session.commit()
+    assert claimed.id == task.id
+
+    await TaskWorker(queue, session_factory, worker_id="live-worker").run_once()
+
+    await db_session.refresh(task)
+    assert task.status == "succeeded"
+    assert task.result == {"attempt": 2}
+
+
+@pytest.mark.asyncio
+async def test_claim_does_not_steal_live_lease(db_session, session_factory):
+    """Test a task with an unexpired lease is not claimed by another worker."""
+    queue = TaskQueue(visibility_timeout_seconds=60, max_attempts=3, retry_backoff_seconds=0)
+    task = await queue.enqueue(db_session, "noop", {})
+
+    async with session_factory() as session:
+        claimed = await queue.claim(session, "worker-a")
+        assert claimed.id == task.id
+        assert await queue.claim(session, "worker-b") is None
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_filters_by_status(client, api_key_header, db_session):
+    """Test listing tasks with a status filter."""
+    task = await task_queue.enqueue(db_session, "batch_analyze", {"limit": 1})
+
+    response = await client.get("/api/v1/tasks?status=queued&kind=batch_analyze", headers=api_key_header)
+    assert response.status_code == 200
+    assert str(task.id) in [t["id"] for t in response.json()]